@@ -0,0 +1,3 @@
+@echo off
+python "%~dp0snake_server.py" serve
+pause
@@ -0,0 +1,4 @@
+@echo off
+python "%~dp0tournament.py" snake
+python "%~dp0tournament.py" frites
+pause
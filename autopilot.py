@@ -0,0 +1,305 @@
+import heapq
+from array import array
+
+from snake_engine import SnakeEngine, DIRECTIONS, UP, DOWN, LEFT, RIGHT
+
+
+def reverse(direction):
+    """Demi-tour, ignoré par le moteur : un serpent d'une case ne peut pas le prendre"""
+    return -direction[0], -direction[1]
+
+
+class Autopilot:
+    """Pilote automatique : choose(engine) renvoie la direction du prochain tick
+
+    Les grilles de recherche sont allouées une fois ; une marque par recherche
+    évite de les remettre à zéro à chaque tick.
+    """
+
+    name = ""
+
+    @staticmethod
+    def fits(width, height):
+        """Le pilote sait-il jouer sur un plateau de cette taille ?"""
+        return True
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.size = size = width * height
+        self.seen = array("i", [0]) * size  # Numéro de la dernière recherche passée par la case
+        self.mark = 0
+        self.parent = array("i", [0]) * size
+        self.cost = array("i", [0]) * size
+        self.queue = array("i", [0]) * size
+        self.path = array("i", [0]) * size  # Chemin trouvé, du but vers le départ
+        self.xs = array("i", [cell % width for cell in range(size)])
+        self.ys = array("i", [cell // width for cell in range(size)])
+        # Voisins de chaque case : ((case, direction), ...)
+        self.neighbors = []
+        for cell in range(size):
+            y, x = divmod(cell, width)
+            self.neighbors.append(tuple(
+                ((y + dy) * width + x + dx, (dx, dy)) for dx, dy in DIRECTIONS
+                if 0 <= x + dx < width and 0 <= y + dy < height
+            ))
+        self.directions = {1: RIGHT, -1: LEFT, width: DOWN, -width: UP}
+        self.planned = 0  # Pas restants du chemin validé dans self.path
+        self.planned_tick = -1
+
+    def choose(self, engine):
+        """Chemin vers la nourriture s'il laisse la queue atteignable, sinon suivre la queue"""
+        snake = engine.snake
+        head = snake.head_cell()
+        path = self.path
+
+        # Chemin déjà validé au tick précédent : le serpent suit exactement le trajet vérifié
+        if self.planned > 1 and engine.ticks == self.planned_tick + 1 and path[self.planned - 1] == head:
+            self.planned -= 1
+            self.planned_tick = engine.ticks
+            return self.directions[path[self.planned - 1] - head]
+
+        self.planned = 0
+        if engine.food_pos is not None:
+            x, y = engine.food_pos
+            length = self.find_path(snake.occupied, head, y * self.width + x)
+            if length and self.is_safe(engine, length):
+                direction = self.directions[path[length - 1] - head]
+                if direction != reverse(engine.direction):
+                    self.planned, self.planned_tick = length, engine.ticks
+                    return direction
+        return self.follow_tail(engine)
+
+    def find_path(self, occupied, start, goal):
+        """Remplit self.path vers goal, renvoie sa longueur (0 = inaccessible)
+
+        Plus court chemin en largeur ; les sous-classes peuvent chercher autrement.
+        """
+        if not self.bfs(occupied, start, goal):
+            return 0
+        return self.build_path(start, goal)
+
+    def bfs(self, occupied, start, goal):
+        """Parcours en largeur ; goal peut être occupée (queue). Renvoie True si atteinte"""
+        self.mark += 1
+        mark, seen, parent, queue, neighbors = self.mark, self.seen, self.parent, self.queue, self.neighbors
+        seen[start] = mark
+        queue[0] = start
+        first, last = 0, 1
+        while first < last:
+            cell = queue[first]
+            first += 1
+            for n, _ in neighbors[cell]:
+                if seen[n] != mark and (n == goal or not occupied[n]):
+                    seen[n] = mark
+                    parent[n] = cell
+                    if n == goal:
+                        return True
+                    queue[last] = n
+                    last += 1
+        return False
+
+    def build_path(self, start, goal):
+        """Remonte les parents de goal à start dans self.path, renvoie la longueur"""
+        path, parent = self.path, self.parent
+        length = 0
+        cell = goal
+        while cell != start:
+            path[length] = cell
+            length += 1
+            cell = parent[cell]
+        return length
+
+    def tail_reachable(self, engine):
+        """La tête peut-elle rejoindre la queue en gardant une case d'écart ?"""
+        snake = engine.snake
+        if engine.game_over:
+            return engine.won
+        if len(snake) < 3:
+            return True
+        head, tail = snake.head_cell(), snake.tail_cell()
+        # Entrer dans la case de la queue tue : il faut au moins deux pas
+        return self.bfs(snake.occupied, head, tail) and self.parent[tail] != head
+
+    def is_safe(self, engine, length):
+        """Joue le chemin trouvé sur le journal du moteur, vérifie la queue, annule"""
+        path, directions = self.path, self.directions
+        previous = engine.snake.head_cell()
+        for i in range(length - 1, -1, -1):
+            engine.push(directions[path[i] - previous])
+            previous = path[i]
+        safe = self.tail_reachable(engine)
+        for _ in range(length):
+            engine.undo()
+        return safe
+
+    def follow_tail(self, engine):
+        """Coup sans danger le plus loin de la nourriture, à défaut le premier coup non mortel"""
+        snake = engine.snake
+        head = snake.head_cell()
+        food = engine.food_pos or (self.xs[head], self.ys[head])
+        best, best_distance, fallback = None, -1, None
+        backwards = reverse(engine.direction)
+        for n, direction in self.neighbors[head]:
+            if snake.occupied[n] or direction == backwards:
+                continue
+            fallback = fallback or direction
+            distance = abs(self.xs[n] - food[0]) + abs(self.ys[n] - food[1])
+            if distance <= best_distance:
+                continue
+            engine.push(direction)
+            if self.tail_reachable(engine):
+                best, best_distance = direction, distance
+            engine.undo()
+        return best or fallback
+
+
+class BfsPilot(Autopilot):
+    """Plus court chemin en largeur vers la nourriture, avec contrôle de la queue"""
+
+    name = "BFS"
+
+
+class AStarPilot(Autopilot):
+    """A* (distance de Manhattan) vers la nourriture, avec contrôle de la queue"""
+
+    name = "A*"
+
+    def __init__(self, width, height):
+        super().__init__(width, height)
+        self.heap = []  # Entrées f * taille + case, liste réutilisée
+
+    def find_path(self, occupied, start, goal):
+        self.mark += 1
+        mark, seen, cost, parent = self.mark, self.seen, self.cost, self.parent
+        xs, ys, neighbors, size = self.xs, self.ys, self.neighbors, self.size
+        goal_x, goal_y = xs[goal], ys[goal]
+        heap = self.heap
+        heap.clear()
+        seen[start] = mark
+        cost[start] = 0
+        heapq.heappush(heap, (abs(xs[start] - goal_x) + abs(ys[start] - goal_y)) * size + start)
+        while heap:
+            f, cell = divmod(heapq.heappop(heap), size)
+            g = cost[cell]
+            if cell == goal:
+                return self.build_path(start, goal)
+            if f > g + abs(xs[cell] - goal_x) + abs(ys[cell] - goal_y):
+                continue  # Entrée dépassée par un meilleur chemin
+            for n, _ in neighbors[cell]:
+                if occupied[n]:
+                    continue
+                if seen[n] != mark or g + 1 < cost[n]:
+                    seen[n] = mark
+                    cost[n] = g + 1
+                    parent[n] = cell
+                    heapq.heappush(heap, (g + 1 + abs(xs[n] - goal_x) + abs(ys[n] - goal_y)) * size + n)
+        return 0
+
+
+class HamiltonianPilot(Autopilot):
+    """Suit un cycle hamiltonien (victoire garantie) et prend des raccourcis
+
+    Un raccourci ne doit pas dépasser la queue le long du cycle ; ils sont
+    coupés quand le serpent occupe la moitié du plateau.
+    """
+
+    name = "Hamilton"
+
+    @staticmethod
+    def fits(width, height):
+        # Le cycle alterne les couleurs du damier : il faut un nombre pair de cases
+        return width > 1 and height > 1 and not (width % 2 and height % 2)
+
+    def __init__(self, width, height):
+        if not self.fits(width, height):
+            raise ValueError(f"pas de cycle hamiltonien sur une grille {width}x{height}")
+        super().__init__(width, height)
+        if height % 2 == 0:
+            # Lignes en zigzag sur les colonnes 1.., retour par la colonne 0
+            cycle = [(x, y) for y in range(height)
+                     for x in (range(1, width) if y % 2 == 0 else range(width - 1, 0, -1))]
+            cycle += [(0, y) for y in range(height - 1, -1, -1)]
+        else:
+            # Même chose transposée : colonnes en zigzag, retour par la ligne 0
+            cycle = [(x, y) for x in range(width)
+                     for y in (range(1, height) if x % 2 == 0 else range(height - 1, 0, -1))]
+            cycle += [(x, 0) for x in range(width - 1, -1, -1)]
+        self.order = array("i", [0]) * self.size  # Rang de chaque case sur le cycle
+        self.following = [None] * self.size  # Direction vers la case suivante du cycle
+        for i, (x, y) in enumerate(cycle):
+            next_x, next_y = cycle[(i + 1) % len(cycle)]
+            self.order[y * width + x] = i
+            self.following[y * width + x] = (next_x - x, next_y - y)
+
+    def choose(self, engine):
+        snake, size, order = engine.snake, self.size, self.order
+        head = snake.head_cell()
+        rank = order[head]
+        length = len(snake)
+        tail_distance = (order[snake.tail_cell()] - rank) % size if length > 1 else size
+        food_distance = size
+        if engine.food_pos is not None:
+            x, y = engine.food_pos
+            food_distance = (order[y * self.width + x] - rank) % size
+
+        # Avance permise le long du cycle sans rattraper la queue
+        empty = size - length - 1
+        available = tail_distance - length - 3
+        if empty < size // 2:
+            available = 0
+        elif food_distance < tail_distance:
+            available -= 1
+            if (tail_distance - food_distance) * 4 > empty:
+                available -= 10
+        available = min(available, food_distance)
+
+        best, best_distance, fallback = None, 0, None
+        backwards = reverse(engine.direction)
+        for n, direction in self.neighbors[head]:
+            if not snake.occupied[n] and direction != backwards:
+                fallback = fallback or direction
+                distance = (order[n] - rank) % size
+                if best_distance < distance <= available:
+                    best, best_distance = direction, distance
+        if best is None and self.following[head] != backwards:
+            best = self.following[head]
+        return best or fallback
+
+
+PILOTS = (BfsPilot, AStarPilot, HamiltonianPilot)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    # Parties seedées par pilote : python autopilot.py [parties] [côté du plateau]
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    side = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    for pilot_class in PILOTS:
+        if not pilot_class.fits(side, side):
+            print(f"{pilot_class.name:<8} {side}x{side} : plateau non pris en charge")
+            continue
+        pilot = pilot_class(side, side)
+        engine = SnakeEngine(side, side)
+        total_score = total_fill = wins = ticks = 0
+        decision_ns = worst_ns = 0
+        for seed in range(games):
+            engine.reset(seed)
+            hungry = 0  # Ticks depuis la dernière nourriture (boucle sans fin = défaite)
+            while not engine.game_over and hungry < 2 * pilot.size:
+                start = time.perf_counter_ns()
+                direction = pilot.choose(engine)
+                elapsed = time.perf_counter_ns() - start
+                decision_ns += elapsed
+                worst_ns = max(worst_ns, elapsed)
+                _, reward, _ = engine.step(direction)
+                hungry = 0 if reward else hungry + 1
+                ticks += 1
+            total_score += engine.score
+            total_fill += len(engine.snake) / pilot.size
+            wins += engine.won
+        print(f"{pilot.name:<8} {side}x{side} : score moyen {total_score / games:7.1f}, "
+              f"remplissage {total_fill / games:6.1%}, victoires {wins / games:6.1%}, "
+              f"décision {decision_ns / ticks / 1000:6.1f} µs/tick (max {worst_ns / 1e6:.1f} ms)")
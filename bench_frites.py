@@ -0,0 +1,41 @@
+import random
+import sys
+import time
+
+from frites_sim import WINDOW_WIDTH, WINDOW_HEIGHT, FritePool, PaquetFrites
+
+FRAMES = 300
+
+
+def bench_pool(count):
+    """Population constante de frites : temps par frame et allocations par frame"""
+    random.seed(0)
+    pool = FritePool()
+    for _ in range(count):
+        pool.spawn(random.randint(50, WINDOW_WIDTH - 50), random.uniform(-50, WINDOW_HEIGHT))
+    catch_rect = PaquetFrites(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 80).get_catch_rect()
+
+    # Une frame de chauffe pour remplir le pool de recyclage
+    for _ in pool.update(catch_rect):
+        pool.spawn(random.randint(50, WINDOW_WIDTH - 50), -50)
+
+    allocated = pool.allocated
+    blocks = sys.getallocatedblocks()
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        for _ in pool.update(catch_rect):
+            pool.spawn(random.randint(50, WINDOW_WIDTH - 50), -50)
+    elapsed = time.perf_counter() - start
+    return (
+        elapsed / FRAMES,
+        (pool.allocated - allocated) / FRAMES,
+        (sys.getallocatedblocks() - blocks) / FRAMES,
+    )
+
+
+if __name__ == "__main__":
+    print(f"{'frites':>8} {'µs/frame':>10} {'ns/frite':>9} {'Frite/frame':>12} {'blocs/frame':>12}")
+    for count in (100, 1_000, 10_000, 50_000):
+        per_frame, frites, blocks = bench_pool(count)
+        print(f"{count:>8,} {per_frame * 1e6:>10.1f} {per_frame / count * 1e9:>9.0f} "
+              f"{frites:>12.2f} {blocks:>12.2f}")
@@ -0,0 +1,56 @@
+class Camera:
+    """Fenêtre de cols x rows cases sur un monde plus grand, qui suit une cible
+
+    La cible peut bouger librement dans une zone centrale ; la caméra ne se
+    déplace que lorsqu'elle s'approche à moins de margin cases d'un bord, et
+    ne sort jamais du monde.
+    """
+
+    def __init__(self, cols, rows, world_width, world_height, margin=None):
+        self.world_width = world_width
+        self.world_height = world_height
+        self.cols = min(cols, world_width)
+        self.rows = min(rows, world_height)
+        self.margin = min(self.cols, self.rows) // 4 if margin is None else margin
+        self.left = 0
+        self.top = 0
+
+    def center(self, x, y):
+        """Place la cible au centre (début de partie)"""
+        self.left = self.clamp(x - self.cols // 2, self.world_width - self.cols)
+        self.top = self.clamp(y - self.rows // 2, self.world_height - self.rows)
+
+    def follow(self, x, y):
+        """Garde la cible à margin cases des bords, renvoie le déplacement (dx, dy) en cases"""
+        margin = self.margin
+        left = min(max(self.left, x - self.cols + 1 + margin), x - margin)
+        top = min(max(self.top, y - self.rows + 1 + margin), y - margin)
+        left = self.clamp(left, self.world_width - self.cols)
+        top = self.clamp(top, self.world_height - self.rows)
+        dx, dy = left - self.left, top - self.top
+        self.left, self.top = left, top
+        return dx, dy
+
+    @staticmethod
+    def clamp(value, high):
+        return 0 if value < 0 else high if value > high else value
+
+    def visible(self, x, y):
+        return self.left <= x < self.left + self.cols and self.top <= y < self.top + self.rows
+
+    def cells(self, occupied, x0, x1, y0, y1):
+        """Cases occupées du rectangle [x0, x1[ x [y0, y1[ du monde, lues ligne par ligne
+
+        La carte d'occupation sert d'index spatial : le coût dépend de la surface
+        du rectangle, pas de la longueur du serpent.
+        """
+        width = self.world_width
+        found = []
+        for y in range(y0, y1):
+            row = y * width
+            start, end = row + x0, row + x1
+            cell = occupied.find(1, start, end)
+            while cell >= 0:
+                found.append(cell)
+                cell = occupied.find(1, cell + 1, end)
+        return found
@@ -0,0 +1,249 @@
+import struct
+import zlib
+from collections import namedtuple
+
+import numpy as np
+
+import frites_sprites
+import snake_style
+from frites_sim import WINDOW_WIDTH, WINDOW_HEIGHT
+from frites_sprites import render_pixels, rect, oval
+
+# Couleurs nommées utilisées par les jeux (valeurs de Tk)
+NAMED_COLORS = {"white": (255, 255, 255), "black": (0, 0, 0), "gray": (190, 190, 190)}
+
+# Image prête à copier : couleurs, masque d'opacité et décalage par rapport à l'entité
+Sprite = namedtuple("Sprite", "rgb mask dx dy")
+
+
+def hex_rgb(color):
+    """Couleur Tk (#rgb, #rrggbb ou nom connu) vers un tableau RGB"""
+    if color in NAMED_COLORS:
+        return np.array(NAMED_COLORS[color], dtype=np.uint8)
+    digits = color[1:]
+    if len(digits) == 3:
+        digits = "".join(c * 2 for c in digits)
+    return np.array([int(digits[i:i + 2], 16) for i in (0, 2, 4)], dtype=np.uint8)
+
+
+def make_sprite(shapes):
+    """Rastérise des formes (voir frites_sprites) en tableaux NumPy"""
+    pixels, dx, dy = render_pixels(shapes)
+    height, width = len(pixels), len(pixels[0])
+    rgb = np.zeros((height, width, 3), dtype=np.uint8)
+    mask = np.zeros((height, width, 1), dtype=bool)
+    colors = {}
+    for row, line in enumerate(pixels):
+        for col, color in enumerate(line):
+            if color is not None:
+                if color not in colors:
+                    colors[color] = hex_rgb(color)
+                rgb[row, col] = colors[color]
+                mask[row, col] = True
+    return Sprite(rgb, mask, dx, dy)
+
+
+class Framebuffer:
+    """Image RGB réutilisée d'une frame à l'autre : dessiner n'alloue aucun tampon"""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.pixels = np.zeros((height, width, 3), dtype=np.uint8)
+
+    def fill_rect(self, x1, y1, x2, y2, rgb):
+        x1, y1 = max(0, int(x1)), max(0, int(y1))
+        x2, y2 = min(self.width, int(x2)), min(self.height, int(y2))
+        if x1 < x2 and y1 < y2:
+            self.pixels[y1:y2, x1:x2] = rgb
+
+    def blit(self, sprite, x, y):
+        """Copie les pixels opaques du sprite placé en (x + dx, y + dy), avec découpage"""
+        left, top = int(round(x)) + sprite.dx, int(round(y)) + sprite.dy
+        height, width = sprite.mask.shape[:2]
+        x1, y1 = max(0, left), max(0, top)
+        x2, y2 = min(self.width, left + width), min(self.height, top + height)
+        if x1 >= x2 or y1 >= y2:
+            return
+        np.copyto(
+            self.pixels[y1:y2, x1:x2],
+            sprite.rgb[y1 - top:y2 - top, x1 - left:x2 - left],
+            where=sprite.mask[y1 - top:y2 - top, x1 - left:x2 - left]
+        )
+
+
+class SnakeFrameRenderer:
+    """Scène du Snake (damier, serpent avec yeux, nourriture) sans serveur d'affichage"""
+
+    def __init__(self, cols=snake_style.GRID_WIDTH, rows=snake_style.GRID_HEIGHT,
+                 cell=snake_style.GRID_SIZE):
+        self.cell = cell
+        self.framebuffer = Framebuffer(cols * cell, rows * cell)
+
+        # Damier calculé une fois, recopié au début de chaque frame
+        ys, xs = np.indices((rows * cell, cols * cell))
+        even = ((ys // cell + xs // cell) % 2 == 0)[..., None]
+        self.background = np.where(even, hex_rgb(snake_style.BG_COLOR_ALT), hex_rgb(snake_style.BG_COLOR))
+        self.background = self.background.astype(np.uint8)
+
+        self.body_color = hex_rgb(snake_style.SNAKE_BODY)
+        self.food = make_sprite([
+            (oval(3, 3, cell - 3, cell - 3), snake_style.FOOD_COLOR, None, 0, False),
+            # Reflet
+            (oval(6, 6, 10, 10), snake_style.FOOD_SHINE, None, 0, False),
+        ])
+        # Tête avec les yeux, une variante par direction
+        self.heads = {}
+        for direction, eyes in snake_style.EYE_OFFSETS.items():
+            shapes = [(rect(2, 2, cell - 2, cell - 2), snake_style.SNAKE_HEAD, None, 0, False)]
+            for ex, ey in eyes:
+                size = snake_style.EYE_SIZE
+                shapes.append((oval(ex - size, ey - size, ex + size, ey + size),
+                               snake_style.EYE_COLOR, "black", 1, False))
+            self.heads[direction] = make_sprite(shapes)
+
+    def render(self, engine):
+        """Dessine l'état du moteur et renvoie le tableau (hauteur, largeur, 3) réutilisé"""
+        framebuffer, cell = self.framebuffer, self.cell
+        np.copyto(framebuffer.pixels, self.background)
+
+        if engine.food_pos:
+            x, y = engine.food_pos
+            framebuffer.blit(self.food, x * cell, y * cell)
+
+        body = self.body_color
+        for i, (x, y) in enumerate(engine.snake):
+            if i == 0:
+                framebuffer.blit(self.heads[engine.direction], x * cell, y * cell)
+            else:
+                framebuffer.fill_rect(x * cell + 2, y * cell + 2,
+                                      (x + 1) * cell - 2, (y + 1) * cell - 2, body)
+        return framebuffer.pixels
+
+
+class FritesFrameRenderer:
+    """Scène des frites (ciel, nuages, sol, paquet, frites) sans serveur d'affichage"""
+
+    def __init__(self, width=WINDOW_WIDTH, height=WINDOW_HEIGHT):
+        self.framebuffer = Framebuffer(width, height)
+
+        # Fond rendu une fois
+        self.framebuffer.fill_rect(0, 0, width, height, hex_rgb(frites_sprites.BG_COLOR))
+        for x, y in frites_sprites.CLOUDS:
+            self.framebuffer.blit(make_sprite([
+                (oval(x, y, x + 40, y + 30), "white", None, 0, False),
+                (oval(x + 20, y - 10, x + 60, y + 25), "white", None, 0, False),
+                (oval(x + 40, y, x + 80, y + 30), "white", None, 0, False),
+            ]), 0, 0)
+        self.framebuffer.fill_rect(0, height - 50, width, height, hex_rgb(frites_sprites.GROUND_COLOR))
+        self.background = self.framebuffer.pixels.copy()
+
+        self.paquets = {}
+        self.frites = {}
+
+    def paquet_sprite(self, paquet):
+        key = (paquet.width, paquet.height)
+        if key not in self.paquets:
+            self.paquets[key] = make_sprite(frites_sprites.paquet_shapes(*key))
+        return self.paquets[key]
+
+    def frite_sprite(self, frite):
+        step = frites_sprites.ROTATION_STEP
+        key = (frite.width, frite.height, round(frite.rotation / step) * step)
+        if key not in self.frites:
+            self.frites[key] = make_sprite(frites_sprites.frite_shapes(*key))
+        return self.frites[key]
+
+    def render(self, sim):
+        """Dessine l'état de la simulation et renvoie le tableau réutilisé"""
+        framebuffer = self.framebuffer
+        np.copyto(framebuffer.pixels, self.background)
+        framebuffer.blit(self.paquet_sprite(sim.paquet), sim.paquet.x, sim.paquet.y)
+        for frite in sim.frites:
+            framebuffer.blit(self.frite_sprite(frite), frite.x, frite.y)
+        return framebuffer.pixels
+
+
+def png_bytes(pixels, level=1):
+    """Encode un tableau RGB (hauteur, largeur, 3) en PNG (compression rapide par défaut)"""
+    height, width = pixels.shape[:2]
+    raw = np.zeros((height, width * 3 + 1), dtype=np.uint8)  # Filtre 0 en tête de ligne
+    raw[:, 1:] = pixels.reshape(height, width * 3)
+
+    def chunk(kind, data):
+        return (struct.pack(">I", len(data)) + kind + data +
+                struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+    return (b"\x89PNG\r\n\x1a\n" +
+            chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)) +
+            chunk(b"IDAT", zlib.compress(raw, level)) +
+            chunk(b"IEND", b""))
+
+
+def write_png(path, pixels, level=1):
+    with open(path, "wb") as f:
+        f.write(png_bytes(pixels, level))
+
+
+class RawVideoWriter:
+    """Flux RGB24 brut, lisible par ffmpeg -f rawvideo -pix_fmt rgb24 -s LxH"""
+
+    def __init__(self, path):
+        self.file = open(path, "wb")
+        self.frames = 0
+
+    def write(self, pixels):
+        self.file.write(memoryview(pixels).cast("B"))  # Aucune copie
+        self.frames += 1
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    from frites_sim import FritesSim
+    from snake_engine import SnakeEngine, UP, DOWN, LEFT, RIGHT
+
+    # Rendu hors écran de parties pilotées au hasard, vidéo brute + dernière image en PNG
+    out = sys.argv[1] if len(sys.argv) > 1 else "."
+    frames = 600
+
+    engine = SnakeEngine(seed=0)
+    renderer = SnakeFrameRenderer()
+    moves = (UP, RIGHT, DOWN, LEFT)
+    dice = random.Random(0)  # Hasard du pilote à part : celui du moteur ne sert qu'à la nourriture
+    start = time.perf_counter()
+    with RawVideoWriter(f"{out}/snake.rgb") as video:
+        for i in range(frames):
+            _, _, done = engine.step(moves[dice.randrange(4)] if i % 5 == 0 else None)
+            if done:
+                engine.reset(i)
+            video.write(renderer.render(engine))
+    elapsed = time.perf_counter() - start
+    write_png(f"{out}/snake.png", renderer.framebuffer.pixels)
+    print(f"snake  : {frames / elapsed:,.0f} images/s ({renderer.framebuffer.width}x"
+          f"{renderer.framebuffer.height})")
+
+    sim = FritesSim(0)
+    renderer = FritesFrameRenderer()
+    start = time.perf_counter()
+    with RawVideoWriter(f"{out}/frites.rgb") as video:
+        for i in range(frames):
+            sim.step(left=i % 120 < 60, right=i % 120 >= 60)
+            if sim.game_over:
+                sim.reset(i)
+            video.write(renderer.render(sim))
+    elapsed = time.perf_counter() - start
+    write_png(f"{out}/frites.png", renderer.framebuffer.pixels)
+    print(f"frites : {frames / elapsed:,.0f} images/s ({renderer.framebuffer.width}x"
+          f"{renderer.framebuffer.height})")
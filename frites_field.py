@@ -0,0 +1,119 @@
+import numpy as np
+
+from frites_sim import WINDOW_WIDTH, WINDOW_HEIGHT, FRITE_SPEED, CATCH_MARGIN, PaquetFrites
+
+WOBBLE_STEP = 5
+WOBBLE_AMPLITUDE = 0.5
+
+
+class FriteField:
+    """Frites qui tombent stockées en colonnes NumPy, mises à jour d'un bloc"""
+
+    def __init__(self, capacity=1024, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self.count = 0
+        self.x = np.empty(capacity)
+        self.y = np.empty(capacity)
+        self.speed = np.empty(capacity)
+        self.wobble = np.empty(capacity)
+        self.rotation = np.empty(capacity, dtype=np.int16)
+
+        # Tampons réutilisés à chaque frame
+        self.scratch = np.empty(capacity)
+        self.caught = np.empty(capacity, dtype=bool)
+        self.missed = np.empty(capacity, dtype=bool)
+        self.mask = np.empty(capacity, dtype=bool)
+
+    def __len__(self):
+        return self.count
+
+    def grow(self, capacity):
+        """Agrandit toutes les colonnes (capacité doublée au besoin)"""
+        for name in ("x", "y", "speed", "wobble", "rotation", "scratch",
+                     "caught", "missed", "mask"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def spawn(self, x, y=-50):
+        """Ajoute une frite (mêmes tirages que Frite.__init__)"""
+        self.spawn_many(np.array([x], dtype=float), y)
+
+    def spawn_many(self, xs, y=-50):
+        """Ajoute len(xs) frites d'un coup"""
+        n = len(xs)
+        start, end = self.count, self.count + n
+        if end > len(self.x):
+            self.grow(max(end, 2 * len(self.x)))
+        self.x[start:end] = xs
+        self.y[start:end] = y
+        self.speed[start:end] = FRITE_SPEED + self.rng.uniform(-1, 1, n)
+        self.rotation[start:end] = self.rng.integers(-30, 31, n)
+        self.wobble[start:end] = self.rng.uniform(0, 360, n)
+        self.count = end
+
+    def update(self, catch_rect, height=WINDOW_HEIGHT):
+        """Avance toutes les frites, renvoie les masques (attrapées, tombées)"""
+        n = self.count
+        x, y, wobble, tmp = self.x[:n], self.y[:n], self.wobble[:n], self.scratch[:n]
+
+        # Équivalent vectorisé de Frite.update
+        y += self.speed[:n]
+        wobble += WOBBLE_STEP
+        np.radians(wobble, out=tmp)
+        np.sin(tmp, out=tmp)
+        tmp *= WOBBLE_AMPLITUDE
+        x += tmp
+
+        # Collision avec la zone de capture, prioritaire sur la chute
+        left, top, right, bottom = catch_rect
+        caught, missed, mask = self.caught[:n], self.missed[:n], self.mask[:n]
+        np.greater_equal(x, left, out=caught)
+        caught &= np.less_equal(x, right, out=mask)
+        caught &= np.greater_equal(y, top, out=mask)
+        caught &= np.less_equal(y, bottom + CATCH_MARGIN, out=mask)
+        np.greater(y, height, out=missed)
+        missed &= np.logical_not(caught, out=mask)
+        return caught, missed
+
+    def remove(self, caught, missed):
+        """Retire les frites attrapées ou tombées en compactant les colonnes"""
+        n = self.count
+        keep = np.logical_or(caught, missed, out=self.mask[:n])
+        np.logical_not(keep, out=keep)
+        kept = int(np.count_nonzero(keep))
+        if kept == n:
+            return
+        for column in (self.x, self.y, self.speed, self.wobble, self.rotation):
+            column[:kept] = column[:n][keep]
+        self.count = kept
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    # Mode stress : population constante de frites, paquet immobile au centre
+    population = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    field = FriteField(population, seed=0)
+    field.spawn_many(field.rng.uniform(50, WINDOW_WIDTH - 50, population))
+    field.y[:population] = field.rng.uniform(-50, WINDOW_HEIGHT, population)
+    paquet = PaquetFrites(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 80)
+    catch_rect = paquet.get_catch_rect()
+
+    frames = caught_total = missed_total = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < 2.0:
+        caught, missed = field.update(catch_rect)
+        n_caught = int(np.count_nonzero(caught))
+        n_missed = int(np.count_nonzero(missed))
+        caught_total += n_caught
+        missed_total += n_missed
+        field.remove(caught, missed)
+        if n_caught + n_missed:
+            field.spawn_many(field.rng.uniform(50, WINDOW_WIDTH - 50, n_caught + n_missed))
+        frames += 1
+    elapsed = time.perf_counter() - start
+    print(f"{population:,} frites : {frames / elapsed:,.0f} frames/s "
+          f"({caught_total} attrapées, {missed_total} tombées)")
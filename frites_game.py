@@ -1,70 +1,109 @@
 import tkinter as tk
-import random
-from math import sin, cos, radians
+
+from frites_sim import FritesSim, WINDOW_WIDTH, WINDOW_HEIGHT
+from frites_sprites import (
+    BG_COLOR, GROUND_COLOR, RED, YELLOW, TEXT_COLOR, CLOUDS, ROTATION_STEP,
+    paquet_shapes, frite_shapes, render_pixels, scale_shapes,
+)
+from hud import Hud
+from profiler import FrameProfiler
+from replay import FritesRecorder
+from scaling import LruCache, ResizeWatcher
+from scene import Scene
+from scheduler import FixedStepScheduler
+from timeline import Timeline
 
 # Constantes
-WINDOW_WIDTH = 800
-WINDOW_HEIGHT = 600
 GAME_SPEED = 30  # ms entre chaque frame
-FRITE_SPAWN_RATE = 40  # frames entre chaque frite
-FRITE_SPEED = 3
-
-# Couleurs
-BG_COLOR = "#87CEEB"  # Bleu ciel
-GROUND_COLOR = "#90EE90"  # Vert clair
-RED = "#E31837"  # Rouge McDonald's
-YELLOW = "#FFC72C"  # Jaune McDonald's
-FRITE_COLOR = "#FFD700"
-FRITE_SHADOW = "#DAA520"
-TEXT_COLOR = "#333"
-
-
-class Frite:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.width = 8
-        self.height = 40
-        self.speed = FRITE_SPEED + random.uniform(-1, 1)
-        self.rotation = random.randint(-30, 30)
-        self.wobble = random.uniform(0, 360)
-
-    def update(self):
-        self.y += self.speed
-        self.wobble += 5
-        self.x += sin(radians(self.wobble)) * 0.5
-
-    def is_off_screen(self):
-        return self.y > WINDOW_HEIGHT
-
-
-class PaquetFrites:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.width = 80
-        self.height = 100
-        self.target_x = x
-        self.speed = 15
-
-    def move_to(self, target_x):
-        self.target_x = max(self.width // 2, min(WINDOW_WIDTH - self.width // 2, target_x))
-
-    def update(self):
-        if abs(self.x - self.target_x) > 2:
-            if self.x < self.target_x:
-                self.x = min(self.x + self.speed, self.target_x)
-            else:
-                self.x = max(self.x - self.speed, self.target_x)
-
-    def get_catch_rect(self):
-        # Zone de capture (haut du paquet)
-        return (
-            self.x - self.width // 2,
-            self.y - self.height // 2,
-            self.x + self.width // 2,
-            self.y - self.height // 2 + 20
-        )
+COMBO_DURATION = 1000 // GAME_SPEED  # frames d'affichage du combo
+
+# Sprites rastérisés au premier dessin (il faut une fenêtre Tk), puis partagés.
+# Un paquet et 7 rotations par échelle : les 4 dernières échelles restent prêtes
+_sprites = LruCache(32)
+
+
+def photo_image(pixels):
+    """Copie une grille de couleurs dans une PhotoImage"""
+    width = len(pixels[0])
+    # Écriture par segments de même couleur, les pixels non écrits restent transparents
+    image = tk.PhotoImage(width=width, height=len(pixels))
+    for row, line in enumerate(pixels):
+        col = 0
+        while col < width:
+            color = line[col]
+            end = col + 1
+            while end < width and line[end] == color:
+                end += 1
+            if color is not None:
+                image.put(color, to=(col, row, end, row + 1))
+            col = end
+    return image
+
+
+def rasterize(shapes):
+    """Rend les formes une seule fois dans une PhotoImage transparente
+
+    Renvoie (image, dx, dy) : l'image se place en (x + dx, y + dy) avec anchor=NW.
+    """
+    pixels, left, top = render_pixels(shapes)
+    return photo_image(pixels), left, top
+
+
+def paquet_sprite(width, height, scale=1.0):
+    """(image, dx, dy) du paquet centré sur sa position, décalage en pixels à l'échelle"""
+    return _sprites.get(("paquet", width, height, scale),
+                        lambda: rasterize(scale_shapes(paquet_shapes(width, height), scale)))
+
+
+def frite_sprite(width, height, rotation, scale=1.0):
+    """(image, dx, dy) de la variante pré-tournée la plus proche de rotation"""
+    angle = round(rotation / ROTATION_STEP) * ROTATION_STEP
+    return _sprites.get(("frite", width, height, angle, scale),
+                        lambda: rasterize(scale_shapes(frite_shapes(width, height, angle), scale)))
+
+
+class FritesRenderer:
+    """Paquet et frites décrits par clé dans une scène : seuls les changements partent vers Tk"""
+
+    def __init__(self, canvas):
+        self.scene = Scene(canvas)
+        self.scale = 1.0  # Pixels du canvas par unité de la simulation
+        self.frite_sprites = {}  # Rotation -> sprite, évite de recalculer la clé
+
+    @property
+    def tk_calls(self):
+        return self.scene.tk_calls
+
+    @property
+    def frame_calls(self):
+        return self.scene.frame_calls
+
+    def reset(self):
+        """Oublie les objets dessinés (après un canvas.delete("all"))"""
+        self.scene.reset()
+
+    def item_count(self):
+        """Nombre d'objets du canvas tenus par le dessin"""
+        return self.scene.item_count()
+
+    def set_scale(self, scale):
+        self.scale = scale
+        self.frite_sprites.clear()
+
+    def draw(self, paquet, frites):
+        """Décrit la frame ; une frite disparue cède son image à la suivante qui apparaît"""
+        scene, sprites, scale = self.scene, self.frite_sprites, self.scale
+        scene.begin()
+        image, dx, dy = paquet_sprite(paquet.width, paquet.height, scale)
+        scene.image("paquet", paquet.x * scale + dx, paquet.y * scale + dy, image=image, anchor=tk.NW, tags="paquet")
+        for frite in frites:
+            sprite = sprites.get(frite.rotation)
+            if sprite is None:
+                sprite = sprites[frite.rotation] = frite_sprite(frite.width, frite.height, frite.rotation, scale)
+            image, dx, dy = sprite
+            # Les frites recyclées gardent leur objet : même clé, image mise à jour si besoin
+            scene.image(frite, frite.x * scale + dx, frite.y * scale + dy, image=image, anchor=tk.NW, tags="frite")
+        scene.end()
 
 
 class FritesGame:
@@ -80,6 +119,7 @@ class FritesGame:
         # Variables pour le plein écran
         self.is_fullscreen = False
         self.root.bind("<F11>", self.toggle_fullscreen)
+        self.root.bind("<F3>", lambda e: self.profiler.toggle_overlay())
         self.root.bind("<Escape>", self.exit_fullscreen)
 
         # Frame principal
@@ -121,27 +161,34 @@ class FritesGame:
         # Instructions
         self.instructions = tk.Label(
             self.main_frame,
-            text="Souris / Q-D / Flèches pour bouger • F11 plein écran • R pour recommencer",
+            text="Souris / Q-D / Flèches pour bouger • F11 plein écran • R pour recommencer • F3 profileur",
             font=("Arial", 10),
             bg=BG_COLOR,
             fg=TEXT_COLOR
         )
         self.instructions.pack(pady=(10, 0))
 
-        # Variables du jeu
-        self.paquet = PaquetFrites(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 80)
-        self.frites = []
-        self.score = 0
-        self.lives = 3
-        self.game_over = False
+        # Variables du jeu (les règles vivent dans la simulation)
+        self.sim = FritesSim()
+        self.recorder = FritesRecorder(self.sim)  # Graine + entrées, pour rejouer la partie
+        self.recorder.start()
+        self.ui_timeline = Timeline()  # Expirations de l'interface, en frames de jeu
+        self.combo_item = None
+        self.hud = Hud()
+        self.hud.add("score", lambda score: self.score_label.config(text=f"Score: {score}"), 0)
+        self.hud.add("lives", self.write_lives, self.sim.lives)
+        self.hud.add("combo", self.write_combo, 0)
         self.game_started = False
-        self.frame_count = 0
-        self.combo = 0
-        self.max_combo = 0
+        self.renderer = FritesRenderer(self.canvas)
+        self.screens = Scene(self.canvas, tag="screen", raise_on_show=True)  # Accueil, fin de partie
+        self.profiler = FrameProfiler(self.canvas, ("input", "frites", "collision", "score", "draw", "hud"))
+        self.sim.profiler = self.profiler
+        self.loop = FixedStepScheduler(root, GAME_SPEED, self.update, self.draw_frame)
+        self.scale = 1.0  # Échelle du canvas, suit la taille de la fenêtre
+        self.resizer = ResizeWatcher(root, self.canvas, WINDOW_WIDTH, WINDOW_HEIGHT, self.apply_scale)
 
         # Variables pour contrôle clavier
         self.keys_pressed = set()
-        self.keyboard_speed = 8
 
         # Binding souris
         self.canvas.bind("<Motion>", self.on_mouse_move)
@@ -172,6 +219,38 @@ class FritesGame:
         # Afficher écran d'accueil
         self.show_start_screen()
 
+    @property
+    def paquet(self):
+        return self.sim.paquet
+
+    @property
+    def frites(self):
+        return self.sim.frites
+
+    @property
+    def score(self):
+        return self.sim.score
+
+    @property
+    def lives(self):
+        return self.sim.lives
+
+    @property
+    def combo(self):
+        return self.sim.combo
+
+    @property
+    def max_combo(self):
+        return self.sim.max_combo
+
+    @property
+    def frame_count(self):
+        return self.sim.frame_count
+
+    @property
+    def game_over(self):
+        return self.sim.game_over
+
     def toggle_fullscreen(self, event=None):
         self.is_fullscreen = not self.is_fullscreen
         self.root.attributes("-fullscreen", self.is_fullscreen)
@@ -183,61 +262,88 @@ class FritesGame:
             self.root.attributes("-fullscreen", False)
             return "break"
 
+    def px(self, value):
+        """Position ou taille en pixels à l'échelle courante"""
+        return round(value * self.scale)
+
+    def apply_scale(self, scale):
+        """Redessine tout à la nouvelle échelle (appelé une fois le redimensionnement fini)"""
+        self.scale = scale
+        self.canvas.config(width=self.px(WINDOW_WIDTH), height=self.px(WINDOW_HEIGHT))
+        self.canvas.delete("all")
+        self.renderer.reset()
+        self.renderer.set_scale(scale)
+        self.screens.reset()
+        self.profiler.reset_overlay()
+        self.combo_item = None
+        self.hud.invalidate("combo")
+        self.draw_background()
+        if not self.game_started:
+            self.show_start_screen()
+            return
+        self.draw_frame()
+        if self.game_over:
+            self.show_game_over()
+
     def draw_background(self):
+        px = self.px
         # Ciel avec nuages
-        self.canvas.create_rectangle(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT, fill=BG_COLOR, outline="")
+        self.canvas.create_rectangle(0, 0, px(WINDOW_WIDTH), px(WINDOW_HEIGHT), fill=BG_COLOR, outline="")
 
         # Nuages décoratifs
-        clouds = [(150, 80), (400, 120), (650, 60), (250, 180)]
-        for cx, cy in clouds:
+        for cx, cy in CLOUDS:
             self.draw_cloud(cx, cy)
 
         # Sol
         self.canvas.create_rectangle(
-            0, WINDOW_HEIGHT - 50, WINDOW_WIDTH, WINDOW_HEIGHT,
+            0, px(WINDOW_HEIGHT - 50), px(WINDOW_WIDTH), px(WINDOW_HEIGHT),
             fill=GROUND_COLOR, outline=""
         )
 
     def draw_cloud(self, x, y):
         # Nuage simple
-        self.canvas.create_oval(x, y, x + 40, y + 30, fill="white", outline="")
-        self.canvas.create_oval(x + 20, y - 10, x + 60, y + 25, fill="white", outline="")
-        self.canvas.create_oval(x + 40, y, x + 80, y + 30, fill="white", outline="")
+        px = self.px
+        self.canvas.create_oval(px(x), px(y), px(x + 40), px(y + 30), fill="white", outline="")
+        self.canvas.create_oval(px(x + 20), px(y - 10), px(x + 60), px(y + 25), fill="white", outline="")
+        self.canvas.create_oval(px(x + 40), px(y), px(x + 80), px(y + 30), fill="white", outline="")
 
     def show_start_screen(self):
+        screens = self.screens
+        screens.begin()
         # Titre
-        self.canvas.create_text(
-            WINDOW_WIDTH // 2,
-            WINDOW_HEIGHT // 2 - 100,
+        screens.text(
+            "title",
+            self.px(WINDOW_WIDTH // 2),
+            self.px(WINDOW_HEIGHT // 2 - 100),
             text="🍟 McDONALD'S",
-            font=("Arial", 48, "bold"),
-            fill=RED,
-            tags="start"
+            font=("Arial", self.px(48), "bold"),
+            fill=RED
         )
-        self.canvas.create_text(
-            WINDOW_WIDTH // 2,
-            WINDOW_HEIGHT // 2 - 40,
+        screens.text(
+            "subtitle",
+            self.px(WINDOW_WIDTH // 2),
+            self.px(WINDOW_HEIGHT // 2 - 40),
             text="FRITES CATCHER",
-            font=("Arial", 36, "bold"),
-            fill=YELLOW,
-            tags="start"
+            font=("Arial", self.px(36), "bold"),
+            fill=YELLOW
         )
-        self.canvas.create_text(
-            WINDOW_WIDTH // 2,
-            WINDOW_HEIGHT // 2 + 40,
+        screens.text(
+            "prompt",
+            self.px(WINDOW_WIDTH // 2),
+            self.px(WINDOW_HEIGHT // 2 + 40),
             text="Clique pour commencer !",
-            font=("Arial", 20),
-            fill=TEXT_COLOR,
-            tags="start"
+            font=("Arial", self.px(20)),
+            fill=TEXT_COLOR
         )
-        self.canvas.create_text(
-            WINDOW_WIDTH // 2,
-            WINDOW_HEIGHT // 2 + 80,
+        screens.text(
+            "hint",
+            self.px(WINDOW_WIDTH // 2),
+            self.px(WINDOW_HEIGHT // 2 + 80),
             text="Attrape les frites avec le paquet 🍟",
-            font=("Arial", 14),
-            fill=TEXT_COLOR,
-            tags="start"
+            font=("Arial", self.px(14)),
+            fill=TEXT_COLOR
         )
+        screens.end()
 
     def on_click(self, event):
         if not self.game_started:
@@ -245,23 +351,24 @@ class FritesGame:
 
     def start_game(self):
         self.game_started = True
-        self.canvas.delete("start", "gameover")
+        self.screens.clear()
         self.game_loop()
 
     def restart_game(self):
-        self.frites.clear()
-        self.score = 0
-        self.lives = 3
-        self.combo = 0
-        self.max_combo = 0
-        self.game_over = False
+        self.loop.stop()
+        self.recorder.finish()
+        self.recorder.start()
+        self.ui_timeline.clear()
         self.game_started = False
-        self.frame_count = 0
-        self.paquet.x = WINDOW_WIDTH // 2
-        self.paquet.target_x = WINDOW_WIDTH // 2
         self.update_score()
         self.update_lives()
         self.canvas.delete("all")
+        self.renderer.reset()
+        self.screens.reset()
+        self.profiler.reset_overlay()
+        self.combo_item = None
+        self.hud.set("combo", 0)
+        self.hud.flush()
         self.draw_background()
         self.show_start_screen()
 
@@ -283,229 +390,126 @@ class FritesGame:
 
     def on_mouse_move(self, event):
         if self.game_started and not self.game_over:
-            self.paquet.move_to(event.x)
-
-    def spawn_frite(self):
-        x = random.randint(50, WINDOW_WIDTH - 50)
-        y = -50
-        self.frites.append(Frite(x, y))
+            self.paquet.move_to(event.x / self.scale)
 
     def update_score(self):
-        self.score_label.config(text=f"Score: {self.score}")
+        self.hud.set("score", self.score)
 
     def update_lives(self):
-        hearts = "❤️ " * self.lives
-        self.lives_label.config(text=hearts.strip())
-
-    def draw_paquet(self):
-        x, y = self.paquet.x, self.paquet.y
-        w, h = self.paquet.width, self.paquet.height
+        self.hud.set("lives", self.lives)
 
-        # Ombre
-        self.canvas.create_oval(
-            x - w // 2 + 5, y + h // 2 - 5,
-            x + w // 2 + 5, y + h // 2 + 10,
-            fill="gray", outline="", stipple="gray50", tags="paquet"
-        )
-
-        # Corps du paquet (rouge)
-        points = [
-            x - w // 2, y - h // 2 + 20,  # Haut gauche
-            x + w // 2, y - h // 2 + 20,  # Haut droit
-            x + w // 2 - 5, y + h // 2,   # Bas droit
-            x - w // 2 + 5, y + h // 2    # Bas gauche
-        ]
-        self.canvas.create_polygon(points, fill=RED, outline="#B71C1C", width=2, tags="paquet")
-
-        # Partie supérieure (ouverture)
-        self.canvas.create_rectangle(
-            x - w // 2, y - h // 2,
-            x + w // 2, y - h // 2 + 25,
-            fill="#C41E3A", outline="#B71C1C", width=2, tags="paquet"
-        )
-
-        # Logo M de McDonald's
-        self.canvas.create_text(
-            x, y,
-            text="M",
-            font=("Arial", 40, "bold"),
-            fill=YELLOW,
-            tags="paquet"
-        )
-
-        # Frites qui dépassent du paquet
-        frite_positions = [
-            (x - 20, y - h // 2 + 10),
-            (x - 5, y - h // 2 + 5),
-            (x + 10, y - h // 2 + 12),
-            (x + 25, y - h // 2 + 8)
-        ]
-
-        for fx, fy in frite_positions:
-            # Frite
-            self.canvas.create_rectangle(
-                fx - 3, fy, fx + 3, fy + 25,
-                fill=FRITE_COLOR, outline=FRITE_SHADOW, width=1, tags="paquet"
-            )
-            # Bout de la frite plus foncé
-            self.canvas.create_rectangle(
-                fx - 3, fy, fx + 3, fy + 5,
-                fill="#DAA520", outline="", tags="paquet"
-            )
-
-    def draw_frite(self, frite):
-        # Frite qui tombe
-        x, y = frite.x, frite.y
-
-        # Corps de la frite
-        points = [
-            x - frite.width // 2, y,
-            x + frite.width // 2, y,
-            x + frite.width // 2 - 2, y + frite.height,
-            x - frite.width // 2 + 2, y + frite.height
-        ]
-
-        self.canvas.create_polygon(
-            points, fill=FRITE_COLOR, outline=FRITE_SHADOW, width=1, tags="frite"
-        )
-
-        # Bout foncé
-        self.canvas.create_rectangle(
-            x - frite.width // 2, y,
-            x + frite.width // 2, y + 8,
-            fill=FRITE_SHADOW, outline="", tags="frite"
-        )
-
-    def check_collision(self, frite):
-        catch_rect = self.paquet.get_catch_rect()
-
-        # Vérifier si la frite touche la zone de capture
-        if (catch_rect[0] <= frite.x <= catch_rect[2] and
-            catch_rect[1] <= frite.y <= catch_rect[3] + 30):
-            return True
-        return False
+    def write_lives(self, lives):
+        hearts = "❤️ " * lives
+        self.lives_label.config(text=hearts.strip())
 
     def show_game_over(self):
+        self.recorder.finish()
+
+        screens = self.screens
+        screens.begin()
         # Overlay semi-transparent
-        self.canvas.create_rectangle(
-            0, 0, WINDOW_WIDTH, WINDOW_HEIGHT,
-            fill="black", stipple="gray50", tags="gameover"
+        screens.rectangle(
+            "overlay",
+            0, 0, self.px(WINDOW_WIDTH), self.px(WINDOW_HEIGHT),
+            fill="black", stipple="gray50"
         )
 
-        self.canvas.create_text(
-            WINDOW_WIDTH // 2,
-            WINDOW_HEIGHT // 2 - 80,
+        screens.text(
+            "title",
+            self.px(WINDOW_WIDTH // 2),
+            self.px(WINDOW_HEIGHT // 2 - 80),
             text="GAME OVER",
-            font=("Arial", 50, "bold"),
-            fill=RED,
-            tags="gameover"
+            font=("Arial", self.px(50), "bold"),
+            fill=RED
         )
 
-        self.canvas.create_text(
-            WINDOW_WIDTH // 2,
-            WINDOW_HEIGHT // 2 - 10,
+        screens.text(
+            "subtitle",
+            self.px(WINDOW_WIDTH // 2),
+            self.px(WINDOW_HEIGHT // 2 - 10),
             text=f"Score Final: {self.score}",
-            font=("Arial", 30),
-            fill=YELLOW,
-            tags="gameover"
+            font=("Arial", self.px(30)),
+            fill=YELLOW
         )
 
         if self.max_combo > 1:
-            self.canvas.create_text(
-                WINDOW_WIDTH // 2,
-                WINDOW_HEIGHT // 2 + 30,
+            screens.text(
+                "combo",
+                self.px(WINDOW_WIDTH // 2),
+                self.px(WINDOW_HEIGHT // 2 + 30),
                 text=f"Meilleur Combo: {self.max_combo}x",
-                font=("Arial", 20),
-                fill="white",
-                tags="gameover"
+                font=("Arial", self.px(20)),
+                fill="white"
             )
 
-        self.canvas.create_text(
-            WINDOW_WIDTH // 2,
-            WINDOW_HEIGHT // 2 + 70,
+        screens.text(
+            "prompt",
+            self.px(WINDOW_WIDTH // 2),
+            self.px(WINDOW_HEIGHT // 2 + 70),
             text="Appuyez sur R pour rejouer",
-            font=("Arial", 18),
-            fill="white",
-            tags="gameover"
+            font=("Arial", self.px(18)),
+            fill="white"
         )
+        screens.end()
 
     def show_combo(self):
         if self.combo > 1:
-            self.canvas.delete("combo")
-            self.canvas.create_text(
-                WINDOW_WIDTH // 2,
-                100,
-                text=f"COMBO x{self.combo}!",
-                font=("Arial", 30, "bold"),
-                fill=YELLOW,
-                tags="combo"
+            self.hud.set("combo", self.combo)
+            # Un seul effacement en attente, repoussé à chaque nouveau combo
+            self.ui_timeline.schedule(
+                self.frame_count + COMBO_DURATION, "combo", lambda: self.hud.set("combo", 0)
             )
-            self.root.after(1000, lambda: self.canvas.delete("combo"))
+
+    def write_combo(self, combo):
+        """Texte de combo persistant : modifié ou caché, jamais recréé"""
+        if combo > 1:
+            if self.combo_item is None:
+                self.combo_item = self.canvas.create_text(
+                    self.px(WINDOW_WIDTH // 2),
+                    self.px(100),
+                    font=("Arial", self.px(30), "bold"),
+                    fill=YELLOW,
+                    tags="combo"
+                )
+            self.canvas.itemconfig(self.combo_item, text=f"COMBO x{combo}!", state="normal")
+        elif self.combo_item is not None:
+            self.canvas.itemconfig(self.combo_item, state="hidden")
 
     def game_loop(self):
         if not self.game_started or self.game_over:
             return
+        self.loop.start()
 
-        self.frame_count += 1
-
-        # Spawner des frites
-        if self.frame_count % FRITE_SPAWN_RATE == 0:
-            self.spawn_frite()
-
-        # Augmenter la difficulté progressivement
-        if self.frame_count % 500 == 0 and FRITE_SPAWN_RATE > 20:
-            globals()['FRITE_SPAWN_RATE'] -= 2
-
-        # Déplacement au clavier
-        if 'left' in self.keys_pressed:
-            new_x = max(self.paquet.width // 2, self.paquet.x - self.keyboard_speed)
-            self.paquet.move_to(new_x)
-        if 'right' in self.keys_pressed:
-            new_x = min(WINDOW_WIDTH - self.paquet.width // 2, self.paquet.x + self.keyboard_speed)
-            self.paquet.move_to(new_x)
-
-        # Mettre à jour le paquet
-        self.paquet.update()
-
-        # Mettre à jour les frites
-        frites_to_remove = []
-        for frite in self.frites:
-            frite.update()
-
-            # Vérifier collision
-            if self.check_collision(frite):
-                frites_to_remove.append(frite)
-                points = 10 + (self.combo * 5)
-                self.score += points
-                self.combo += 1
-                self.max_combo = max(self.max_combo, self.combo)
-                self.update_score()
-                self.show_combo()
-
-            # Frite tombée au sol
-            elif frite.is_off_screen():
-                frites_to_remove.append(frite)
-                self.lives -= 1
-                self.combo = 0
-                self.update_lives()
-
-                if self.lives <= 0:
-                    self.game_over = True
-                    self.show_game_over()
-                    return
-
-        # Retirer les frites capturées ou tombées
-        for frite in frites_to_remove:
-            self.frites.remove(frite)
-
+    def update(self):
+        """Un pas de simulation, renvoie False quand la boucle doit s'arrêter"""
+        if not self.game_started or self.game_over:
+            return False
+
+        events = self.recorder.step('left' in self.keys_pressed, 'right' in self.keys_pressed)
+        if True in events:
+            self.update_score()
+            self.show_combo()
+        if False in events:
+            self.update_lives()
+
+        if self.game_over:
+            self.ui_timeline.clear()
+            self.hud.set("combo", 0)
+            self.hud.flush()
+            self.show_game_over()
+            return False
+
+        self.ui_timeline.advance(self.frame_count)
+        return True
+
+    def draw_frame(self):
         # Redessiner
-        self.canvas.delete("paquet", "frite")
-        self.draw_paquet()
-        for frite in self.frites:
-            self.draw_frite(frite)
-
-        # Continuer la boucle
-        self.root.after(GAME_SPEED, self.game_loop)
+        start = self.profiler.now()
+        self.renderer.draw(self.paquet, self.frites)
+        start = self.profiler.lap("draw", start)
+        self.hud.flush()
+        self.profiler.lap("hud", start)
+        self.profiler.end_frame(self.renderer.frame_calls)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,276 @@
+import random
+from math import sin, radians
+
+from timeline import Timeline
+
+# Constantes
+WINDOW_WIDTH = 800
+WINDOW_HEIGHT = 600
+FRITE_SPAWN_RATE = 40  # frames entre chaque frite
+FRITE_SPEED = 3
+MIN_SPAWN_RATE = 20
+DIFFICULTY_PERIOD = 500  # frames entre deux paliers de difficulté
+WAVE_PERIOD = 1500  # frames entre deux vagues
+WAVE_SIZE = 5  # frites par vague
+WAVE_SPACING = 10  # frames entre deux frites d'une vague
+KEYBOARD_SPEED = 8
+LIVES = 3
+CATCH_MARGIN = 30  # marge verticale sous la zone de capture
+
+
+class Frite:
+    __slots__ = ("x", "y", "width", "height", "speed", "rotation", "wobble")
+
+    def __init__(self, x, y, rng=random):
+        self.reset(x, y, rng)
+
+    def reset(self, x, y, rng=random):
+        """Réinitialise une frite recyclée comme si elle venait d'être créée"""
+        self.x = x
+        self.y = y
+        self.width = 8
+        self.height = 40
+        self.speed = FRITE_SPEED + rng.uniform(-1, 1)
+        self.rotation = rng.randint(-30, 30)
+        self.wobble = rng.uniform(0, 360)
+        return self
+
+    def update(self):
+        self.y += self.speed
+        self.wobble += 5
+        self.x += sin(radians(self.wobble)) * 0.5
+
+    def is_off_screen(self):
+        return self.y > WINDOW_HEIGHT
+
+
+class FritePool:
+    """Frites vivantes + frites recyclées : aucune allocation une fois le jeu lancé"""
+
+    def __init__(self):
+        self.live = []
+        self.free = []
+        self.events = []  # True = attrapée, False = tombée, dans l'ordre de la liste
+        self.allocated = 0  # Objets Frite réellement créés
+
+    def __iter__(self):
+        return iter(self.live)
+
+    def __len__(self):
+        return len(self.live)
+
+    def spawn(self, x, y, rng=random):
+        if self.free:
+            frite = self.free.pop().reset(x, y, rng)
+        else:
+            frite = Frite(x, y, rng)
+            self.allocated += 1
+        self.live.append(frite)
+        return frite
+
+    def clear(self):
+        """Recycle toutes les frites vivantes"""
+        self.free.extend(self.live)
+        self.live.clear()
+
+    def update(self, catch_rect, profiler=None, start=0):
+        """Avance les frites puis traite collisions et chutes en compactant la liste
+
+        Renvoie les événements. Avec un profiler, les deux passes comptent
+        dans les phases frites et collision (start = début de la première).
+        """
+        left, top, right, bottom = catch_rect
+        bottom += CATCH_MARGIN
+        live, free, events = self.live, self.free, self.events
+        events.clear()
+        for frite in live:
+            frite.update()
+        if profiler:
+            start = profiler.lap("frites", start)
+
+        kept = 0
+        for frite in live:
+            # Vérifier collision
+            if left <= frite.x <= right and top <= frite.y <= bottom:
+                events.append(True)
+                free.append(frite)
+
+            # Frite tombée au sol
+            elif frite.y > WINDOW_HEIGHT:
+                events.append(False)
+                free.append(frite)
+
+            else:
+                live[kept] = frite
+                kept += 1
+        del live[kept:]
+        if profiler:
+            profiler.lap("collision", start)
+        return events
+
+
+class PaquetFrites:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.width = 80
+        self.height = 100
+        self.target_x = x
+        self.speed = 15
+
+    def move_to(self, target_x):
+        self.target_x = max(self.width // 2, min(WINDOW_WIDTH - self.width // 2, target_x))
+
+    def update(self):
+        if abs(self.x - self.target_x) > 2:
+            if self.x < self.target_x:
+                self.x = min(self.x + self.speed, self.target_x)
+            else:
+                self.x = max(self.x - self.speed, self.target_x)
+
+    def get_catch_rect(self):
+        # Zone de capture (haut du paquet)
+        return (
+            self.x - self.width // 2,
+            self.y - self.height // 2,
+            self.x + self.width // 2,
+            self.y - self.height // 2 + 20
+        )
+
+
+class FritesSim:
+    """Règles du jeu des frites sans affichage, graine et difficulté propres à l'instance"""
+
+    def __init__(self, seed=None, spawn_rate=FRITE_SPAWN_RATE):
+        self.rng = random.Random()
+        self.start_rate = spawn_rate  # Cadence d'apparition en début de partie (frames)
+        self.paquet = PaquetFrites(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 80)
+        self.frites = FritePool()
+        self.timeline = Timeline()  # Dates en frames
+        self.profiler = None  # FrameProfiler optionnel (phases input, frites, collision, score)
+        self.reset(seed)
+
+    def reset(self, seed=None, spawn_rate=None):
+        """Remet la partie à zéro (graine optionnelle pour rejouer à l'identique)
+
+        spawn_rate remplace la cadence de départ pour cette partie et les suivantes.
+        """
+        if spawn_rate is not None:
+            self.start_rate = spawn_rate
+        self.seed = seed
+        self.rng.seed(seed)
+        self.frites.clear()
+        self.paquet.x = WINDOW_WIDTH // 2
+        self.paquet.target_x = WINDOW_WIDTH // 2
+        self.score = 0
+        self.lives = LIVES
+        self.combo = 0
+        self.max_combo = 0
+        self.frame_count = 0
+        self.spawn_rate = self.start_rate
+        self.game_over = False
+
+        self.timeline.clear()
+        self.timeline.schedule(self.spawn_rate, "spawn", self.on_spawn)
+        self.timeline.schedule(DIFFICULTY_PERIOD, "difficulty", self.on_difficulty)
+        self.timeline.schedule(WAVE_PERIOD, "wave", self.on_wave)
+
+    def spawn_frite(self):
+        x = self.rng.randint(50, WINDOW_WIDTH - 50)
+        y = -50
+        self.frites.spawn(x, y, self.rng)
+
+    def on_spawn(self):
+        self.spawn_frite()
+        self.timeline.schedule(self.frame_count + self.spawn_rate, "spawn", self.on_spawn)
+
+    def on_difficulty(self):
+        # Augmenter la difficulté progressivement
+        if self.spawn_rate > MIN_SPAWN_RATE:
+            self.spawn_rate -= 2
+            self.timeline.schedule(self.frame_count + DIFFICULTY_PERIOD, "difficulty", self.on_difficulty)
+
+    def on_wave(self):
+        # Rafale de frites espacées, en plus des apparitions régulières
+        for i in range(WAVE_SIZE):
+            self.timeline.schedule(self.frame_count + i * WAVE_SPACING, None, self.spawn_frite)
+        self.timeline.schedule(self.frame_count + WAVE_PERIOD, "wave", self.on_wave)
+
+    def step(self, left=False, right=False):
+        """Avance d'une frame et renvoie les événements (True = attrapée, False = tombée)"""
+        if self.game_over:
+            self.frites.events.clear()
+            return self.frites.events
+
+        profiler = self.profiler
+        if profiler:
+            start = profiler.now()
+        self.frame_count += 1
+
+        # Apparitions, paliers de difficulté et vagues arrivés à échéance
+        self.timeline.advance(self.frame_count)
+
+        # Déplacement au clavier
+        paquet = self.paquet
+        if left:
+            paquet.move_to(max(paquet.width // 2, paquet.x - KEYBOARD_SPEED))
+        if right:
+            paquet.move_to(min(WINDOW_WIDTH - paquet.width // 2, paquet.x + KEYBOARD_SPEED))
+
+        # Mettre à jour le paquet
+        paquet.update()
+        if profiler:
+            start = profiler.lap("input", start)
+
+        # Mettre à jour les frites (déplacement puis collisions)
+        events = self.frites.update(paquet.get_catch_rect(), profiler, start if profiler else 0)
+        if profiler:
+            start = profiler.now()
+
+        for caught in events:
+            if caught:
+                self.score += 10 + (self.combo * 5)
+                self.combo += 1
+                self.max_combo = max(self.max_combo, self.combo)
+
+            # Frite tombée au sol
+            else:
+                self.lives -= 1
+                self.combo = 0
+                if self.lives <= 0:
+                    self.game_over = True
+                    break
+        if profiler:
+            profiler.lap("score", start)
+        return events
+
+
+if __name__ == "__main__":
+    import time
+
+    def play(seed, frames):
+        """Partie pilotée par un robot qui suit la frite la plus basse"""
+        sim = FritesSim(seed)
+        for _ in range(frames):
+            lowest = max(sim.frites, key=lambda f: f.y, default=None)
+            if lowest is not None:
+                sim.paquet.move_to(lowest.x)
+            sim.step()
+            if sim.game_over:
+                sim.reset(seed)
+        return sim
+
+    # Reproductibilité : même graine, même partie
+    a, b = play(42, 5_000), play(42, 5_000)
+    assert (a.score, a.frame_count, a.lives) == (b.score, b.frame_count, b.lives)
+
+    frames = 0
+    start = time.perf_counter()
+    sim = FritesSim(0)
+    while time.perf_counter() - start < 2.0:
+        sim.step(left=frames % 120 < 60, right=frames % 120 >= 60)
+        frames += 1
+        if sim.game_over:
+            sim.reset(frames)
+    elapsed = time.perf_counter() - start
+    print(f"{frames / elapsed:,.0f} frames/s sans affichage, parties reproductibles")
@@ -0,0 +1,133 @@
+from math import sin, cos, radians
+
+# Formes et rastérisation des sprites, sans tkinter : partagées par la fenêtre
+# (frites_game.py) et le rendu hors écran (framebuffer.py)
+
+# Couleurs
+BG_COLOR = "#87CEEB"  # Bleu ciel
+GROUND_COLOR = "#90EE90"  # Vert clair
+RED = "#E31837"  # Rouge McDonald's
+YELLOW = "#FFC72C"  # Jaune McDonald's
+FRITE_COLOR = "#FFD700"
+FRITE_SHADOW = "#DAA520"
+TEXT_COLOR = "#333"
+
+# Nuages décoratifs du fond
+CLOUDS = [(150, 80), (400, 120), (650, 60), (250, 180)]
+
+# Variantes pré-tournées des frites (Frite.rotation est tiré dans [-30, 30])
+ROTATION_STEP = 10
+
+# Une forme est (points, remplissage, contour, épaisseur du contour, tramée)
+OVAL_POINTS = 24
+
+
+def rect(x1, y1, x2, y2):
+    return [(x1, y1), (x2, y1), (x2, y2), (x1, y2)]
+
+
+def oval(x1, y1, x2, y2):
+    cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
+    rx, ry = (x2 - x1) / 2, (y2 - y1) / 2
+    return [(cx + rx * cos(radians(a * 360 / OVAL_POINTS)),
+             cy + ry * sin(radians(a * 360 / OVAL_POINTS))) for a in range(OVAL_POINTS)]
+
+
+def rotate(points, angle, cx, cy):
+    c, s = cos(radians(angle)), sin(radians(angle))
+    return [(cx + (x - cx) * c - (y - cy) * s, cy + (x - cx) * s + (y - cy) * c)
+            for x, y in points]
+
+
+def scale_shapes(shapes, factor):
+    """Formes agrandies de factor autour de (0, 0), contours compris"""
+    return [([(x * factor, y * factor) for x, y in points], fill, outline, outline_width * factor, stipple)
+            for points, fill, outline, outline_width, stipple in shapes]
+
+
+def inside(px, py, points):
+    """Test pair-impair du point dans le polygone"""
+    result = False
+    x2, y2 = points[-1]
+    for x1, y1 in points:
+        if (y1 > py) != (y2 > py) and px < x1 + (py - y1) * (x2 - x1) / (y2 - y1):
+            result = not result
+        x2, y2 = x1, y1
+    return result
+
+
+def edge_distance(px, py, points):
+    """Distance du point au bord le plus proche du polygone"""
+    best = float("inf")
+    x2, y2 = points[-1]
+    for x1, y1 in points:
+        dx, dy = x2 - x1, y2 - y1
+        length = dx * dx + dy * dy
+        t = 0 if length == 0 else max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / length))
+        ex, ey = x1 + t * dx - px, y1 + t * dy - py
+        best = min(best, (ex * ex + ey * ey) ** 0.5)
+        x2, y2 = x1, y1
+    return best
+
+
+def render_pixels(shapes):
+    """Rastérise les formes dans une grille de couleurs (None = transparent)
+
+    Renvoie (pixels, dx, dy) : la grille se place en (x + dx, y + dy).
+    """
+    xs = [x for points, *_ in shapes for x, _ in points]
+    ys = [y for points, *_ in shapes for _, y in points]
+    left, top = int(min(xs)) - 1, int(min(ys)) - 1
+    width, height = int(max(xs)) + 2 - left, int(max(ys)) + 2 - top
+
+    pixels = [[None] * width for _ in range(height)]
+    for points, fill, outline, outline_width, stipple in shapes:
+        x1 = max(0, int(min(x for x, _ in points)) - left)
+        x2 = min(width, int(max(x for x, _ in points)) + 1 - left)
+        y1 = max(0, int(min(y for _, y in points)) - top)
+        y2 = min(height, int(max(y for _, y in points)) + 1 - top)
+        for row in range(y1, y2):
+            py = row + top + 0.5
+            for col in range(x1, x2):
+                if stipple and (row + col) % 2:
+                    continue
+                px = col + left + 0.5
+                if not inside(px, py, points):
+                    continue
+                if outline and edge_distance(px, py, points) < outline_width:
+                    pixels[row][col] = outline
+                else:
+                    pixels[row][col] = fill
+    return pixels, left, top
+
+
+def paquet_shapes(w, h):
+    """Formes du paquet (mêmes cotes que l'ancien draw_paquet), centrées sur (0, 0)"""
+    shapes = [
+        # Ombre (tramée une case sur deux, comme stipple="gray50")
+        (oval(-w // 2 + 5, h // 2 - 5, w // 2 + 5, h // 2 + 10), "gray", None, 0, True),
+        # Corps du paquet (rouge)
+        ([(-w // 2, -h // 2 + 20), (w // 2, -h // 2 + 20),
+          (w // 2 - 5, h // 2), (-w // 2 + 5, h // 2)], RED, "#B71C1C", 2, False),
+        # Partie supérieure (ouverture)
+        (rect(-w // 2, -h // 2, w // 2, -h // 2 + 25), "#C41E3A", "#B71C1C", 2, False),
+        # Logo M de McDonald's
+        ([(-16, 14), (-16, -14), (-8, -14), (0, -1), (8, -14), (16, -14), (16, 14),
+          (9, 14), (9, -3), (2, 8), (-2, 8), (-9, -3), (-9, 14)], YELLOW, None, 0, False),
+    ]
+    # Frites qui dépassent du paquet
+    for fx, fy in ((-20, -h // 2 + 10), (-5, -h // 2 + 5), (10, -h // 2 + 12), (25, -h // 2 + 8)):
+        shapes.append((rect(fx - 3, fy, fx + 3, fy + 25), FRITE_COLOR, FRITE_SHADOW, 1, False))
+        shapes.append((rect(fx - 3, fy, fx + 3, fy + 5), FRITE_SHADOW, None, 0, False))
+    return shapes
+
+
+def frite_shapes(width, height, rotation):
+    """Formes d'une frite qui tombe, (0, 0) en haut au centre, tournée autour de son milieu"""
+    half = width // 2
+    body = [(-half, 0), (half, 0), (half - 2, height), (-half + 2, height)]
+    tip = rect(-half, 0, half, 8)
+    return [
+        (rotate(body, rotation, 0, height / 2), FRITE_COLOR, FRITE_SHADOW, 1, False),
+        (rotate(tip, rotation, 0, height / 2), FRITE_SHADOW, None, 0, False),
+    ]
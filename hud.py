@@ -0,0 +1,33 @@
+class Hud:
+    """Valeurs d'interface notées pendant la simulation, écrites au plus une fois par frame"""
+
+    def __init__(self):
+        self.writers = {}  # Nom -> fonction qui écrit la valeur dans le widget
+        self.values = {}
+        self.dirty = {}  # Champs modifiés depuis le dernier flush (dict ordonné)
+        self.writes = 0  # Écritures réellement faites dans Tk
+
+    def add(self, name, writer, value=None):
+        """Déclare un champ ; il sera écrit au prochain flush"""
+        self.writers[name] = writer
+        self.values[name] = value
+        self.dirty[name] = True
+
+    def set(self, name, value):
+        """Note la nouvelle valeur sans toucher aux widgets"""
+        if self.values[name] != value:
+            self.values[name] = value
+            self.dirty[name] = True
+
+    def invalidate(self, name):
+        """Force la réécriture du champ (widget recréé)"""
+        self.dirty[name] = True
+
+    def flush(self):
+        """Écrit les champs modifiés, une seule fois chacun"""
+        if not self.dirty:
+            return
+        for name in self.dirty:
+            self.writers[name](self.values[name])
+        self.writes += len(self.dirty)
+        self.dirty.clear()
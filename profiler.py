@@ -0,0 +1,124 @@
+import csv
+import json
+import os
+import time
+from collections import deque
+
+# Nombre de frames gardées pour les percentiles glissants
+WINDOW = 300
+OVERLAY_REFRESH = 10  # frames entre deux rafraîchissements de l'overlay
+RECORD_EVERY = 100  # frames entre deux lignes de métriques
+HISTORY = 100  # Dernières lignes de métriques gardées en mémoire, le fichier garde tout
+METRICS_ENV = "GAME_METRICS"  # Chemin .csv ou .json (un objet JSON par ligne) pour l'enregistrement
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+class FrameProfiler:
+    """Temps de chaque phase de la boucle (perf_counter_ns), overlay et export p50/p99"""
+
+    def __init__(self, canvas, phases, record_path=None, window=WINDOW, history=HISTORY):
+        self.canvas = canvas
+        self.phases = phases
+        self.samples = {name: deque(maxlen=window) for name in phases}
+        self.frame_samples = deque(maxlen=window)
+        self.current = dict.fromkeys(phases, 0)  # Durées cumulées de la frame en cours
+        self.frames = 0
+        self.tk_calls = 0  # Appels Tk de la dernière frame, fournis par le jeu
+        self.item_count = 0
+        self.overlay_item = None
+        self.overlay = False
+        self.record_path = record_path or os.environ.get(METRICS_ENV)
+        self.rows = deque(maxlen=history)
+        self.recorded = 0  # Lignes écrites dans le fichier pendant la session
+        self.started = time.perf_counter_ns()
+
+    @staticmethod
+    def now():
+        return time.perf_counter_ns()
+
+    def lap(self, phase, start):
+        """Ajoute le temps écoulé depuis start à la phase, renvoie l'instant courant"""
+        end = time.perf_counter_ns()
+        self.current[phase] += end - start
+        return end
+
+    def end_frame(self, tk_calls=0):
+        """Clôt la frame : enregistre les durées et rafraîchit overlay / métriques"""
+        total = 0
+        for name, duration in self.current.items():
+            self.samples[name].append(duration)
+            total += duration
+            self.current[name] = 0
+        self.frame_samples.append(total)
+        self.tk_calls = tk_calls
+        self.frames += 1
+
+        if self.overlay and self.frames % OVERLAY_REFRESH == 0:
+            self.draw_overlay()
+        if self.record_path and self.frames % RECORD_EVERY == 0:
+            self.record()
+
+    def summary(self):
+        """p50/p99 en millisecondes par phase et pour la frame entière"""
+        result = {}
+        for name, values in list(self.samples.items()) + [("frame", self.frame_samples)]:
+            ordered = sorted(values)
+            result[name] = (percentile(ordered, 0.5) / 1e6, percentile(ordered, 0.99) / 1e6)
+        return result
+
+    def toggle_overlay(self, event=None):
+        self.overlay = not self.overlay
+        if self.overlay:
+            self.draw_overlay()
+        elif self.overlay_item is not None:
+            self.canvas.itemconfig(self.overlay_item, state="hidden")
+
+    def reset_overlay(self):
+        """Oublie l'overlay (après un canvas.delete("all"))"""
+        self.overlay_item = None
+        if self.overlay:
+            self.draw_overlay()
+
+    def draw_overlay(self):
+        self.item_count = len(self.canvas.find_all())
+        lines = [f"{name:<9} p50 {p50:6.2f}  p99 {p99:6.2f} ms"
+                 for name, (p50, p99) in self.summary().items()]
+        lines.append(f"objets {self.item_count}  appels Tk {self.tk_calls}/frame")
+        text = "\n".join(lines)
+        if self.overlay_item is None:
+            self.overlay_item = self.canvas.create_text(
+                8, 8, anchor="nw", font=("Courier", 9), fill="#fff", tags="profiler"
+            )
+        self.canvas.itemconfig(self.overlay_item, text=text, state="normal")
+        self.canvas.tag_raise(self.overlay_item)
+
+    def record(self):
+        """Ajoute une ligne de métriques au fichier, complété sans être relu ni réécrit"""
+        self.item_count = len(self.canvas.find_all())
+        row = {
+            "time_s": round((time.perf_counter_ns() - self.started) / 1e9, 3),
+            "frames": self.frames,
+            "items": self.item_count,
+            "tk_calls": self.tk_calls,
+        }
+        for name, (p50, p99) in self.summary().items():
+            row[f"{name}_p50_ms"] = round(p50, 4)
+            row[f"{name}_p99_ms"] = round(p99, 4)
+        self.rows.append(row)
+
+        # Fichier recréé à la première ligne de la session, complété ensuite
+        first = self.recorded == 0
+        self.recorded += 1
+        with open(self.record_path, "w" if first else "a", newline="") as f:
+            if self.record_path.endswith(".json"):
+                f.write(json.dumps(row) + "\n")
+            else:
+                writer = csv.DictWriter(f, fieldnames=list(row))
+                if first:
+                    writer.writeheader()
+                writer.writerow(row)
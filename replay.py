@@ -0,0 +1,313 @@
+import copy
+import os
+import random
+import struct
+import zlib
+
+from frites_sim import FritesSim, CATCH_MARGIN
+from snake_engine import SnakeEngine, DIRECTIONS
+
+# Format : en-tête fixe puis événements (écart de tick, valeur) en varints compressés
+MAGIC = b"RPLY"
+VERSION = 3  # Monte aussi quand le tirage de la nourriture change : seule la graine est gardée
+HEADER = struct.Struct(">4sBBQIII")  # magic, version, jeu, graine, nombre de ticks, largeur, hauteur
+SNAKE, FRITES = 0, 1
+KEYFRAME_INTERVAL = 500  # ticks entre deux instantanés pendant la lecture
+REPLAY_ENV = "GAME_REPLAYS"  # Dossier où enregistrer les parties terminées
+
+
+def new_seed():
+    return random.randrange(2 ** 32)
+
+
+def write_varint(out, value):
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class Replay:
+    """Partie enregistrée : graine + entrées qui changent, rien d'autre"""
+
+    def __init__(self, game, seed, ticks=0, events=None, width=0, height=0):
+        self.game = game
+        self.seed = seed
+        self.ticks = ticks
+        self.events = events if events is not None else []  # (tick, valeur), ticks croissants
+        self.width = width  # Monde du Snake (0 pour les frites, de taille fixe)
+        self.height = height
+
+    def encode(self):
+        body = bytearray()
+        previous = 0
+        for tick, value in self.events:
+            write_varint(body, tick - previous)
+            write_varint(body, value)
+            previous = tick
+        header = HEADER.pack(MAGIC, VERSION, self.game, self.seed, self.ticks, self.width, self.height)
+        return header + zlib.compress(body, 9)
+
+    @classmethod
+    def decode(cls, data):
+        # Version lue avant l'en-tête : celui d'une ancienne version est plus court
+        if data[:4] != MAGIC or data[4:5] != bytes([VERSION]):
+            raise ValueError("Fichier de replay invalide")
+        _, _, game, seed, ticks, width, height = HEADER.unpack_from(data)
+        body = zlib.decompress(data[HEADER.size:])
+        events = []
+        pos = tick = 0
+        while pos < len(body):
+            delta, pos = read_varint(body, pos)
+            value, pos = read_varint(body, pos)
+            tick += delta
+            events.append((tick, value))
+        return cls(game, seed, ticks, events, width, height)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.encode())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.decode(f.read())
+
+
+def save_session(replay, directory=None):
+    """Écrit la partie dans le dossier de GAME_REPLAYS (si défini), renvoie le chemin"""
+    directory = directory or os.environ.get(REPLAY_ENV)
+    if not directory or not replay.ticks:
+        return None
+    os.makedirs(directory, exist_ok=True)
+    name = "snake" if replay.game == SNAKE else "frites"
+    path = os.path.join(directory, f"{name}-{replay.seed}.rpl")
+    replay.save(path)
+    return path
+
+
+class SnakeRecorder:
+    """Joue les ticks du moteur et note les changements de direction"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.replay = None
+        self.saved = False
+
+    def start(self, seed=None):
+        """Nouvelle partie avec une graine connue"""
+        seed = new_seed() if seed is None else seed
+        self.engine.reset(seed)
+        self.replay = Replay(SNAKE, seed, width=self.engine.width, height=self.engine.height)
+        self.saved = False
+
+    def step(self):
+        engine = self.engine
+        # Direction demandée depuis le tick précédent
+        if engine.next_direction != engine.direction and not engine.game_over:
+            self.replay.events.append((engine.ticks, DIRECTIONS.index(engine.next_direction)))
+        result = engine.step()
+        self.replay.ticks = engine.ticks
+        return result
+
+    def finish(self):
+        """Enregistre la partie une seule fois (fin de partie ou redémarrage)"""
+        if self.saved or self.replay is None:
+            return None
+        self.saved = True
+        return save_session(self.replay)
+
+
+class FritesRecorder:
+    """Joue les frames de la simulation et note touches et cible du paquet"""
+
+    def __init__(self, sim):
+        self.sim = sim
+        self.replay = None
+        self.saved = False
+        self.flags = 0
+        self.expected_x = None  # Cible laissée par la frame précédente
+
+    def start(self, seed=None):
+        seed = new_seed() if seed is None else seed
+        self.sim.reset(seed)
+        self.replay = Replay(FRITES, seed)
+        self.saved = False
+        self.flags = 0
+        self.expected_x = self.sim.paquet.target_x
+
+    def step(self, left=False, right=False):
+        sim = self.sim
+        if not sim.game_over:
+            # Valeur = touches (2 bits) + cible souris + 1 (0 = cible inchangée)
+            flags = bool(left) | bool(right) << 1
+            target_x = sim.paquet.target_x
+            value = flags
+            if target_x != self.expected_x:
+                # Cible au pixel près, arrondie aussi pour la partie en cours
+                target_x = sim.paquet.target_x = round(target_x)
+                value |= (target_x + 1) << 2
+            if value != self.flags or value >> 2:
+                self.replay.events.append((sim.frame_count, value))
+            self.flags = flags
+        events = sim.step(left, right)
+        self.expected_x = sim.paquet.target_x
+        self.replay.ticks = sim.frame_count
+        return events
+
+    def finish(self):
+        if self.saved or self.replay is None:
+            return None
+        self.saved = True
+        return save_session(self.replay)
+
+
+class Player:
+    """Rejoue une partie sans affichage, avec saut à n'importe quel tick
+
+    Un instantané est gardé tous les KEYFRAME_INTERVAL ticks : revenir en arrière
+    repart du plus proche au lieu de rejouer depuis le début.
+    """
+
+    def __init__(self, replay, keyframe_interval=KEYFRAME_INTERVAL):
+        self.replay = replay
+        self.keyframe_interval = keyframe_interval
+        if replay.game == SNAKE:
+            self.core = SnakeEngine(replay.width, replay.height, seed=replay.seed)
+            self.copy = SnakeEngine.clone
+        else:
+            self.core = FritesSim(replay.seed)
+            self.copy = copy.deepcopy
+        self.tick = 0
+        self.index = 0  # Prochain événement à appliquer
+        self.flags = 0  # Touches maintenues (frites)
+        self.keyframes = [(0, 0, 0, self.copy(self.core))]
+
+    def advance(self, count):
+        """Avance de count ticks (sans dépasser la fin de la partie)"""
+        end = min(self.replay.ticks, self.tick + count)
+        events = self.replay.events
+        core, index, flags = self.core, self.index, self.flags
+        snake = self.replay.game == SNAKE
+        interval = self.keyframe_interval
+        tick = self.tick
+        while tick < end:
+            value = None
+            if index < len(events) and events[index][0] == tick:
+                value = events[index][1]
+                index += 1
+            if snake:
+                core.step(None if value is None else DIRECTIONS[value])
+            else:
+                if value is not None:
+                    flags = value & 3
+                    if value >> 2:
+                        core.paquet.target_x = (value >> 2) - 1
+                core.step(flags & 1, flags & 2)
+            tick += 1
+            if tick % interval == 0 and tick > self.keyframes[-1][0]:
+                self.keyframes.append((tick, index, flags, self.copy(core)))
+        self.tick, self.index, self.flags = tick, index, flags
+        return core
+
+    def seek(self, tick):
+        """Place la partie au tick demandé et renvoie le moteur / la simulation"""
+        tick = max(0, min(tick, self.replay.ticks))
+        if tick < self.tick or tick - self.tick > self.keyframe_interval:
+            # Instantané le plus proche avant la cible, copié pour rester intact
+            for start, index, flags, state in reversed(self.keyframes):
+                if start <= tick:
+                    break
+            if start > self.tick or tick < self.tick:
+                self.core = self.copy(state)
+                self.tick, self.index, self.flags = start, index, flags
+        return self.advance(tick - self.tick)
+
+    def play(self):
+        """Rejoue jusqu'à la fin"""
+        return self.advance(self.replay.ticks - self.tick)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    if len(sys.argv) > 1:
+        # Lecture d'un fichier : python replay.py partie.rpl [tick]
+        replay = Replay.load(sys.argv[1])
+        player = Player(replay)
+        start = time.perf_counter()
+        core = player.seek(int(sys.argv[2])) if len(sys.argv) > 2 else player.play()
+        elapsed = time.perf_counter() - start
+        print(f"tick {player.tick}/{replay.ticks}, score {core.score}, "
+              f"{player.tick / max(elapsed, 1e-9):,.0f} ticks/s")
+        sys.exit()
+
+    # 10 minutes de jeu par des robots (parties enchaînées), enregistrées puis relues
+    def snake_bot(engine):
+        """Va vers la nourriture en évitant les cases fatales immédiates"""
+        head_x, head_y = engine.snake[0]
+        food_x, food_y = engine.food_pos
+        choices = sorted(DIRECTIONS, key=lambda d: abs(head_x + d[0] - food_x) + abs(head_y + d[1] - food_y))
+        for d in choices:
+            x, y = head_x + d[0], head_y + d[1]
+            if 0 <= x < engine.width and 0 <= y < engine.height and (x, y) not in engine.snake:
+                engine.change_direction(d)
+                return
+
+    def frites_bot(sim):
+        """Suit à la souris la plus basse des frites encore attrapables"""
+        limit = sim.paquet.get_catch_rect()[3] + CATCH_MARGIN
+        lowest = max((f for f in sim.frites if f.y <= limit), key=lambda f: f.y, default=None)
+        if lowest is not None and abs(sim.paquet.target_x - lowest.x) > 10:
+            sim.paquet.move_to(int(lowest.x))
+
+    for name, recorder, bot, session in (
+        ("snake", SnakeRecorder(SnakeEngine()), snake_bot, 10 * 60 * 1000 // 150),
+        ("frites", FritesRecorder(FritesSim()), frites_bot, 10 * 60 * 1000 // 30),
+    ):
+        core = recorder.engine if name == "snake" else recorder.sim
+        played = size = events = 0
+        replay_time = seek_time = 0
+        seed = 0
+        while played < session:
+            recorder.start(seed)
+            while not core.game_over and played + recorder.replay.ticks < session:
+                bot(core)
+                if name == "snake":
+                    recorder.step()
+                else:
+                    i = core.frame_count
+                    recorder.step(left=i % 400 < 20, right=200 <= i % 400 < 220)
+            data = recorder.replay.encode()
+
+            start = time.perf_counter()
+            player = Player(Replay.decode(data))
+            replayed = player.play()
+            replay_time += time.perf_counter() - start
+            assert replayed.score == core.score and player.tick == recorder.replay.ticks
+            if name == "frites":
+                assert [f.x for f in replayed.frites] == [f.x for f in core.frites]
+
+            start = time.perf_counter()
+            player.seek(player.tick // 3)
+            seek_time = max(seek_time, time.perf_counter() - start)
+
+            played += recorder.replay.ticks
+            size += len(data)
+            events += len(recorder.replay.events)
+            seed += 1
+        print(f"{name:<6}: {played} ticks en {seed} parties, {events} entrées, {size} octets, "
+              f"relu en {replay_time * 1000:.0f} ms ({played / replay_time:,.0f} ticks/s), "
+              f"saut arrière max {seek_time * 1000:.1f} ms")
@@ -0,0 +1,87 @@
+from collections import OrderedDict
+
+RESIZE_DELAY = 150  # ms sans nouvel événement <Configure> avant de redessiner
+SCALE_STEP = 1 / 8  # Échelles arrondies : peu de variantes d'images à garder
+MIN_SCALE = 0.5
+
+
+class LruCache:
+    """Dictionnaire borné : au-delà de maxsize, l'entrée lue il y a le plus longtemps est oubliée"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build):
+        """Valeur de key, construite par build() au premier accès"""
+        entries = self.entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+        self.misses += 1
+        value = entries[key] = build()
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        return value
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        self.entries.clear()
+
+
+def quantize(scale):
+    return max(MIN_SCALE, round(scale / SCALE_STEP) * SCALE_STEP)
+
+
+class ResizeWatcher:
+    """Échelle du canvas d'après la taille de la fenêtre, recalculée une fois le redimensionnement fini
+
+    Chaque <Configure> de la fenêtre repousse le calcul de delay ms : un
+    redimensionnement à la souris ne provoque qu'un seul redessin, à la fin.
+    on_scale(scale) n'est appelé que si l'échelle arrondie change.
+    """
+
+    def __init__(self, root, canvas, base_width, base_height, on_scale, delay=RESIZE_DELAY):
+        self.root = root
+        self.canvas = canvas
+        self.base_width = base_width
+        self.base_height = base_height
+        self.on_scale = on_scale
+        self.delay = delay
+        self.scale = 1.0
+        self.size = None
+        self.chrome = None  # Place prise autour du canvas (marges, labels), mesurée à l'échelle 1
+        self.after_id = None
+        self.events = 0  # <Configure> reçus
+        self.rescales = 0  # Redessins déclenchés
+        root.bind("<Configure>", self.on_configure, add="+")
+
+    def on_configure(self, event):
+        if event.widget is not self.root:
+            return  # Les widgets enfants remontent aussi leurs <Configure>
+        self.events += 1
+        self.size = (event.width, event.height)
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+        self.after_id = self.root.after(self.delay, self.apply)
+
+    def apply(self):
+        self.after_id = None
+        if self.chrome is None:
+            self.chrome = (self.root.winfo_reqwidth() - int(self.canvas.cget("width")),
+                           self.root.winfo_reqheight() - int(self.canvas.cget("height")))
+        width, height = self.size
+        scale = quantize(min((width - self.chrome[0]) / self.base_width,
+                             (height - self.chrome[1]) / self.base_height))
+        if scale != self.scale:
+            self.scale = scale
+            self.rescales += 1
+            self.on_scale(scale)
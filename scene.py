@@ -0,0 +1,115 @@
+class Scene:
+    """Couche de dessin en mode retenu au-dessus d'un canvas Tk
+
+    Chaque frame décrit ses objets entre begin() et end(), repérés par une clé
+    stable. end() compare avec la frame précédente et n'envoie que les appels
+    nécessaires : coords ou itemconfig pour ce qui a changé, création pour les
+    nouvelles clés. Les objets disparus sont cachés puis réutilisés par les
+    nouvelles clés de même type, au lieu d'être supprimés et recréés.
+    """
+
+    def __init__(self, canvas, tag=None, raise_on_show=False):
+        self.canvas = canvas
+        self.tag = tag  # Ajouté aux objets de la couche
+        self.raise_on_show = raise_on_show  # Remonter la couche quand un objet apparaît
+        self.items = {}  # Clé -> [id, coords, options, type + noms d'options]
+        self.frame = {}  # Clé -> (type, coords, options) décrits depuis begin()
+        self.pool = {}  # Type + noms d'options -> objets cachés réutilisables
+        self.tk_calls = 0  # Appels Tk depuis le début
+        self.frame_calls = 0  # Appels Tk du dernier end()
+
+    def reset(self):
+        """Oublie les objets dessinés (après un canvas.delete("all"))"""
+        self.items.clear()
+        self.frame.clear()
+        self.pool.clear()
+
+    def item_count(self):
+        """Nombre d'objets du canvas tenus par la couche, cachés compris"""
+        return len(self.items) + sum(len(items) for items in self.pool.values())
+
+    def begin(self):
+        self.frame.clear()
+
+    def add(self, kind, key, coords, options):
+        self.frame[key] = (kind, coords, options)
+
+    def rectangle(self, key, *coords, **options):
+        self.frame[key] = ("rectangle", coords, options)
+
+    def oval(self, key, *coords, **options):
+        self.frame[key] = ("oval", coords, options)
+
+    def text(self, key, *coords, **options):
+        self.frame[key] = ("text", coords, options)
+
+    def image(self, key, *coords, **options):
+        self.frame[key] = ("image", coords, options)
+
+    def clear(self):
+        """Cache tous les objets de la couche"""
+        self.begin()
+        return self.end()
+
+    def tags(self, tags):
+        """Étiquettes demandées + celle de la couche"""
+        if not self.tag:
+            return tags
+        return (tags, self.tag) if isinstance(tags, str) else (*tags, self.tag)
+
+    def end(self):
+        """Applique les différences avec la frame précédente, renvoie le nombre d'appels Tk"""
+        canvas, items, frame, pool = self.canvas, self.items, self.frame, self.pool
+        calls = 0
+        shown = False
+
+        # Clés disparues : objets rendus à la réserve, cachés plus bas s'ils ne resservent pas
+        released = {}
+        for key in [key for key in items if key not in frame]:
+            item = items.pop(key)
+            pool.setdefault(item[3], []).append(item)
+            released[item[0]] = item
+
+        for key, (kind, coords, options) in frame.items():
+            item = items.get(key)
+            config = options
+            if item is None:
+                shape = (kind, tuple(sorted(options)))
+                reusable = pool.get(shape)
+                if not reusable:
+                    create = getattr(canvas, "create_" + kind)
+                    item_id = create(*coords, **{**options, "tags": self.tags(options.get("tags", ()))})
+                    items[key] = [item_id, coords, options, shape]
+                    calls += 1
+                    shown = True
+                    continue
+                item = items[key] = reusable.pop()
+                if released.pop(item[0], None) is None:
+                    # Objet caché lors d'une frame précédente
+                    config = {**options, "state": "normal"}
+                    shown = True
+
+            if item[1] != coords:
+                canvas.coords(item[0], *coords)
+                item[1] = coords
+                calls += 1
+            previous = item[2]
+            if previous != config:
+                changed = {name: value for name, value in config.items() if previous.get(name) != value}
+                if "tags" in changed:
+                    changed["tags"] = self.tags(changed["tags"])
+                canvas.itemconfig(item[0], **changed)
+                item[2] = options
+                calls += 1
+
+        for item in released.values():
+            canvas.itemconfig(item[0], state="hidden")
+            calls += 1
+
+        if shown and self.raise_on_show and self.tag:
+            canvas.tag_raise(self.tag)
+            calls += 1
+
+        self.tk_calls += calls
+        self.frame_calls = calls
+        return calls
@@ -0,0 +1,109 @@
+import time
+
+# Nombre maximal de mises à jour enchaînées pour rattraper un retard
+MAX_CATCH_UP = 5
+
+
+class FixedStepScheduler:
+    """Boucle à pas fixe sur root.after : la simulation garde sa cadence même si le dessin rame"""
+
+    def __init__(self, root, step_ms, update, render, max_catch_up=MAX_CATCH_UP,
+                 clock=time.perf_counter):
+        self.root = root
+        self.step = step_ms / 1000
+        self.update = update  # Renvoie False pour arrêter la boucle
+        self.render = render
+        self.max_catch_up = max_catch_up
+        self.clock = clock
+        self.after_id = None
+        self.running = False
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Remet à zéro les statistiques de cadence"""
+        self.ticks = 0  # Réveils de la boucle
+        self.updates = 0
+        self.renders = 0
+        self.skipped_renders = 0  # Mises à jour non suivies d'un dessin
+        self.dropped_steps = 0  # Retard abandonné au-delà de max_catch_up
+        # Écart entre réveil prévu et réel (moyenne/variance de Welford)
+        self.late_count = 0
+        self.late_mean = 0.0
+        self.late_m2 = 0.0
+        self.late_max = 0.0
+
+    def start(self):
+        """Démarre (ou redémarre) la boucle, la première mise à jour est immédiate"""
+        self.stop()
+        self.running = True
+        self.accumulator = self.step
+        self.last_time = self.clock()
+        self.deadline = self.last_time
+        self.tick()
+
+    def stop(self):
+        """Arrête la boucle et annule le réveil en attente"""
+        self.running = False
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+
+    def tick(self):
+        self.after_id = None
+        if not self.running:
+            return
+
+        now = self.clock()
+        self.record_lateness(now - self.deadline)
+        self.accumulator += now - self.last_time
+        self.last_time = now
+        self.ticks += 1
+
+        # Rattraper le temps écoulé par pas fixes
+        steps = 0
+        while self.accumulator >= self.step:
+            if steps == self.max_catch_up:
+                # Trop de retard : on abandonne le reste plutôt que de spiraler
+                dropped = int(self.accumulator // self.step)
+                self.dropped_steps += dropped
+                self.accumulator -= dropped * self.step
+                break
+            self.accumulator -= self.step
+            steps += 1
+            self.updates += 1
+            if self.update() is False:
+                self.running = False
+                return
+
+        # Un seul dessin par réveil, même après plusieurs mises à jour
+        if steps:
+            self.render()
+            self.renders += 1
+            self.skipped_renders += steps - 1
+
+        # Prochain réveil calé sur la grille des pas, pas sur la durée du travail
+        remaining = self.step - self.accumulator
+        self.deadline = now + remaining
+        delay = max(0, round((self.deadline - self.clock()) * 1000))
+        self.after_id = self.root.after(delay, self.tick)
+
+    def record_lateness(self, late):
+        self.late_count += 1
+        delta = late - self.late_mean
+        self.late_mean += delta / self.late_count
+        self.late_m2 += delta * (late - self.late_mean)
+        self.late_max = max(self.late_max, late)
+
+    def stats(self):
+        """Statistiques de cadence (retards en millisecondes)"""
+        variance = self.late_m2 / self.late_count if self.late_count else 0.0
+        return {
+            "ticks": self.ticks,
+            "updates": self.updates,
+            "renders": self.renders,
+            "skipped_renders": self.skipped_renders,
+            "dropped_steps": self.dropped_steps,
+            "late_mean_ms": self.late_mean * 1000,
+            "jitter_ms": variance ** 0.5 * 1000,
+            "late_max_ms": self.late_max * 1000,
+        }
@@ -1,33 +1,309 @@
 import tkinter as tk
-import random
-from collections import deque
+
+from autopilot import PILOTS
+from camera import Camera
+from hud import Hud
+from profiler import FrameProfiler
+from replay import SnakeRecorder
+from scaling import LruCache, ResizeWatcher
+from scene import Scene
+from scheduler import FixedStepScheduler
+from snake_engine import SnakeEngine, DIRECTIONS, UP, DOWN, LEFT, RIGHT
+from snake_style import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, GRID_SIZE, GRID_WIDTH, GRID_HEIGHT,
+    BG_COLOR, BG_COLOR_ALT, SNAKE_HEAD, SNAKE_BODY, FOOD_COLOR, TEXT_COLOR, ACCENT_COLOR,
+    FOOD_SHINE, EYE_COLOR, OTHER_HEAD, OTHER_BODY, EYE_OFFSETS, EYE_SIZE,
+)
 
 # Constantes
-WINDOW_WIDTH = 600
-WINDOW_HEIGHT = 600
-GRID_SIZE = 20
-GRID_WIDTH = WINDOW_WIDTH // GRID_SIZE
-GRID_HEIGHT = WINDOW_HEIGHT // GRID_SIZE
+WORLD_WIDTH = GRID_WIDTH  # Monde par défaut : l'écran entier, la caméra ne bouge pas
+WORLD_HEIGHT = GRID_HEIGHT
 GAME_SPEED = 150  # ms entre chaque mouvement
+POLL_SPEED = 15  # ms entre deux lectures du réseau (client d'un serveur)
+
+
+# Damiers déjà rendus, réutilisés d'une partie à l'autre et d'une échelle à l'autre.
+# Quelques tailles seulement : une image plein écran pèse plusieurs Mo
+_checkerboards = LruCache(4)
+
+
+def checkerboard_image(cols, rows, cell):
+    """Rend le damier une fois dans une PhotoImage, tuilé par Tk lui-même"""
+    def build():
+        tile = tk.PhotoImage(width=2, height=2)
+        tile.put(f"{{{BG_COLOR_ALT} {BG_COLOR}}} {{{BG_COLOR} {BG_COLOR_ALT}}}")
+        tile = tile.zoom(cell, cell)
+        image = tk.PhotoImage(width=cols * cell, height=rows * cell)
+        # "copy -to" répète la tuile 2x2 cases sur toute l'image
+        image.tk.call(image, "copy", tile, "-to", 0, 0, cols * cell, rows * cell)
+        return image
+    return _checkerboards.get((cols, rows, cell), build)
+
+
+def cell_rect(x, y, margin, size=GRID_SIZE):
+    """Rectangle en pixels d'une case de la grille (marge donnée pour des cases de GRID_SIZE)"""
+    margin = margin * size / GRID_SIZE
+    return (
+        x * size + margin,
+        y * size + margin,
+        (x + 1) * size - margin,
+        (y + 1) * size - margin
+    )
+
+
+def eye_rects(x, y, direction, size=GRID_SIZE):
+    """Ovales des deux yeux de la tête en (x, y) à l'écran"""
+    k = size / GRID_SIZE
+    radius = EYE_SIZE * k
+    return [
+        (x * size + dx * k - radius, y * size + dy * k - radius,
+         x * size + dx * k + radius, y * size + dy * k + radius)
+        for dx, dy in EYE_OFFSETS[direction]
+    ]
+
+
+def food_rects(x, y, size=GRID_SIZE):
+    """Ovales de la nourriture et de son reflet en (x, y) à l'écran"""
+    k = size / GRID_SIZE
+    return [
+        cell_rect(x, y, 3, size),
+        (x * size + 6 * k, y * size + 6 * k, x * size + 10 * k, y * size + 10 * k),
+    ]
+
+
+class SnakeRenderer:
+    """Dessin incrémental limité à la caméra : seules les cases visibles ont un objet
+
+    Les rectangles sont rangés par case du monde ; une case qui sort de l'écran
+    rend le sien, caché, à la réserve. Le coût d'un tick ne dépend ni de la
+    taille du monde ni de la longueur du serpent.
+    """
+
+    def __init__(self, canvas, camera):
+        self.canvas = canvas
+        self.camera = camera
+        self.cell = GRID_SIZE  # Taille d'une case à l'écran, suit l'échelle de la fenêtre
+        self.items = {}  # Case du monde -> rectangle
+        self.released = []  # Rectangles libérés pendant ce dessin, encore affichés
+        self.spare = []  # Rectangles cachés, réutilisables
+        self.length = 0
+        self.head = None  # Case de la tête au dernier dessin
+        self.tail = None
+        self.head_pos = None
+        self.eyes = ()
+        self.food_items = ()
+        self.food_pos = None
+        self.ticks = None  # Tick du moteur au dernier dessin
+        self.tk_calls = 0  # Appels Tk depuis le début
+        self.frame_calls = 0  # Appels Tk du dernier dessin
+
+    def reset(self):
+        """Oublie les objets dessinés (après un canvas.delete("all"))"""
+        self.items.clear()
+        self.released.clear()
+        self.spare.clear()
+        self.length = 0
+        self.head = self.tail = None
+        self.head_pos = None
+        self.eyes = ()
+        self.food_items = ()
+        self.food_pos = None
+        self.ticks = None
+
+    def item_count(self):
+        """Nombre d'objets du canvas tenus par le dessin"""
+        return len(self.items) + len(self.spare) + len(self.eyes) + len(self.food_items)
+
+    def draw(self, engine):
+        """Met à jour le dessin : nombre d'appels Tk constant par tick, hors défilement"""
+        calls = self.tk_calls
+        snake = engine.snake
+        head, tail, width = snake.head_cell(), snake.tail_cell(), engine.width
+        camera = self.camera
+        dx, dy = camera.follow(head % width, head // width)
+
+        if not self.eyes or engine.ticks != self.ticks + 1 or \
+                len(snake) not in (self.length, self.length + 1) or \
+                abs(dx) >= camera.cols or abs(dy) >= camera.rows:
+            self.rebuild(engine)
+        else:
+            if dx or dy:
+                self.scroll(engine, dx, dy)
+            previous = self.items.get(self.head)
+            if previous is not None:
+                self.canvas.itemconfig(previous, fill=SNAKE_BODY)
+                self.tk_calls += 1
+            if len(snake) == self.length:
+                # Le serpent avance : la case de queue se libère
+                self.release(self.tail)
+            self.show(head, SNAKE_HEAD, width)
+            self.hide_released()
+
+        self.length, self.head, self.tail = len(snake), head, tail
+        head_pos = (head % width - camera.left, head // width - camera.top)
+        # Les yeux glissent avec le tag "snake" : les replacer aussi après un défilement
+        if head_pos != self.head_pos or dx or dy:
+            self.head_pos = head_pos
+            self.move_eyes(head_pos, engine.direction)
+        if engine.food_pos != self.food_pos or dx or dy:
+            self.move_food(engine.food_pos)
+
+        self.ticks = engine.ticks
+        self.frame_calls = self.tk_calls - calls
+
+    def rebuild(self, engine):
+        """Recrée les objets des cases visibles (début de partie, saut de la caméra)"""
+        self.canvas.delete("snake", "food")
+        self.tk_calls += 1
+        self.reset()
+        camera, width = self.camera, engine.width
+        snake = engine.snake
 
-# Couleurs
-BG_COLOR = "#1a1a2e"
-BG_COLOR_ALT = "#16213e"
-SNAKE_HEAD = "#0f3460"
-SNAKE_BODY = "#16a085"
-FOOD_COLOR = "#e94560"
-TEXT_COLOR = "#eee"
-ACCENT_COLOR = "#f39c12"
-
-# Directions
-UP = (0, -1)
-DOWN = (0, 1)
-LEFT = (-1, 0)
-RIGHT = (1, 0)
+        self.food_items = (
+            self.canvas.create_oval(0, 0, 0, 0, fill=FOOD_COLOR, outline="", tags="food"),
+            # Reflet
+            self.canvas.create_oval(0, 0, 0, 0, fill=FOOD_SHINE, outline="", tags="food")
+        )
+        self.tk_calls += 2
+
+        # Saut de la caméra : la tête repart du centre de l'écran
+        self.head = snake.head_cell()
+        camera.center(self.head % width, self.head // width)
+        self.place_background()
+        self.move_food(engine.food_pos)  # Après center : position relative à la caméra
+        for cell in camera.cells(snake.occupied, camera.left, camera.left + camera.cols,
+                                 camera.top, camera.top + camera.rows):
+            self.show(cell, SNAKE_HEAD if cell == self.head else SNAKE_BODY, width)
+
+        self.eyes = tuple(
+            self.canvas.create_oval(0, 0, 0, 0, fill=EYE_COLOR, tags=("snake", "eyes"))
+            for _ in range(2)
+        )
+        self.tk_calls += 2
+
+    def scroll(self, engine, dx, dy):
+        """La caméra a bougé : tout glisse d'un coup, puis seules les bandes de bord changent"""
+        camera, width = self.camera, engine.width
+        self.canvas.move("snake", -dx * self.cell, -dy * self.cell)
+        self.tk_calls += 1
+        if (dx + dy) % 2:
+            self.place_background()
+
+        # Cases sorties de l'écran (au plus une surface d'écran d'objets)
+        for cell in [cell for cell in self.items if not camera.visible(cell % width, cell // width)]:
+            self.release(cell)
+
+        # Cases entrées : colonnes nouvelles sur toute la hauteur, puis lignes
+        # nouvelles sur les autres colonnes
+        left, top, cols, rows = camera.left, camera.top, camera.cols, camera.rows
+        if dx > 0:
+            strip, rest = (left + cols - dx, left + cols), (left, left + cols - dx)
+        elif dx < 0:
+            strip, rest = (left, left - dx), (left - dx, left + cols)
+        else:
+            strip, rest = None, (left, left + cols)
+        occupied = engine.snake.occupied
+        entering = camera.cells(occupied, *strip, top, top + rows) if strip else []
+        if dy:
+            lines = (top + rows - dy, top + rows) if dy > 0 else (top, top - dy)
+            entering += camera.cells(occupied, *rest, *lines)
+        head = engine.snake.head_cell()
+        for cell in entering:
+            if cell != head:  # La tête est dessinée par draw()
+                self.show(cell, SNAKE_BODY, width)
+
+    def place_background(self):
+        """Damier décalé d'une case selon la parité de la caméra"""
+        parity = (self.camera.left + self.camera.top) % 2
+        self.canvas.coords("grid", -parity * self.cell, 0)
+        self.tk_calls += 1
+
+    def show(self, cell, color, width):
+        """Donne un rectangle à une case visible, en reprenant d'abord un rectangle libéré"""
+        camera = self.camera
+        x, y = cell % width - camera.left, cell // width - camera.top
+        rect = cell_rect(x, y, 2, self.cell)
+        if self.released:
+            item = self.released.pop()
+            self.canvas.coords(item, *rect)
+            self.canvas.itemconfig(item, fill=color)
+            self.tk_calls += 2
+        elif self.spare:
+            item = self.spare.pop()
+            self.canvas.coords(item, *rect)
+            self.canvas.itemconfig(item, fill=color, state="normal")
+            self.tk_calls += 2
+        else:
+            item = self.canvas.create_rectangle(
+                *rect,
+                fill=color,
+                outline="",
+                tags="snake"
+            )
+            self.tk_calls += 1
+            if self.eyes:
+                self.canvas.tag_raise("eyes")
+                self.tk_calls += 1
+        self.items[cell] = item
+
+    def release(self, cell):
+        """Libère le rectangle d'une case (caché par hide_released s'il ne resert pas)"""
+        item = self.items.pop(cell, None)
+        if item is not None:
+            self.released.append(item)
+
+    def hide_released(self):
+        for item in self.released:
+            self.canvas.itemconfig(item, state="hidden")
+        self.tk_calls += len(self.released)
+        self.spare += self.released
+        self.released.clear()
+
+    def move_eyes(self, head, direction):
+        for item, rect in zip(self.eyes, eye_rects(*head, direction, self.cell)):
+            self.canvas.coords(item, *rect)
+            self.tk_calls += 1
+
+    def move_food(self, food_pos):
+        self.food_pos = food_pos
+        if food_pos is None or not self.camera.visible(*food_pos):
+            # Plateau plein ou nourriture hors de l'écran
+            for item in self.food_items:
+                self.canvas.coords(item, 0, 0, 0, 0)
+            self.tk_calls += len(self.food_items)
+            return
+        x, y = food_pos[0] - self.camera.left, food_pos[1] - self.camera.top
+        for item, rect in zip(self.food_items, food_rects(x, y, self.cell)):
+            self.canvas.coords(item, *rect)
+        self.tk_calls += 2
+
+    def check(self, engine):
+        """Vérifie le canvas contre le moteur : cases visibles, yeux, nourriture (lent, pour les tests)"""
+        canvas, camera, width, cell = self.canvas, self.camera, engine.width, self.cell
+        head = engine.snake.head_cell()
+        visible = set(camera.cells(engine.snake.occupied, camera.left, camera.left + camera.cols,
+                                   camera.top, camera.top + camera.rows))
+        assert set(self.items) == visible, (set(self.items) ^ visible, engine.ticks)
+        for c, item in self.items.items():
+            x, y = c % width - camera.left, c // width - camera.top
+            assert tuple(canvas.coords(item)) == cell_rect(x, y, 2, cell), (c, engine.ticks)
+            assert canvas.itemcget(item, "fill") == (SNAKE_HEAD if c == head else SNAKE_BODY), (c, engine.ticks)
+            assert canvas.itemcget(item, "state") != "hidden", (c, engine.ticks)
+        for item in self.spare:
+            assert canvas.itemcget(item, "state") == "hidden", (item, engine.ticks)
+        if camera.visible(head % width, head // width):
+            hx, hy = head % width - camera.left, head // width - camera.top
+            for item, rect in zip(self.eyes, eye_rects(hx, hy, engine.direction, cell)):
+                assert tuple(canvas.coords(item)) == rect, ("yeux", canvas.coords(item), rect, engine.ticks)
+        food = engine.food_pos
+        if food is not None and camera.visible(*food):
+            rects = food_rects(food[0] - camera.left, food[1] - camera.top, cell)
+            for item, rect in zip(self.food_items, rects):
+                assert tuple(canvas.coords(item)) == rect, ("nourriture", canvas.coords(item), rect, engine.ticks)
 
 
 class SnakeGame:
-    def __init__(self, root):
+    def __init__(self, root, world=(WORLD_WIDTH, WORLD_HEIGHT)):
         self.root = root
         self.root.title("🐍 Snake Game")
         self.root.configure(bg=BG_COLOR)
@@ -41,7 +317,10 @@ class SnakeGame:
 
         # Bindings pour le plein écran
         self.root.bind("<F11>", self.toggle_fullscreen)
+        self.root.bind("<F3>", lambda e: self.profiler.toggle_overlay())
         self.root.bind("<Escape>", self.exit_fullscreen)
+        self.root.bind("a", lambda e: self.toggle_pilot())
+        self.root.bind("A", lambda e: self.toggle_pilot())
 
         # Frame principal
         self.main_frame = tk.Frame(root, bg=BG_COLOR)
@@ -71,22 +350,34 @@ class SnakeGame:
         # Instructions
         self.instructions = tk.Label(
             self.main_frame,
-            text="Flèches pour jouer • ESPACE pour pause • R pour recommencer • F11 pour plein écran",
+            text="Flèches pour jouer • ESPACE pour pause • R pour recommencer • F11 pour plein écran • A pilote auto • F3 profileur",
             font=("Arial", 10),
             bg=BG_COLOR,
             fg=ACCENT_COLOR
         )
         self.instructions.pack(pady=(10, 0))
 
-        # Variables du jeu
-        self.snake = deque()
-        self.direction = RIGHT
-        self.next_direction = RIGHT
-        self.food_pos = None
-        self.score = 0
+        # Variables du jeu (les règles vivent dans le moteur)
+        self.engine = SnakeEngine(*world)
+        self.camera = Camera(GRID_WIDTH, GRID_HEIGHT, *world)
+        self.recorder = SnakeRecorder(self.engine)  # Graine + directions, pour rejouer la partie
+        self.renderer = SnakeRenderer(self.canvas, self.camera)
+        self.screens = Scene(self.canvas, tag="screen", raise_on_show=True)  # Accueil, pause, fin de partie
+        self.hud = Hud()
+        self.hud.add("score", lambda score: self.score_label.config(text=f"Score: {score}"), 0)
+        self.hud.add("pilot", self.write_pilot, None)
+        # Créés au premier usage : leurs grilles suivent la taille du monde (Hamilton exclu des mondes impairs)
+        self.pilots = [None, *(pilot for pilot in PILOTS if pilot.fits(*world))]
+        self.pilot_index = 0
+        self.pilot = None  # Pilote automatique qui choisit la direction à chaque tick
+        self.profiler = FrameProfiler(self.canvas, ("move", "collision", "draw", "hud"))
+        self.engine.profiler = self.profiler
+        self.loop = FixedStepScheduler(root, GAME_SPEED, self.update, self.draw_game)
         self.game_over = False
         self.paused = False
         self.game_started = False
+        self.scale = 1.0  # Échelle du canvas, suit la taille de la fenêtre
+        self.resizer = ResizeWatcher(root, self.canvas, WINDOW_WIDTH, WINDOW_HEIGHT, self.apply_scale)
 
         # Bindings
         self.root.bind("<Up>", lambda e: self.change_direction(UP))
@@ -103,6 +394,22 @@ class SnakeGame:
         # Afficher écran d'accueil
         self.show_start_screen()
 
+    @property
+    def snake(self):
+        return self.engine.snake
+
+    @property
+    def direction(self):
+        return self.engine.direction
+
+    @property
+    def food_pos(self):
+        return self.engine.food_pos
+
+    @property
+    def score(self):
+        return self.engine.score
+
     def toggle_fullscreen(self, event=None):
         """Active/désactive le mode plein écran"""
         self.is_fullscreen = not self.is_fullscreen
@@ -116,54 +423,79 @@ class SnakeGame:
             self.root.attributes("-fullscreen", False)
             return "break"
 
+    def px(self, value):
+        """Position ou taille en pixels à l'échelle courante"""
+        return round(value * self.scale)
+
+    def apply_scale(self, scale):
+        """Redessine tout à la nouvelle échelle (appelé une fois le redimensionnement fini)"""
+        # Cases d'un nombre entier de pixels : le damier et les rectangles restent alignés
+        self.renderer.cell = cell = round(GRID_SIZE * scale)
+        self.scale = cell / GRID_SIZE
+        self.canvas.config(width=GRID_WIDTH * cell, height=GRID_HEIGHT * cell)
+        self.canvas.delete("all")
+        self.renderer.reset()
+        self.screens.reset()
+        self.profiler.reset_overlay()
+        self.draw_grid()
+        if not self.game_started:
+            self.show_start_screen()
+            return
+        self.draw_game()
+        if self.game_over:
+            self.show_game_over()
+        elif self.paused:
+            self.show_pause_screen()
+
     def draw_grid(self):
-        """Dessine la grille en damier"""
-        for row in range(GRID_HEIGHT):
-            for col in range(GRID_WIDTH):
-                x1 = col * GRID_SIZE
-                y1 = row * GRID_SIZE
-                x2 = x1 + GRID_SIZE
-                y2 = y1 + GRID_SIZE
+        """Dessine la grille en damier (une seule image, quelle que soit la taille)
 
-                color = BG_COLOR_ALT if (row + col) % 2 == 0 else BG_COLOR
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="")
+        Une colonne de plus que l'écran : décaler l'image d'une case suit la
+        parité de la caméra sans la redessiner.
+        """
+        camera = self.camera
+        self.background = checkerboard_image(camera.cols + 1, camera.rows, self.renderer.cell)
+        self.canvas.create_image(0, 0, image=self.background, anchor=tk.NW, tags="grid")
 
     def show_start_screen(self):
         """Affiche l'écran de démarrage"""
-        self.canvas.create_text(
-            WINDOW_WIDTH // 2,
-            WINDOW_HEIGHT // 2 - 40,
+        screens = self.screens
+        screens.begin()
+        screens.text(
+            "title",
+            self.px(WINDOW_WIDTH // 2),
+            self.px(WINDOW_HEIGHT // 2 - 40),
             text="🐍 SNAKE GAME 🐍",
-            font=("Arial", 32, "bold"),
-            fill=ACCENT_COLOR,
-            tags="start"
+            font=("Arial", self.px(32), "bold"),
+            fill=ACCENT_COLOR
         )
-        self.canvas.create_text(
-            WINDOW_WIDTH // 2,
-            WINDOW_HEIGHT // 2 + 20,
+        screens.text(
+            "prompt",
+            self.px(WINDOW_WIDTH // 2),
+            self.px(WINDOW_HEIGHT // 2 + 20),
             text="Appuyez sur une flèche pour commencer",
-            font=("Arial", 14),
-            fill=TEXT_COLOR,
-            tags="start"
+            font=("Arial", self.px(14)),
+            fill=TEXT_COLOR
         )
+        screens.end()
 
     def init_game(self):
         """Initialise le jeu"""
-        self.snake = deque([(GRID_WIDTH // 2, GRID_HEIGHT // 2)])
-        self.direction = RIGHT
-        self.next_direction = RIGHT
-        self.score = 0
+        self.recorder.start()
         self.game_over = False
         self.paused = False
         self.game_started = True
         self.update_score()
-        self.spawn_food()
-        self.canvas.delete("start", "gameover", "pause")
+        self.screens.clear()
         self.game_loop()
 
     def restart_game(self):
         """Redémarre le jeu"""
+        self.recorder.finish()
         self.canvas.delete("all")
+        self.renderer.reset()
+        self.screens.reset()
+        self.profiler.reset_overlay()
         self.draw_grid()
         self.init_game()
 
@@ -172,27 +504,31 @@ class SnakeGame:
         if self.game_started and not self.game_over:
             self.paused = not self.paused
             if self.paused:
+                self.loop.stop()
                 self.show_pause_screen()
             else:
-                self.canvas.delete("pause")
+                self.screens.clear()
                 self.game_loop()
 
     def show_pause_screen(self):
         """Affiche l'écran de pause"""
-        overlay = self.canvas.create_rectangle(
-            0, 0, WINDOW_WIDTH, WINDOW_HEIGHT,
+        screens = self.screens
+        screens.begin()
+        screens.rectangle(
+            "overlay",
+            0, 0, self.px(WINDOW_WIDTH), self.px(WINDOW_HEIGHT),
             fill=BG_COLOR,
-            stipple="gray50",
-            tags="pause"
+            stipple="gray50"
         )
-        self.canvas.create_text(
-            WINDOW_WIDTH // 2,
-            WINDOW_HEIGHT // 2,
+        screens.text(
+            "title",
+            self.px(WINDOW_WIDTH // 2),
+            self.px(WINDOW_HEIGHT // 2),
             text="⏸ PAUSE",
-            font=("Arial", 40, "bold"),
-            fill=ACCENT_COLOR,
-            tags="pause"
+            font=("Arial", self.px(40), "bold"),
+            fill=ACCENT_COLOR
         )
+        screens.end()
 
     def change_direction(self, new_direction):
         """Change la direction du serpent"""
@@ -201,169 +537,379 @@ class SnakeGame:
             return
 
         # Empêcher le demi-tour
-        if (new_direction[0] * -1, new_direction[1] * -1) != self.direction:
-            self.next_direction = new_direction
-
-    def spawn_food(self):
-        """Fait apparaître la nourriture"""
-        while True:
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
-            if (x, y) not in self.snake:
-                self.food_pos = (x, y)
-                break
+        self.engine.change_direction(new_direction)
 
-    def move_snake(self):
-        """Déplace le serpent"""
-        self.direction = self.next_direction
-        head_x, head_y = self.snake[0]
-        new_head = (head_x + self.direction[0], head_y + self.direction[1])
-
-        # Vérifier collision avec les murs
-        if (new_head[0] < 0 or new_head[0] >= GRID_WIDTH or
-            new_head[1] < 0 or new_head[1] >= GRID_HEIGHT):
-            return False
-
-        # Vérifier collision avec soi-même
-        if new_head in self.snake:
-            return False
+    def toggle_pilot(self):
+        """Passe au pilote automatique suivant (aucun -> BFS -> A* -> Hamilton s'il a un cycle)"""
+        self.pilot_index = (self.pilot_index + 1) % len(self.pilots)
+        pilot = self.pilots[self.pilot_index]
+        if isinstance(pilot, type):
+            pilot = self.pilots[self.pilot_index] = pilot(self.engine.width, self.engine.height)
+        self.pilot = pilot
+        self.hud.set("pilot", self.pilot and self.pilot.name)
+        self.hud.flush()
 
-        self.snake.appendleft(new_head)
+    def write_pilot(self, name):
+        self.root.title(f"🐍 Snake Game — pilote {name}" if name else "🐍 Snake Game")
 
-        # Vérifier si la nourriture est mangée
-        if new_head == self.food_pos:
-            self.score += 10
+    def move_snake(self):
+        """Déplace le serpent"""
+        _, reward, done = self.recorder.step()
+        if reward:
             self.update_score()
-            self.spawn_food()
-        else:
-            self.snake.pop()
-
-        return True
+        return not done
 
     def update_score(self):
-        """Met à jour l'affichage du score"""
-        self.score_label.config(text=f"Score: {self.score}")
+        """Met à jour l'affichage du score (écrit au prochain dessin)"""
+        self.hud.set("score", self.score)
 
     def draw_game(self):
         """Dessine le jeu"""
-        self.canvas.delete("snake", "food")
-
-        # Dessiner la nourriture avec effet de brillance
-        if self.food_pos:
-            x, y = self.food_pos
-            margin = 3
-            self.canvas.create_oval(
-                x * GRID_SIZE + margin,
-                y * GRID_SIZE + margin,
-                (x + 1) * GRID_SIZE - margin,
-                (y + 1) * GRID_SIZE - margin,
-                fill=FOOD_COLOR,
-                outline="",
-                tags="food"
-            )
-            # Reflet
-            self.canvas.create_oval(
-                x * GRID_SIZE + 6,
-                y * GRID_SIZE + 6,
-                x * GRID_SIZE + 10,
-                y * GRID_SIZE + 10,
-                fill="#ff6b81",
-                outline="",
-                tags="food"
-            )
-
-        # Dessiner le serpent
-        for i, (x, y) in enumerate(self.snake):
-            margin = 2
-            color = SNAKE_HEAD if i == 0 else SNAKE_BODY
-
-            self.canvas.create_rectangle(
-                x * GRID_SIZE + margin,
-                y * GRID_SIZE + margin,
-                (x + 1) * GRID_SIZE - margin,
-                (y + 1) * GRID_SIZE - margin,
-                fill=color,
-                outline="",
-                tags="snake"
-            )
-
-            # Yeux sur la tête
-            if i == 0:
-                eye_size = 3
-                if self.direction == RIGHT:
-                    eye1 = (x * GRID_SIZE + 14, y * GRID_SIZE + 7)
-                    eye2 = (x * GRID_SIZE + 14, y * GRID_SIZE + 13)
-                elif self.direction == LEFT:
-                    eye1 = (x * GRID_SIZE + 6, y * GRID_SIZE + 7)
-                    eye2 = (x * GRID_SIZE + 6, y * GRID_SIZE + 13)
-                elif self.direction == UP:
-                    eye1 = (x * GRID_SIZE + 7, y * GRID_SIZE + 6)
-                    eye2 = (x * GRID_SIZE + 13, y * GRID_SIZE + 6)
-                else:  # DOWN
-                    eye1 = (x * GRID_SIZE + 7, y * GRID_SIZE + 14)
-                    eye2 = (x * GRID_SIZE + 13, y * GRID_SIZE + 14)
-
-                self.canvas.create_oval(
-                    eye1[0] - eye_size, eye1[1] - eye_size,
-                    eye1[0] + eye_size, eye1[1] + eye_size,
-                    fill="#fff",
-                    tags="snake"
-                )
-                self.canvas.create_oval(
-                    eye2[0] - eye_size, eye2[1] - eye_size,
-                    eye2[0] + eye_size, eye2[1] + eye_size,
-                    fill="#fff",
-                    tags="snake"
-                )
+        start = self.profiler.now()
+        self.renderer.draw(self.engine)
+        start = self.profiler.lap("draw", start)
+        self.hud.flush()
+        self.profiler.lap("hud", start)
+        self.profiler.end_frame(self.renderer.frame_calls)
 
     def show_game_over(self):
         """Affiche l'écran de game over"""
-        overlay = self.canvas.create_rectangle(
-            0, 0, WINDOW_WIDTH, WINDOW_HEIGHT,
+        self.hud.flush()
+        screens = self.screens
+        screens.begin()
+        screens.rectangle(
+            "overlay",
+            0, 0, self.px(WINDOW_WIDTH), self.px(WINDOW_HEIGHT),
             fill=BG_COLOR,
-            stipple="gray50",
-            tags="gameover"
+            stipple="gray50"
         )
-        self.canvas.create_text(
-            WINDOW_WIDTH // 2,
-            WINDOW_HEIGHT // 2 - 60,
-            text="💀 GAME OVER 💀",
-            font=("Arial", 36, "bold"),
-            fill=FOOD_COLOR,
-            tags="gameover"
+        screens.text(
+            "title",
+            self.px(WINDOW_WIDTH // 2),
+            self.px(WINDOW_HEIGHT // 2 - 60),
+            text="🏆 VICTOIRE 🏆" if self.engine.won else "💀 GAME OVER 💀",
+            font=("Arial", self.px(36), "bold"),
+            fill=ACCENT_COLOR if self.engine.won else FOOD_COLOR
         )
-        self.canvas.create_text(
-            WINDOW_WIDTH // 2,
-            WINDOW_HEIGHT // 2,
+        screens.text(
+            "score",
+            self.px(WINDOW_WIDTH // 2),
+            self.px(WINDOW_HEIGHT // 2),
             text=f"Score Final: {self.score}",
-            font=("Arial", 24),
-            fill=TEXT_COLOR,
-            tags="gameover"
+            font=("Arial", self.px(24)),
+            fill=TEXT_COLOR
         )
-        self.canvas.create_text(
-            WINDOW_WIDTH // 2,
-            WINDOW_HEIGHT // 2 + 50,
+        screens.text(
+            "prompt",
+            self.px(WINDOW_WIDTH // 2),
+            self.px(WINDOW_HEIGHT // 2 + 50),
             text="Appuyez sur R pour rejouer",
-            font=("Arial", 16),
-            fill=ACCENT_COLOR,
-            tags="gameover"
+            font=("Arial", self.px(16)),
+            fill=ACCENT_COLOR
         )
+        screens.end()
 
     def game_loop(self):
-        """Boucle principale du jeu"""
+        """Boucle principale du jeu (pas fixe de GAME_SPEED ms)"""
         if self.game_over or self.paused:
             return
+        self.loop.start()
+
+    def update(self):
+        """Un pas de simulation, renvoie False quand la boucle doit s'arrêter"""
+        if self.game_over or self.paused:
+            return False
 
-        if not self.move_snake():
+        start = self.profiler.now()
+        if self.pilot:
+            direction = self.pilot.choose(self.engine)
+            if direction:
+                self.change_direction(direction)
+        self.profiler.lap("move", start)
+        moved = self.move_snake()  # Le moteur chronomètre lui-même son tick
+        if not moved:
             self.game_over = True
+            self.recorder.finish()
+            if self.engine.won:
+                self.draw_game()
             self.show_game_over()
+            return False
+
+        return True
+
+
+class ArenaRenderer:
+    """Plateau partagé vu par un client : tous les serpents visibles, le sien mis en avant
+
+    Même principe que SnakeRenderer : un rectangle par case visible, rangé par
+    case du monde. À chaque dessin, seules les cases que les ticks reçus ont
+    changées (RemoteArena.take_changes) touchent Tk ; un défilement ne
+    redessine que les bandes de bord.
+    """
+
+    def __init__(self, canvas, camera):
+        self.canvas = canvas
+        self.camera = camera
+        self.cell = GRID_SIZE
+        self.items = {}  # Case du monde -> [rectangle, couleur]
+        self.spare = []  # Rectangles cachés, réutilisables
+        self.foods = {}  # Case du monde -> ovale
+        self.eyes = ()
+        self.eyes_at = None  # (tête, direction, caméra) au dernier placement des yeux
+        self.tk_calls = 0
+        self.frame_calls = 0
+
+    def reset(self):
+        """Oublie les objets dessinés (après un canvas.delete("all"))"""
+        self.items.clear()
+        self.spare.clear()
+        self.foods.clear()
+        self.eyes = ()
+        self.eyes_at = None
+
+    def item_count(self):
+        return len(self.items) + len(self.spare) + len(self.foods) + len(self.eyes)
+
+    def draw(self, arena):
+        calls = self.tk_calls
+        camera, width = self.camera, arena.width
+        head = int(arena.heads[arena.focus])
+        dx, dy = camera.follow(head % width, head // width)
+        if not self.eyes or arena.rebuilt or abs(dx) >= camera.cols or abs(dy) >= camera.rows:
+            self.rebuild(arena)
+        else:
+            if dx or dy:
+                self.scroll(arena, dx, dy)
+            cells, foods = arena.take_changes(camera.left, camera.top, camera.cols, camera.rows)
+            for cell in cells:
+                self.update_cell(arena, cell)
+            for cell in foods:
+                self.update_food(arena, cell)
+        self.place_eyes(arena)
+        self.frame_calls = self.tk_calls - calls
+
+    def rebuild(self, arena):
+        """Recrée les objets des cases visibles (plateau complet reçu, saut de la caméra)"""
+        self.canvas.delete("arena")
+        self.tk_calls += 1
+        self.reset()
+        arena.rebuilt = False
+        arena.take_changes(0, 0, 0, 0)  # Tout est redessiné : les changements en attente sont inutiles
+        camera, width = self.camera, arena.width
+        head = int(arena.heads[arena.focus])
+        camera.center(head % width, head // width)
+        self.place_background()
+        self.eyes = tuple(
+            self.canvas.create_oval(0, 0, 0, 0, fill=EYE_COLOR, tags=("arena", "eyes"))
+            for _ in range(2)
+        )
+        self.tk_calls += 2
+        self.enter(arena, camera.left, camera.left + camera.cols, camera.top, camera.top + camera.rows)
+
+    def scroll(self, arena, dx, dy):
+        """La caméra a bougé : tout glisse d'un coup, puis seules les bandes de bord changent"""
+        camera, width = self.camera, arena.width
+        self.canvas.move("arena", -dx * self.cell, -dy * self.cell)
+        self.tk_calls += 1
+        if (dx + dy) % 2:
+            self.place_background()
+        for cell in [cell for cell in self.items if not camera.visible(cell % width, cell // width)]:
+            self.release(cell)
+        for cell in [cell for cell in self.foods if not camera.visible(cell % width, cell // width)]:
+            self.canvas.delete(self.foods.pop(cell))
+            self.tk_calls += 1
+        # Cases entrées : colonnes nouvelles sur toute la hauteur, puis lignes
+        # nouvelles sur les autres colonnes
+        left, top, cols, rows = camera.left, camera.top, camera.cols, camera.rows
+        rest = (left, left + cols)
+        if dx > 0:
+            self.enter(arena, left + cols - dx, left + cols, top, top + rows)
+            rest = (left, left + cols - dx)
+        elif dx < 0:
+            self.enter(arena, left, left - dx, top, top + rows)
+            rest = (left - dx, left + cols)
+        if dy > 0:
+            self.enter(arena, *rest, top + rows - dy, top + rows)
+        elif dy < 0:
+            self.enter(arena, *rest, top, top - dy)
+
+    place_background = SnakeRenderer.place_background
+
+    def enter(self, arena, x0, x1, y0, y1):
+        """Dessine serpents et nourriture du rectangle de monde [x0, x1[ x [y0, y1["""
+        for cell in arena.cells_in(arena.owner, x0, x1, y0, y1):
+            self.update_cell(arena, cell)
+        for cell in arena.cells_in(arena.food, x0, x1, y0, y1):
+            self.update_food(arena, cell)
+
+    def color(self, arena, cell):
+        owner = int(arena.owner[cell])
+        if owner < 0:
+            return None
+        head = int(arena.heads[owner]) == cell
+        if owner == arena.me:
+            return SNAKE_HEAD if head else SNAKE_BODY
+        return OTHER_HEAD if head else OTHER_BODY
+
+    def update_cell(self, arena, cell):
+        """Met la case visible à jour : rectangle repris, recoloré ou rendu"""
+        color = self.color(arena, cell)
+        entry = self.items.get(cell)
+        if color is None:
+            if entry is not None:
+                self.release(cell)
             return
+        if entry is not None:
+            if entry[1] != color:
+                self.canvas.itemconfig(entry[0], fill=color)
+                entry[1] = color
+                self.tk_calls += 1
+            return
+        camera, width = self.camera, arena.width
+        rect = cell_rect(cell % width - camera.left, cell // width - camera.top, 2, self.cell)
+        if self.spare:
+            item = self.spare.pop()
+            self.canvas.coords(item, *rect)
+            self.canvas.itemconfig(item, fill=color, state="normal")
+            self.tk_calls += 2
+        else:
+            item = self.canvas.create_rectangle(*rect, fill=color, outline="", tags="arena")
+            self.canvas.tag_raise("eyes")
+            self.tk_calls += 2
+        self.items[cell] = [item, color]
+
+    def release(self, cell):
+        item = self.items.pop(cell)[0]
+        self.canvas.itemconfig(item, state="hidden")
+        self.tk_calls += 1
+        self.spare.append(item)
+
+    def update_food(self, arena, cell):
+        item = self.foods.get(cell)
+        if arena.food[cell] and item is None:
+            camera, width = self.camera, arena.width
+            rect = cell_rect(cell % width - camera.left, cell // width - camera.top, 3, self.cell)
+            self.foods[cell] = self.canvas.create_oval(*rect, fill=FOOD_COLOR, outline="", tags="arena")
+            self.tk_calls += 1
+        elif not arena.food[cell] and item is not None:
+            self.canvas.delete(self.foods.pop(cell))
+            self.tk_calls += 1
+
+    def place_eyes(self, arena):
+        """Yeux sur la tête du joueur ; replacés si la tête, la direction ou la caméra change"""
+        camera, width = self.camera, arena.width
+        head = int(arena.heads[arena.focus])
+        direction = DIRECTIONS[int(arena.direction[arena.focus])]
+        key = (head, direction, camera.left, camera.top)
+        if key == self.eyes_at:
+            return
+        self.eyes_at = key
+        x, y = head % width - camera.left, head // width - camera.top
+        rects = eye_rects(x, y, direction, self.cell) if arena.me == arena.focus else [(0, 0, 0, 0)] * 2
+        for item, rect in zip(self.eyes, rects):
+            self.canvas.coords(item, *rect)
+        self.tk_calls += 2
+
+    def check(self, arena):
+        """Vérifie le canvas contre le miroir : cases, couleurs, nourriture, yeux (lent, pour les tests)"""
+        canvas, camera, width, cell = self.canvas, self.camera, arena.width, self.cell
+        view = (camera.left, camera.left + camera.cols, camera.top, camera.top + camera.rows)
+        visible = set(arena.cells_in(arena.owner, *view))
+        assert set(self.items) == visible, (set(self.items) ^ visible, arena.ticks)
+        for c, (item, color) in self.items.items():
+            rect = cell_rect(c % width - camera.left, c // width - camera.top, 2, cell)
+            assert tuple(canvas.coords(item)) == rect, (c, arena.ticks)
+            assert canvas.itemcget(item, "fill") == color == self.color(arena, c), (c, arena.ticks)
+            assert canvas.itemcget(item, "state") != "hidden", (c, arena.ticks)
+        for item in self.spare:
+            assert canvas.itemcget(item, "state") == "hidden", (item, arena.ticks)
+        food = set(arena.cells_in(arena.food, *view))
+        assert set(self.foods) == food, (set(self.foods) ^ food, arena.ticks)
+        for c, item in self.foods.items():
+            rect = cell_rect(c % width - camera.left, c // width - camera.top, 3, cell)
+            assert tuple(canvas.coords(item)) == rect, (c, arena.ticks)
+        if arena.me == arena.focus:
+            head = int(arena.heads[arena.me])
+            rects = eye_rects(head % width - camera.left, head // width - camera.top,
+                              DIRECTIONS[int(arena.direction[arena.me])], cell)
+            for item, rect in zip(self.eyes, rects):
+                assert tuple(canvas.coords(item)) == rect, ("yeux", arena.ticks)
+
+
+class RemoteSnakeGame(SnakeGame):
+    """Client léger : le plateau partagé tourne sur snake_server, on dessine ses ticks
+
+    Les règles sont celles de SnakeArena : pas de fin de partie, un serpent
+    mort réapparaît ailleurs avec une case.
+    """
+
+    def __init__(self, root, client):
+        super().__init__(root, (client.arena.width, client.arena.height))
+        self.client = client
+        self.engine = client.arena  # Miroir lu par le renderer et le HUD
+        self.renderer = ArenaRenderer(self.canvas, self.camera)
+        self.draw_game()  # Plateau complet déjà reçu par SnakeClient
+        self.game_loop()
 
-        self.draw_game()
-        self.root.after(GAME_SPEED, self.game_loop)
+    @property
+    def score(self):
+        return self.engine.player_score
+
+    def init_game(self):
+        self.game_started = True
+        self.screens.clear()
+
+    def apply_scale(self, scale):
+        super().apply_scale(scale)
+        if not self.game_started:
+            self.draw_game()
+
+    def draw_game(self):
+        super().draw_game()
+        if not self.game_started:
+            self.canvas.tag_raise("screen")  # Le plateau vit derrière l'écran d'accueil
+
+    def restart_game(self):
+        pass  # Le serpent réapparaît tout seul après une collision
+
+    def toggle_pause(self):
+        pass  # Le serveur fait avancer la partie
+
+    def toggle_pilot(self):
+        pass  # Les pilotes ont besoin du moteur complet (push/undo)
+
+    def change_direction(self, new_direction):
+        if not self.game_started:
+            self.init_game()
+        self.client.send_direction(new_direction)
+
+    def game_loop(self):
+        """Lit le réseau toutes les POLL_SPEED ms et dessine ce qui a changé"""
+        try:
+            ticks, fulls = self.client.poll()
+        except OSError:
+            self.root.title("🐍 Snake Game — serveur perdu")
+            return
+        if ticks or fulls:
+            self.update_score()
+            self.draw_game()
+        self.root.after(POLL_SPEED, self.game_loop)
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Snake")
+    parser.add_argument("address", nargs="?", help="serveur à rejoindre : hôte:port ou unix:chemin")
+    parser.add_argument("--world", default=f"{WORLD_WIDTH}x{WORLD_HEIGHT}",
+                        help="taille du monde en cases, ex. 200x200 (partie locale)")
+    args = parser.parse_args()
+
     root = tk.Tk()
-    game = SnakeGame(root)
+    if args.address:
+        from snake_server import SnakeClient
+        game = RemoteSnakeGame(root, SnakeClient(args.address))
+    else:
+        width, _, height = args.world.partition("x")
+        game = SnakeGame(root, (int(width), int(height or width)))
     root.mainloop()
@@ -0,0 +1,246 @@
+import numpy as np
+
+from snake_batch import DX, DY
+from snake_engine import FOOD_POINTS
+
+EMPTY = -1  # Case sans serpent dans la grille des propriétaires
+SPAWN_TRIES = 8  # Tirages au hasard d'une case libre avant de chercher parmi toutes
+
+
+class SnakeArena:
+    """Des milliers de serpents sur une même grande grille, avancés ensemble
+
+    Une seule grille pour tous : owner donne le serpent qui occupe chaque case,
+    toward_head la case suivante vers la tête (le corps est une liste chaînée
+    dans la grille). Avancer un serpent ne touche que sa tête et sa queue :
+    un tick coûte O(nombre de serpents), quelle que soit leur longueur.
+
+    Règles d'un tick, appliquées à tous en même temps :
+    - le demi-tour est ignoré, sortir du plateau tue ;
+    - chaque serpent qui avance sans manger libère sa queue avant les
+      collisions, on peut donc entrer dans une case qu'une queue quitte ;
+    - entrer dans un corps (le sien compris, ou le cou d'une tête voisine) tue ;
+    - plusieurs têtes sur une même case : le plus long survit, à égalité
+      tous meurent (la nourriture disputée revient au survivant, ou reste) ;
+    - les serpents morts sont retirés puis réapparaissent ailleurs, longueur 1.
+    """
+
+    def __init__(self, num_snakes, width, height, food_count=None, seed=None):
+        self.num_snakes = num_snakes
+        self.width = width
+        self.height = height
+        self.cells = width * height
+        self.food_count = num_snakes if food_count is None else food_count
+        if num_snakes + self.food_count > self.cells // 2:
+            raise ValueError("plateau trop petit pour les serpents et la nourriture")
+        self.rng = np.random.default_rng(seed)
+
+        n = num_snakes
+        self.owner = np.full(self.cells, EMPTY, dtype=np.int32)
+        self.toward_head = np.zeros(self.cells, dtype=np.int32)  # Case suivante vers la tête
+        self.food = np.zeros(self.cells, dtype=np.bool_)
+        self.heads = np.zeros(n, dtype=np.int64)
+        self.tails = np.zeros(n, dtype=np.int64)
+        self.length = np.zeros(n, dtype=np.int64)
+        self.direction = np.zeros(n, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.ids = np.arange(n)
+        # Brouillons des têtes à têtes : claim n'est lu que là où on vient d'écrire,
+        # contested est remis à False après usage
+        self.claim = np.zeros(self.cells, dtype=np.int32)
+        self.contested = np.zeros(self.cells, dtype=np.bool_)
+        self.ticks = 0
+        self.deaths = 0
+        self.spawned = np.empty(0, dtype=np.int64)  # Cases de la dernière nourriture posée
+
+        self.reset()
+
+    @property
+    def grid(self):
+        """Propriétaires (hauteur, largeur), vue sans copie"""
+        return self.owner.reshape(self.height, self.width)
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self.owner.fill(EMPTY)
+        self.food.fill(False)
+        self.score.fill(0)
+        self.ticks = self.deaths = 0
+        self.spawn_snakes(self.ids)
+        self.spawn_food(self.food_count)
+
+    def free_cells(self, count):
+        """count cases distinctes sans serpent ni nourriture, tirées au hasard"""
+        chosen = np.empty(0, dtype=np.int64)
+        for _ in range(SPAWN_TRIES):
+            cells = np.unique(self.rng.integers(0, self.cells, size=count - len(chosen)))
+            cells = cells[(self.owner[cells] == EMPTY) & ~self.food[cells]]
+            chosen = np.union1d(chosen, cells)
+            if len(chosen) >= count:
+                return self.rng.permutation(chosen)[:count]
+        # Plateau chargé : tirage exact parmi toutes les cases libres
+        free = np.flatnonzero((self.owner == EMPTY) & ~self.food)
+        free = np.setdiff1d(free, chosen)
+        return np.concatenate((chosen, self.rng.choice(free, count - len(chosen), replace=False)))
+
+    def spawn_snakes(self, ids):
+        """Serpents d'une case posés sur des cases libres"""
+        if len(ids) == 0:
+            return
+        cells = self.free_cells(len(ids))
+        self.owner[cells] = ids
+        self.heads[ids] = cells
+        self.tails[ids] = cells
+        self.length[ids] = 1
+        self.direction[ids] = self.rng.integers(0, 4, size=len(ids))
+
+    def spawn_food(self, count):
+        self.spawned = self.free_cells(count) if count else np.empty(0, dtype=np.int64)
+        self.food[self.spawned] = True
+
+    def remove_bodies(self, ids):
+        """Libère les corps de la queue à la tête, tous les serpents en même temps, renvoie leurs cases
+
+        Chaque case libérée a été gagnée en mangeant : coût amorti constant par tick.
+        """
+        cells, heads = self.tails[ids], self.heads[ids]
+        freed = [cells]
+        while len(cells):
+            self.owner[cells] = EMPTY
+            more = cells != heads
+            cells, heads = self.toward_head[cells[more]], heads[more]
+            freed.append(cells)
+        return np.concatenate(freed)
+
+    def step(self, actions):
+        """Avance tous les serpents d'un tick, renvoie (récompenses, morts)"""
+        actions = np.asarray(actions, dtype=np.int64)
+        owner, toward_head = self.owner, self.toward_head
+        width = self.width
+
+        # Le demi-tour est ignoré
+        reverse = actions == (self.direction + 2) % 4
+        self.direction = direction = np.where(reverse, self.direction, actions)
+
+        heads = self.heads
+        x = heads % width + DX[direction]
+        y = heads // width + DY[direction]
+        dead = (x < 0) | (x >= width) | (y < 0) | (y >= self.height)
+        movers = self.ids[~dead]
+        targets = (y * width + x)[movers]
+
+        # Les queues des serpents qui ne mangent pas se libèrent d'abord
+        eats = self.food[targets]
+        owner[self.tails[movers[~eats]]] = EMPTY
+
+        # Entrer dans un corps (y compris une tête qui vient de partir : c'est un cou)
+        blocked = owner[targets] != EMPTY
+        dead[movers[blocked]] = True
+        movers, targets, eats = movers[~blocked], targets[~blocked], eats[~blocked]
+
+        # Têtes sur une même case : seul le plus long, s'il est seul à cette longueur, survit.
+        # Dernière écriture gagnante dans claim : qui n'y lit pas son rang partage sa case
+        order = np.arange(len(movers), dtype=np.int32)
+        self.claim[targets] = order
+        shared = self.claim[targets] != order
+        if shared.any():
+            self.contested[targets[shared]] = True
+            crowd = np.flatnonzero(self.contested[targets])
+            self.contested[targets[crowd]] = False
+            # Par case, du plus long au plus court
+            crowd = crowd[np.lexsort((-self.length[movers[crowd]], targets[crowd]))]
+            cells, lengths = targets[crowd], self.length[movers[crowd]]
+            first = np.r_[True, cells[1:] != cells[:-1]]
+            alone = np.r_[(cells[1:] != cells[:-1]) | (lengths[1:] < lengths[:-1]), True]
+            survive = np.ones(len(movers), dtype=np.bool_)
+            survive[crowd] = first & alone
+            dead[movers[~survive]] = True
+            movers, targets, eats = movers[survive], targets[survive], eats[survive]
+
+        # Les morts quittent la grille avant que les survivants n'avancent
+        killed = self.ids[dead]
+        self.remove_bodies(killed)
+
+        # Les têtes avancent ; les queues suivent sauf pour ceux qui mangent
+        toward_head[heads[movers]] = targets
+        owner[targets] = movers
+        heads[movers] = targets
+        followers = movers[~eats]
+        self.tails[followers] = toward_head[self.tails[followers]]
+
+        eaters = movers[eats]
+        self.food[targets[eats]] = False
+        self.length[eaters] += 1
+        self.score[eaters] += FOOD_POINTS
+        rewards = np.zeros(self.num_snakes, dtype=np.int64)
+        rewards[eaters] = FOOD_POINTS
+
+        self.score[killed] = 0
+        self.spawn_snakes(killed)
+        self.spawn_food(len(eaters))
+        self.deaths += len(killed)
+        self.ticks += 1
+        return rewards, dead
+
+    def wander(self, turn_rate=0.1):
+        """Pilote scripté vectorisé : tout droit, parfois un virage, en évitant les cases prises"""
+        direction = self.direction
+        turns = self.rng.random(self.num_snakes) < turn_rate
+        preferred = np.where(turns, (direction + self.rng.choice((1, 3), self.num_snakes)) % 4, direction)
+        # Essayer la direction voulue, puis les deux virages
+        options = np.stack((preferred, (preferred + 1) % 4, (preferred + 3) % 4))
+        x = self.heads % self.width + DX[options]
+        y = self.heads // self.width + DY[options]
+        inside = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+        cells = np.where(inside, y * self.width + x, 0)
+        free = inside & (self.owner[cells] == EMPTY) & (options != (direction + 2) % 4)
+        choice = np.argmax(free, axis=0)  # Première option libre, la voulue à défaut
+        return options[choice, self.ids]
+
+    def check(self):
+        """Vérifie la grille contre les corps (lent, pour les tests)"""
+        seen = np.full(self.cells, EMPTY, dtype=np.int32)
+        for i in range(self.num_snakes):
+            cell, count = int(self.tails[i]), 1
+            while True:
+                assert seen[cell] == EMPTY and self.owner[cell] == i, (i, cell)
+                seen[cell] = i
+                if cell == self.heads[i]:
+                    break
+                cell = int(self.toward_head[cell])
+                count += 1
+            assert count == self.length[i], (i, count, self.length[i])
+        assert np.array_equal(seen, self.owner)
+        assert not (self.food & (self.owner != EMPTY)).any()
+        assert self.food.sum() == self.food_count
+
+
+if __name__ == "__main__":
+    import time
+
+    # Vérification de la grille sur un petit plateau très disputé
+    arena = SnakeArena(200, 60, 60, food_count=300, seed=0)
+    for _ in range(300):
+        arena.step(arena.wander())
+        arena.check()
+
+    # Débit selon le nombre de serpents (100 cases par serpent, autant de nourriture)
+    for snakes in (1_000, 10_000, 50_000):
+        side = int((snakes * 100) ** 0.5)
+        arena = SnakeArena(snakes, side, side, seed=0)
+        for _ in range(50):
+            arena.step(arena.wander())  # Laisser les serpents grandir un peu
+        ticks, steer = 0, 0.0
+        start = time.perf_counter()
+        while time.perf_counter() - start < 3.0:
+            tick_start = time.perf_counter()
+            actions = arena.wander()
+            steer += time.perf_counter() - tick_start
+            arena.step(actions)
+            ticks += 1
+        elapsed = time.perf_counter() - start
+        print(f"{snakes:>6} serpents sur {side}x{side} : {ticks / elapsed:7.1f} ticks/s "
+              f"({(elapsed - steer) / ticks * 1000:.2f} ms de règles + {steer / ticks * 1000:.2f} ms de pilote), "
+              f"longueur moyenne {arena.length.mean():.1f}, max {arena.length.max()}, "
+              f"{arena.deaths / ticks:.1f} morts/tick")
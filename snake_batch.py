@@ -0,0 +1,141 @@
+import numpy as np
+
+from snake_engine import GRID_WIDTH, GRID_HEIGHT, FOOD_POINTS
+
+# Directions codées par indice : l'opposé de d est (d + 2) % 4
+UP, RIGHT, DOWN, LEFT = 0, 1, 2, 3
+DX = np.array([0, 1, 0, -1], dtype=np.int32)
+DY = np.array([-1, 0, 1, 0], dtype=np.int32)
+
+# Tirages aléatoires avant de basculer sur le tirage exact parmi les cases libres
+SPAWN_TRIES = 4
+
+
+class BatchSnakeEnv:
+    """N parties de Snake avancées ensemble par opérations NumPy vectorisées"""
+
+    def __init__(self, num_envs, width=GRID_WIDTH, height=GRID_HEIGHT, seed=None):
+        self.num_envs = num_envs
+        self.width = width
+        self.height = height
+        self.cells = width * height
+        self.rng = np.random.default_rng(seed)
+
+        n = num_envs
+        self.occ = np.zeros((n, self.cells), dtype=np.uint8)  # Cases occupées par le corps
+        self.body = np.zeros((n, self.cells), dtype=np.int32)  # Anneau d'indices de cases
+        self.head_ptr = np.zeros(n, dtype=np.int64)  # Position de la tête dans l'anneau
+        self.length = np.zeros(n, dtype=np.int64)
+        self.heads = np.zeros(n, dtype=np.int64)
+        self.direction = np.zeros(n, dtype=np.int64)
+        self.food = np.zeros(n, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.rows = np.arange(n)
+
+        self.reset()
+
+    @property
+    def grid(self):
+        """Grilles d'occupation (N, hauteur, largeur), vue sans copie"""
+        return self.occ.reshape(self.num_envs, self.height, self.width)
+
+    def reset(self, seed=None):
+        """Remet toutes les parties à zéro"""
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self.reset_envs(self.rows)
+        return self.grid
+
+    def reset_envs(self, ids):
+        """Remet à zéro les parties d'indices donnés"""
+        if len(ids) == 0:
+            return
+        start = (self.height // 2) * self.width + self.width // 2
+        self.occ[ids] = 0
+        self.occ[ids, start] = 1
+        self.head_ptr[ids] = 0
+        self.body[ids, 0] = start
+        self.heads[ids] = start
+        self.length[ids] = 1
+        self.direction[ids] = RIGHT
+        self.score[ids] = 0
+        self.spawn_food(ids)
+
+    def spawn_food(self, ids):
+        """Place la nourriture sur une case libre pour chaque partie de ids"""
+        pending = ids
+        for _ in range(SPAWN_TRIES):
+            cells = self.rng.integers(0, self.cells, size=len(pending))
+            free = self.occ[pending, cells] == 0
+            self.food[pending[free]] = cells[free]
+            pending = pending[~free]
+            if len(pending) == 0:
+                return
+
+        # Plateaux presque pleins : k-ième case libre tirée uniformément
+        free = self.occ[pending] == 0
+        counts = free.sum(axis=1)
+        k = (self.rng.random(len(pending)) * counts).astype(np.int64)
+        self.food[pending] = np.argmax(np.cumsum(free, axis=1) > k[:, None], axis=1)
+
+    def step(self, actions):
+        """Avance toutes les parties d'un tick et renvoie (grilles, récompenses, terminées)"""
+        actions = np.asarray(actions, dtype=np.int64)
+
+        # Le demi-tour est ignoré
+        reverse = actions == (self.direction + 2) % 4
+        self.direction = np.where(reverse, self.direction, actions)
+
+        x = self.heads % self.width + DX[self.direction]
+        y = self.heads // self.width + DY[self.direction]
+        wall = (x < 0) | (x >= self.width) | (y < 0) | (y >= self.height)
+        new_heads = np.where(wall, 0, y * self.width + x)
+
+        # Collision avec soi-même (la queue compte, comme dans move_snake)
+        dead = wall | (self.occ[self.rows, new_heads] == 1)
+        alive = self.rows[~dead]
+        new_heads = new_heads[alive]
+
+        # Avancer la tête
+        ptr = (self.head_ptr[alive] - 1) % self.cells
+        self.head_ptr[alive] = ptr
+        self.body[alive, ptr] = new_heads
+        self.occ[alive, new_heads] = 1
+        self.heads[alive] = new_heads
+
+        # Retirer la queue sauf si la nourriture est mangée
+        eat = new_heads == self.food[alive]
+        movers = alive[~eat]
+        tail = (self.head_ptr[movers] + self.length[movers]) % self.cells
+        self.occ[movers, self.body[movers, tail]] = 0
+
+        eaters = alive[eat]
+        self.length[eaters] += 1
+        self.score[eaters] += FOOD_POINTS
+        rewards = np.zeros(self.num_envs, dtype=np.int64)
+        rewards[eaters] = FOOD_POINTS
+
+        # Plateau plein : partie gagnée
+        won = eaters[self.length[eaters] == self.cells]
+        self.spawn_food(eaters[self.length[eaters] < self.cells])
+
+        dones = dead
+        dones[won] = True
+        self.reset_envs(self.rows[dones])
+        return self.grid, rewards, dones
+
+
+if __name__ == "__main__":
+    import time
+
+    # Mesure du débit en pas d'agent par seconde
+    env = BatchSnakeEnv(10_000, seed=0)
+    rng = np.random.default_rng(1)
+    actions = rng.integers(0, 4, size=(64, env.num_envs))
+    steps = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < 2.0:
+        env.step(actions[steps % 64])
+        steps += 1
+    elapsed = time.perf_counter() - start
+    print(f"{steps * env.num_envs / elapsed:,.0f} pas/s ({env.num_envs} parties)")
@@ -0,0 +1,535 @@
+import random
+import struct
+from array import array
+from collections import namedtuple
+from itertools import compress
+
+# Dimensions par défaut (identiques à la fenêtre 600x600 / cases de 20px)
+GRID_WIDTH = 30
+GRID_HEIGHT = 30
+FOOD_POINTS = 10
+
+# Directions
+UP = (0, -1)
+DOWN = (0, 1)
+LEFT = (-1, 0)
+RIGHT = (1, 0)
+
+# État renvoyé par step() : aucune copie, le serpent est le corps du moteur
+SnakeState = namedtuple("SnakeState", "snake direction food score")
+
+# Instantané binaire : largeur, hauteur, direction, direction demandée, case de la
+# nourriture (-1 = aucune), score, ticks, drapeaux, longueur, état du générateur,
+# puis le corps et, si le plateau est dense, l'index des cases libres (entiers
+# 32 bits dans l'ordre natif). Sa taille suit le serpent, pas le plateau.
+DIRECTIONS = (UP, RIGHT, DOWN, LEFT)  # Code d'une direction = son indice
+SNAPSHOT = struct.Struct("<HHBBiiIBIQ")
+GAME_OVER, WON, FREE_INDEX = 1, 2, 4  # Drapeaux de l'instantané
+MASK64 = (1 << 64) - 1
+
+# Tant qu'au moins une case sur DENSE_RATIO est libre, la nourriture est tirée
+# au hasard sur tout le plateau (moins de DENSE_RATIO essais en moyenne) ;
+# au-delà, dans un index des cases libres construit à ce moment-là
+DENSE_RATIO = 4
+FREE_BYTES = bytes([1, 0]) + bytes(254)  # Octet d'occupation -> 1 si la case est libre
+
+
+class SplitMix:
+    """Générateur de la nourriture (SplitMix64) : tout son état tient dans un entier
+
+    Copier une partie, la mettre dans un instantané ou noter le générateur
+    dans le journal ne coûte qu'un entier, là où random.Random en a 625.
+    """
+
+    __slots__ = ("state",)
+
+    def __init__(self, seed=None):
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        self.state = (random.getrandbits(64) if seed is None else seed) & MASK64
+
+    def getstate(self):
+        return self.state
+
+    def setstate(self, state):
+        self.state = state
+
+    def randrange(self, n):
+        """Entier de [0, n[ (multiplication plutôt que modulo : biais en n / 2**64)"""
+        self.state = state = (self.state + 0x9E3779B97F4A7C15) & MASK64
+        z = ((state ^ (state >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+        return ((z ^ (z >> 31)) * n) >> 64
+
+
+class SnakeBody:
+    """Corps du serpent : anneau d'indices de cases + carte d'occupation"""
+
+    __slots__ = ("width", "occupied", "cells", "head_index", "length",
+                 "free", "free_index", "free_count")
+
+    def __init__(self, width, height, capacity=64):
+        self.width = width
+        self.occupied = bytearray(width * height)  # 1 octet par case
+        self.cells = array("i", [0]) * capacity  # Indice y * largeur + x
+        self.head_index = 0
+        self.length = 0
+        self.free_count = width * height
+
+        # Index des cases libres, seulement sur plateau dense (None avant) :
+        # free liste les cases libres, free_index donne la position de chacune
+        self.free = None
+        self.free_index = None
+
+    def clear(self):
+        """Vide le corps et oublie l'index des cases libres
+
+        L'index est reconstruit dans l'ordre des cases quand le plateau redevient
+        dense : le tirage de la nourriture ne dépend pas des parties précédentes
+        et une même graine redonne la même partie.
+        """
+        self.drop_free_index()
+        while self.length:
+            self.pop_tail()
+        self.head_index = 0
+
+    def push_head(self, cell):
+        """Ajoute une case en tête"""
+        capacity = len(self.cells)
+        if self.length == capacity:
+            # Anneau plein : on le remet dans l'ordre et on double sa taille
+            head = self.head_index
+            self.cells = self.cells[head:] + self.cells[:head] + array("i", [0]) * capacity
+            self.head_index = 0
+            capacity *= 2
+        self.head_index = (self.head_index - 1) % capacity
+        self.cells[self.head_index] = cell
+        self.occupied[cell] = 1
+        self.length += 1
+        self.free_count -= 1
+        if self.free is not None:
+            # La dernière case libre prend la place de la case occupée
+            position = self.free_index.pop(cell)
+            last = self.free.pop()
+            if last != cell:
+                self.free[position] = last
+                self.free_index[last] = position
+
+    def pop_tail(self):
+        """Retire la case de queue et la renvoie"""
+        self.length -= 1
+        cell = self.cells[(self.head_index + self.length) % len(self.cells)]
+        self.occupied[cell] = 0
+        self.free_count += 1
+        if self.free is not None:
+            self.free_index[cell] = len(self.free)
+            self.free.append(cell)
+        return cell
+
+    def unpush_head(self, free_position):
+        """Annule push_head (free_position = place de la case dans free avant l'ajout)"""
+        cell = self.cells[self.head_index]
+        self.occupied[cell] = 0
+        self.head_index = (self.head_index + 1) % len(self.cells)
+        self.length -= 1
+        self.free_count += 1
+        if self.free is not None:
+            # La case reprend sa place, la case qui l'occupait repart en fin de liste
+            free, free_index = self.free, self.free_index
+            if free_position < len(free):
+                last = free[free_position]
+                free.append(last)
+                free_index[last] = len(free) - 1
+                free[free_position] = cell
+            else:
+                free.append(cell)
+            free_index[cell] = free_position
+
+    def unpop_tail(self, cell):
+        """Annule pop_tail (la case libérée est la dernière de l'index)"""
+        self.cells[(self.head_index + self.length) % len(self.cells)] = cell
+        self.occupied[cell] = 1
+        self.length += 1
+        self.free_count -= 1
+        if self.free is not None:
+            self.free.pop()
+            del self.free_index[cell]
+
+    def build_free_index(self):
+        """Liste les cases libres dans l'ordre des cases (une fois, quand le plateau devient dense)"""
+        self.free = array("i", compress(range(len(self.occupied)), self.occupied.translate(FREE_BYTES)))
+        self.free_index = {cell: position for position, cell in enumerate(self.free)}
+
+    def drop_free_index(self):
+        self.free = self.free_index = None
+
+    def copy(self):
+        """Copie indépendante (copies mémoire des tableaux, aucune boucle Python)"""
+        body = SnakeBody.__new__(SnakeBody)
+        body.width = self.width
+        body.occupied = self.occupied[:]
+        body.cells = self.cells[:]
+        body.head_index = self.head_index
+        body.length = self.length
+        body.free_count = self.free_count
+        if self.free is None:
+            body.free = body.free_index = None
+        else:
+            body.free = self.free[:]
+            body.free_index = self.free_index.copy()
+        return body
+
+    def random_free_cell(self, rng):
+        """Tire une case libre en O(1) (en moyenne sur plateau clairsemé), None si le plateau est plein
+
+        Le tirage ne dépend que des cases occupées et du générateur, sauf une
+        fois l'index construit, dont l'ordre ne dépend que de la partie.
+        """
+        if self.free_count == 0:
+            return None
+        if self.free is None:
+            size = len(self.occupied)
+            if self.free_count * DENSE_RATIO > size:
+                occupied = self.occupied
+                while True:
+                    cell = rng.randrange(size)
+                    if not occupied[cell]:
+                        return cell
+            self.build_free_index()
+        return self.free[rng.randrange(self.free_count)]
+
+    def head_cell(self):
+        return self.cells[self.head_index]
+
+    def tail_cell(self):
+        return self.cells[(self.head_index + self.length - 1) % len(self.cells)]
+
+    def __len__(self):
+        return self.length
+
+    def __contains__(self, pos):
+        x, y = pos
+        return 0 <= x < self.width and 0 <= y < len(self.occupied) // self.width and \
+            self.occupied[y * self.width + x] == 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.length
+        if not 0 <= i < self.length:
+            raise IndexError("index hors du serpent")
+        y, x = divmod(self.cells[(self.head_index + i) % len(self.cells)], self.width)
+        return x, y
+
+    def __iter__(self):
+        """Parcourt les cases (x, y) de la tête à la queue"""
+        cells, capacity, width = self.cells, len(self.cells), self.width
+        for i in range(self.head_index, self.head_index + self.length):
+            y, x = divmod(cells[i % capacity], width)
+            yield x, y
+
+
+class SnakeEngine:
+    """Règles du Snake sans affichage, pilotables tick par tick"""
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT, seed=None):
+        self.width = width
+        self.height = height
+        self.rng = SplitMix()
+        self.snake = SnakeBody(width, height)
+        self.journal = []  # Entrées de push() à annuler avec undo()
+        self.profiler = None  # FrameProfiler optionnel (phases move, collision), pour step() seulement
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        """Remet la partie à zéro (graine optionnelle pour rejouer à l'identique)"""
+        self.seed = seed
+        self.rng.seed(seed)
+        self.snake.clear()
+        self.snake.push_head((self.height // 2) * self.width + self.width // 2)
+        self.direction = RIGHT
+        self.next_direction = RIGHT
+        self.food_pos = None
+        self.score = 0
+        self.ticks = 0
+        self.game_over = False
+        self.won = False
+        self.journal.clear()
+        self.spawn_food()
+        return self.state()
+
+    def state(self):
+        """Renvoie l'état courant"""
+        return SnakeState(self.snake, self.direction, self.food_pos, self.score)
+
+    def change_direction(self, new_direction):
+        """Change la direction du serpent (le demi-tour est ignoré)"""
+        if (new_direction[0] * -1, new_direction[1] * -1) != self.direction:
+            self.next_direction = new_direction
+
+    def spawn_food(self):
+        """Fait apparaître la nourriture, renvoie False si le plateau est plein"""
+        cell = self.snake.random_free_cell(self.rng)
+        if cell is None:
+            self.food_pos = None
+            return False
+        y, x = divmod(cell, self.width)
+        self.food_pos = (x, y)
+        return True
+
+    def step(self, action=None):
+        """Avance d'un tick et renvoie (état, récompense, terminé)"""
+        if self.game_over:
+            return self.state(), 0, True
+        if action is not None:
+            self.change_direction(action)
+        return self.advance(self.profiler)
+
+    def advance(self, profiler=None):
+        """Joue le tick avec la direction déjà choisie (phases move et collision si profiler)"""
+        if profiler:
+            start = profiler.now()
+        self.ticks += 1
+        self.direction = self.next_direction
+        head_y, head_x = divmod(self.snake.head_cell(), self.width)
+        x = head_x + self.direction[0]
+        y = head_y + self.direction[1]
+        if profiler:
+            start = profiler.lap("move", start)
+
+        # Vérifier collision avec les murs, puis avec soi-même (O(1) via la carte d'occupation)
+        cell = y * self.width + x
+        hit = not (0 <= x < self.width and 0 <= y < self.height) or self.snake.occupied[cell]
+        if profiler:
+            start = profiler.lap("collision", start)
+        if hit:
+            self.game_over = True
+            return self.state(), 0, True
+
+        self.snake.push_head(cell)
+
+        # Vérifier si la nourriture est mangée
+        reward = 0
+        if (x, y) == self.food_pos:
+            reward = FOOD_POINTS
+            self.score += FOOD_POINTS
+            if not self.spawn_food():
+                # Plateau plein : partie gagnée
+                self.game_over = True
+                self.won = True
+        else:
+            self.snake.pop_tail()
+        if profiler:
+            profiler.lap("move", start)
+        return self.state(), reward, self.game_over
+
+    def push(self, action=None):
+        """Comme step(), en notant dans le journal de quoi revenir en arrière avec undo()"""
+        snake, width = self.snake, self.width
+        next_direction = self.next_direction
+        if action is not None and not self.game_over:
+            self.change_direction(action)
+
+        # Ce que le tick va modifier, lu avant de le jouer
+        head_y, head_x = divmod(snake.head_cell(), width)
+        x = head_x + self.next_direction[0]
+        y = head_y + self.next_direction[1]
+        head_position = -1  # Place de la nouvelle tête dans l'index libre (0 sans index), -1 si immobile
+        rng_state = None  # Générateur avant le tirage de la nourriture
+        dense = snake.free is not None  # Sinon, un index construit par ce tick sera oublié
+        if not self.game_over and 0 <= x < width and 0 <= y < self.height \
+                and not snake.occupied[y * width + x]:
+            head_position = snake.free_index[y * width + x] if dense else 0
+            if (x, y) == self.food_pos:
+                rng_state = self.rng.getstate()
+        self.journal.append((
+            self.direction, next_direction, self.food_pos, self.score, self.ticks,
+            self.game_over, self.won, head_position, snake.tail_cell(), dense, rng_state
+        ))
+        if self.game_over:
+            return self.state(), 0, True
+        return self.advance()  # Les coups explorés par les pilotes ne sont pas chronométrés
+
+    def undo(self):
+        """Annule le dernier push() en O(1)"""
+        (self.direction, self.next_direction, self.food_pos, self.score, self.ticks,
+         self.game_over, self.won, head_position, tail, dense, rng_state) = self.journal.pop()
+        if head_position >= 0:
+            if not dense:
+                self.snake.drop_free_index()
+            if rng_state is None:
+                # Pas de nourriture mangée : la queue avait avancé
+                self.snake.unpop_tail(tail)
+            else:
+                self.rng.setstate(rng_state)
+            self.snake.unpush_head(head_position)
+
+    def clone(self):
+        """Copie indépendante de la partie (sans le journal)"""
+        engine = type(self).__new__(type(self))
+        engine.__dict__.update(self.__dict__)
+        engine.rng = SplitMix(self.rng.state)
+        engine.snake = self.snake.copy()
+        engine.journal = []
+        engine.profiler = None
+        return engine
+
+    def snapshot(self):
+        """État complet (partie, générateur, corps, index libre si dense) en bytes"""
+        snake, width = self.snake, self.width
+        food = -1 if self.food_pos is None else self.food_pos[1] * width + self.food_pos[0]
+
+        # Corps de la tête à la queue, l'anneau pouvant faire le tour
+        head, end, capacity = snake.head_index, snake.head_index + snake.length, len(snake.cells)
+        if end <= capacity:
+            body = snake.cells[head:end]
+        else:
+            body = snake.cells[head:] + snake.cells[:end - capacity]
+
+        flags = self.game_over * GAME_OVER | self.won * WON | (snake.free is not None) * FREE_INDEX
+        return b"".join((
+            SNAPSHOT.pack(width, self.height, DIRECTIONS.index(self.direction),
+                          DIRECTIONS.index(self.next_direction), food, self.score, self.ticks,
+                          flags, snake.length, self.rng.state),
+            body.tobytes(),
+            b"" if snake.free is None else snake.free.tobytes(),
+        ))
+
+    def restore(self, data):
+        """Recharge un état produit par snapshot() (le journal est vidé)"""
+        (width, height, direction, next_direction, food, self.score, self.ticks,
+         flags, length, self.rng.state) = SNAPSHOT.unpack_from(data)
+        offset = SNAPSHOT.size
+
+        self.width, self.height = width, height
+        self.direction = DIRECTIONS[direction]
+        self.next_direction = DIRECTIONS[next_direction]
+        self.food_pos = None if food < 0 else (food % width, food // width)
+        self.game_over, self.won = bool(flags & GAME_OVER), bool(flags & WON)
+        self.journal.clear()
+
+        snake = self.snake = SnakeBody(width, height, max(64, length))
+        body = array("i")
+        end = offset + length * body.itemsize
+        body.frombytes(data[offset:end])
+        snake.cells[:length] = body
+        snake.length = length
+        snake.free_count = width * height - length
+        for cell in body:
+            snake.occupied[cell] = 1
+        if flags & FREE_INDEX:
+            snake.free = array("i")
+            snake.free.frombytes(data[end:end + snake.free_count * body.itemsize])
+            snake.free_index = {cell: position for position, cell in enumerate(snake.free)}
+
+    @classmethod
+    def from_snapshot(cls, data):
+        engine = cls.__new__(cls)
+        engine.rng = SplitMix()
+        engine.journal = []
+        engine.profiler = None
+        engine.seed = None
+        engine.restore(data)
+        return engine
+
+
+if __name__ == "__main__":
+    import time
+
+    # Mesure du nombre de ticks par seconde sans affichage
+    engine = SnakeEngine(seed=0)
+    policy = random.Random(0)
+    moves = (UP, RIGHT, DOWN, LEFT)
+    ticks = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < 2.0:
+        _, _, done = engine.step(moves[policy.randrange(4)])
+        ticks += 1
+        if done:
+            engine.reset(ticks)
+    elapsed = time.perf_counter() - start
+    print(f"{ticks / elapsed:,.0f} ticks/s")
+
+    # Coût d'un tick selon la longueur du serpent (doit rester plat)
+    width, height, ticks = 2000, 1000, 400
+    for length in (10, 1_000, 100_000, 1_000_000):
+        engine = SnakeEngine(width, height, seed=0)
+        engine.snake.clear()
+        # Serpent en zigzag sur les premières lignes, tête en bas à gauche
+        for i in range(length):
+            y, x = divmod(i, width)
+            engine.snake.push_head(y * width + (x if y % 2 == 0 else width - 1 - x))
+        engine.food_pos = (width - 1, height - 1)
+        engine.direction = engine.next_direction = DOWN
+        start = time.perf_counter()
+        for _ in range(ticks):
+            engine.step()
+        elapsed = time.perf_counter() - start
+        assert not engine.game_over
+        memory = engine.snake.cells.itemsize * len(engine.snake.cells) + len(engine.snake.occupied)
+        print(f"longueur {length:>9,} : {elapsed / ticks * 1e6:6.2f} µs/tick, {memory / 1e6:.1f} Mo")
+
+    # Monde de 10 000 x 10 000 : la carte d'occupation seule, pas d'index des cases libres
+    start = time.perf_counter()
+    engine = SnakeEngine(10_000, 10_000, seed=0)
+    created = time.perf_counter() - start
+    start = time.perf_counter()
+    engine.reset(1)
+    print(f"monde 10 000 x 10 000 : créé en {created * 1000:.0f} ms, remis à zéro en "
+          f"{(time.perf_counter() - start) * 1e6:.0f} µs, {len(engine.snake.occupied) / 1e6:.0f} Mo")
+    del engine
+
+    # Coût d'apparition de la nourriture selon le remplissage du plateau
+    for fill in (0.0, 0.5, 0.99, 0.9999):
+        engine = SnakeEngine(100, 100, seed=0)
+        cell = 0
+        for i in range(1, int(engine.snake.free_count * fill)):
+            cell = engine.snake.occupied.find(0, cell)
+            engine.snake.push_head(cell)
+        start = time.perf_counter()
+        for _ in range(10_000):
+            engine.spawn_food()
+        elapsed = time.perf_counter() - start
+        print(f"remplissage {fill:7.2%} : {elapsed / 10_000 * 1e6:5.2f} µs/apparition")
+
+    # Recherche : partie en cours, puis clones, instantanés et journal push/undo
+    engine = SnakeEngine(seed=1)
+    while len(engine.snake) < 20:
+        head_x, head_y = engine.snake[0]
+        food_x, food_y = engine.food_pos
+        engine.step(RIGHT if food_x > head_x else LEFT if food_x < head_x else
+                    DOWN if food_y > head_y else UP)
+        if engine.game_over:
+            engine.reset(engine.ticks)
+    reference = engine.snapshot()
+
+    # Annuler une suite de coups doit redonner exactement l'état de départ
+    copy = engine.clone()
+    actions = [moves[policy.randrange(4)] for _ in range(2_000)]
+    for action in actions:
+        engine.push(action)
+    for action in actions:
+        copy.step(action)
+    assert engine.snapshot() == copy.snapshot()
+    while engine.journal:
+        engine.undo()
+    assert engine.snapshot() == reference
+    assert SnakeEngine.from_snapshot(reference).snapshot() == reference
+
+    count = 20_000
+    start = time.perf_counter()
+    for _ in range(count):
+        engine.clone()
+    clone = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(count):
+        SnakeEngine.from_snapshot(engine.snapshot())
+    serialize = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(count):
+        engine.push(moves[i & 3])
+        engine.undo()
+    journal = time.perf_counter() - start
+    print(f"longueur {len(engine.snake)} : {count / clone:,.0f} clones/s, "
+          f"{count / serialize:,.0f} instantanés+restaurations/s ({len(reference)} octets), "
+          f"{count / journal:,.0f} push+undo/s")
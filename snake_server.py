@@ -0,0 +1,512 @@
+import asyncio
+import random
+import socket
+import struct
+import time
+
+import numpy as np
+
+from snake_arena import SnakeArena, EMPTY
+from snake_batch import DX, DY
+from snake_engine import DIRECTIONS, FOOD_POINTS
+
+TICK_MS = 150  # Identique à GAME_SPEED de snake.py
+PORT = 5150
+BACKLOG = 1024  # Connexions en attente : des centaines de clients peuvent arriver d'un coup
+MAX_BUFFER = 4096  # Octets en attente chez un client au-delà desquels il est en retard
+
+# Client -> serveur : un octet par commande, 0..3 = indice dans DIRECTIONS
+
+# Serveur -> clients, le même message pour tous à chaque tick :
+# en-tête, un octet par serpent (direction prise + drapeaux), puis les cases
+# des serpents réapparus (dans l'ordre des serpents) et de la nourriture posée
+TICK = 1
+TICK_HEADER = struct.Struct(">BIHH")  # TICK, ticks, réapparitions, nourritures posées
+GREW = 4  # Nourriture mangée : la queue reste
+DIED = 8  # Serpent retiré ; il réapparaît, la direction de l'octet est sa nouvelle direction
+
+# Plateau complet, propre à un client : à la connexion et pour rattraper un retard.
+# En-tête, puis par serpent (queue, tête, longueur, score, direction), puis les
+# cases occupées (case, propriétaire, case suivante vers la tête) et la nourriture
+FULL = 128
+FULL_HEADER = struct.Struct(">BIIIHHII")  # FULL, largeur, hauteur, ticks, serpents, vous, occupées, nourriture
+NO_SLOT = 0xFFFF  # Spectateur : tous les serpents ont déjà un joueur
+CELL = np.dtype(">u4")
+SCORE = np.dtype(">i4")
+
+
+def encode_full(arena, slot):
+    """Plateau entier, vu par le joueur du serpent slot"""
+    cells = np.flatnonzero(arena.owner != EMPTY)
+    food = np.flatnonzero(arena.food)
+    header = FULL_HEADER.pack(FULL, arena.width, arena.height, arena.ticks, arena.num_snakes, slot,
+                              len(cells), len(food))
+    return b"".join((
+        header,
+        arena.tails.astype(CELL).tobytes(), arena.heads.astype(CELL).tobytes(),
+        arena.length.astype(CELL).tobytes(), arena.score.astype(SCORE).tobytes(),
+        arena.direction.astype(np.uint8).tobytes(),
+        cells.astype(CELL).tobytes(), arena.owner[cells].astype(CELL).tobytes(),
+        arena.toward_head[cells].astype(CELL).tobytes(), food.astype(CELL).tobytes(),
+    ))
+
+
+def full_size(snakes, cells, food):
+    return FULL_HEADER.size + 17 * snakes + 12 * cells + 4 * food
+
+
+def encode_tick(arena, rewards, dead):
+    """Ce qu'un tick a changé pour tous les serpents : un octet chacun, plus les réapparitions"""
+    codes = arena.direction.astype(np.uint8)
+    codes[rewards > 0] |= GREW
+    codes[dead] |= DIED
+    respawned = arena.heads[dead]
+    return b"".join((
+        TICK_HEADER.pack(TICK, arena.ticks, len(respawned), len(arena.spawned)),
+        codes.tobytes(), respawned.astype(CELL).tobytes(), arena.spawned.astype(CELL).tobytes(),
+    ))
+
+
+class RemoteArena(SnakeArena):
+    """Miroir du plateau du serveur, tenu à jour par ses messages
+
+    Mêmes tableaux que SnakeArena (les règles restent sur le serveur) : un tick
+    s'applique en quelques opérations NumPy, quel que soit le nombre de
+    serpents. Avec changes, les cases modifiées depuis le dernier
+    take_changes sont notées pour le dessin.
+    """
+
+    def __init__(self, changes=True):
+        self.width = self.height = self.cells = self.num_snakes = 0
+        self.me = NO_SLOT
+        self.ticks = 0
+        self.changes = changes
+        self.dirty = []  # Cases de serpent modifiées (tableaux)
+        self.food_dirty = []
+        self.rebuilt = False  # Plateau complet reçu : tout redessiner
+
+    @property
+    def focus(self):
+        """Serpent suivi par la caméra : le sien, le premier pour un spectateur"""
+        return 0 if self.me == NO_SLOT else self.me
+
+    @property
+    def player_score(self):
+        return 0 if self.me == NO_SLOT else int(self.score[self.me])
+
+    def feed(self, buffer):
+        """Applique les messages complets de buffer (consommés), renvoie (ticks, plateaux complets)"""
+        ticks = fulls = 0
+        pos = 0
+        size = len(buffer)
+        while pos < size:
+            if buffer[pos] & FULL:
+                if size - pos < FULL_HEADER.size:
+                    break
+                _, _, _, _, snakes, _, cells, food = FULL_HEADER.unpack_from(buffer, pos)
+                end = pos + full_size(snakes, cells, food)
+                if end > size:
+                    break
+                self.apply_full(bytes(buffer[pos:end]))
+                fulls += 1
+            else:
+                if size - pos < TICK_HEADER.size:
+                    break
+                _, _, respawns, food = TICK_HEADER.unpack_from(buffer, pos)
+                end = pos + TICK_HEADER.size + self.num_snakes + 4 * (respawns + food)
+                if end > size or not self.num_snakes:
+                    break
+                self.apply_tick(bytes(buffer[pos:end]))
+                ticks += 1
+            pos = end
+        del buffer[:pos]
+        return ticks, fulls
+
+    def apply_full(self, data):
+        (_, width, height, self.ticks, snakes, self.me, cells,
+         food) = FULL_HEADER.unpack_from(data)
+        self.width, self.height, self.cells, self.num_snakes = width, height, width * height, snakes
+        self.ids = np.arange(snakes)
+        arrays = np.frombuffer(data, CELL, 3 * snakes, FULL_HEADER.size).astype(np.int64).reshape(3, snakes)
+        self.tails, self.heads, self.length = arrays[0].copy(), arrays[1].copy(), arrays[2].copy()
+        pos = FULL_HEADER.size + 12 * snakes
+        self.score = np.frombuffer(data, SCORE, snakes, pos).astype(np.int64)
+        pos += 4 * snakes
+        self.direction = np.frombuffer(data, np.uint8, snakes, pos).astype(np.int64)
+        pos += snakes
+        occupied = np.frombuffer(data, CELL, 3 * cells, pos).astype(np.int64).reshape(3, cells)
+        pos += 12 * cells
+        self.owner = np.full(self.cells, EMPTY, dtype=np.int32)
+        self.toward_head = np.zeros(self.cells, dtype=np.int32)
+        self.owner[occupied[0]] = occupied[1]
+        self.toward_head[occupied[0]] = occupied[2]
+        self.food = np.zeros(self.cells, dtype=np.bool_)
+        self.food[np.frombuffer(data, CELL, food, pos).astype(np.int64)] = True
+        self.food_count = food
+        self.dirty.clear()
+        self.food_dirty.clear()
+        self.rebuilt = True
+
+    def apply_tick(self, data):
+        """Rejoue les issues du tick dans le même ordre que SnakeArena.step"""
+        _, self.ticks, respawns, food = TICK_HEADER.unpack_from(data)
+        pos = TICK_HEADER.size
+        codes = np.frombuffer(data, np.uint8, self.num_snakes, pos)
+        pos += self.num_snakes
+        spawned = np.frombuffer(data, CELL, respawns, pos).astype(np.int64)
+        new_food = np.frombuffer(data, CELL, food, pos + 4 * respawns).astype(np.int64)
+
+        owner, toward_head, width = self.owner, self.toward_head, self.width
+        died = (codes & DIED) != 0
+        direction = (codes & 3).astype(np.int64)
+        movers = self.ids[~died]
+        eats = (codes[movers] & GREW) != 0
+        killed = self.ids[died]
+
+        # Queues libérées, puis corps des morts, puis les têtes avancent
+        followers = movers[~eats]
+        freed = self.tails[followers]
+        owner[freed] = EMPTY
+        bodies = self.remove_bodies(killed)
+        previous = self.heads[movers]
+        targets = previous + DY[direction[movers]] * width + DX[direction[movers]]
+        toward_head[previous] = targets
+        owner[targets] = movers
+        self.heads[movers] = targets
+        self.tails[followers] = toward_head[self.tails[followers]]
+
+        eaten = targets[eats]
+        self.food[eaten] = False
+        self.length[movers[eats]] += 1
+        self.score[movers[eats]] += FOOD_POINTS
+        self.score[killed] = 0
+
+        owner[spawned] = killed
+        self.heads[killed] = spawned
+        self.tails[killed] = spawned
+        self.length[killed] = 1
+        self.direction = direction
+        self.food[new_food] = True
+
+        if self.changes:
+            # Anciennes têtes comprises : leur couleur change
+            self.dirty += (freed, bodies, previous, targets, spawned)
+            self.food_dirty += (eaten, new_food)
+
+    def take_changes(self, left, top, cols, rows):
+        """Cases de serpent et de nourriture modifiées et visibles, depuis le dernier appel"""
+        found = []
+        for arrays in (self.dirty, self.food_dirty):
+            cells = np.unique(np.concatenate(arrays)) if arrays else np.empty(0, dtype=np.int64)
+            arrays.clear()
+            x, y = cells % self.width - left, cells // self.width - top
+            found.append(cells[(x >= 0) & (x < cols) & (y >= 0) & (y < rows)].tolist())
+        return found
+
+    def cells_in(self, grid, x0, x1, y0, y1):
+        """Cases occupées du rectangle [x0, x1[ x [y0, y1[ du monde dans grid (owner ou food)"""
+        if x0 >= x1 or y0 >= y1:
+            return []
+        if grid is self.owner:
+            block = self.owner.reshape(self.height, self.width)[y0:y1, x0:x1] != EMPTY
+        else:
+            block = self.food.reshape(self.height, self.width)[y0:y1, x0:x1]
+        ys, xs = np.nonzero(block)
+        return ((ys + y0) * self.width + xs + x0).tolist()
+
+    def same_as(self, arena):
+        """Le miroir égale-t-il le plateau du serveur ? (pour les tests)"""
+        body = arena.owner != EMPTY
+        body[arena.heads] = False  # toward_head n'a de sens que hors des têtes
+        return (self.ticks == arena.ticks and np.array_equal(self.owner, arena.owner) and
+                np.array_equal(self.toward_head[body], arena.toward_head[body]) and
+                np.array_equal(self.food, arena.food) and np.array_equal(self.heads, arena.heads) and
+                np.array_equal(self.tails, arena.tails) and np.array_equal(self.length, arena.length) and
+                np.array_equal(self.score, arena.score) and np.array_equal(self.direction, arena.direction))
+
+
+def parse_address(text):
+    """"hôte:port" ou "unix:chemin" -> (famille, adresse)"""
+    if text.startswith("unix:"):
+        return socket.AF_UNIX, text[5:]
+    host, _, port = text.rpartition(":")
+    return socket.AF_INET, (host or "127.0.0.1", int(port or PORT))
+
+
+class SnakeClient:
+    """Connexion sans asyncio pour la boucle Tk : socket non bloquante lue à chaque réveil"""
+
+    def __init__(self, address):
+        family, target = parse_address(address) if isinstance(address, str) else address
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+        self.sock.connect(target)
+        if family == socket.AF_INET:
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.arena = RemoteArena()
+        self.buffer = bytearray()
+        # Attendre le premier plateau complet pour connaître sa taille
+        while not self.arena.num_snakes:
+            data = self.sock.recv(65536)
+            if not data:
+                raise ConnectionError("Serveur fermé")
+            self.buffer += data
+            self.arena.feed(self.buffer)
+        self.sock.setblocking(False)
+
+    def send_direction(self, direction):
+        self.sock.send(bytes((DIRECTIONS.index(direction),)))
+
+    def poll(self):
+        """Lit tout ce qui est arrivé, renvoie (ticks, plateaux complets) appliqués"""
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except BlockingIOError:
+                break
+            if not data:
+                raise ConnectionError("Serveur fermé")
+            self.buffer += data
+        return self.arena.feed(self.buffer)
+
+    def close(self):
+        self.sock.close()
+
+
+class Player:
+    """Client connecté et le serpent qu'il dirige"""
+
+    __slots__ = ("slot", "writer", "stale", "sent")
+
+    def __init__(self, slot, writer):
+        self.slot = slot  # NO_SLOT : spectateur
+        self.writer = writer
+        self.stale = False  # Ticks sautés : renvoyer le plateau complet dès que possible
+        self.sent = 0  # Octets envoyés
+
+
+class SnakeServer:
+    """Serveur qui fait autorité : tous les joueurs sur un même plateau (SnakeArena)
+
+    Le plateau compte slots serpents. Un client prend un serpent libre à la
+    connexion (spectateur s'il n'en reste pas) ; tant qu'il n'a envoyé aucune
+    direction, et après son départ, le serpent est mené par SnakeArena.wander.
+    Les entrées sont prises au tick suivant. Chaque tick produit un seul
+    message, envoyé tel quel à tous : un octet par serpent, quel que soit le
+    nombre de clients.
+
+    Un client dont le tampon d'envoi dépasse max_buffer ne reçoit plus les
+    ticks ; il reçoit le plateau complet une fois le tampon vidé. Le débit et
+    la mémoire par client restent bornés même s'il ne lit plus.
+    """
+
+    def __init__(self, width=60, height=60, slots=32, tick_ms=TICK_MS, max_buffer=MAX_BUFFER, seed=None):
+        if slots >= NO_SLOT:
+            raise ValueError("trop de serpents pour des numéros sur 2 octets")
+        self.arena = SnakeArena(slots, width, height, seed=seed)
+        self.period = tick_ms / 1000
+        self.max_buffer = max_buffer
+        self.players = []
+        self.free = list(range(slots - 1, -1, -1))  # Serpents sans joueur, le plus petit en dernier
+        self.driven = np.zeros(slots, dtype=np.bool_)  # Serpents menés par leur joueur
+        self.wanted = np.zeros(slots, dtype=np.int64)  # Dernière direction demandée
+        self.ticks = 0
+        self.tick_started = 0.0  # perf_counter du début du dernier tick
+        self.tick_times = []  # Durée de chaque tick (s)
+        self.late_ticks = 0  # Ticks démarrés avec plus d'une période de retard
+        self.resyncs = 0
+        self.servers = []
+
+    async def handle(self, reader, writer):
+        player = Player(self.free.pop() if self.free else NO_SLOT, writer)
+        self.players.append(player)
+        self.send_full(player)
+        slot = player.slot
+        try:
+            while data := await reader.read(256):
+                for command in data:
+                    if command < len(DIRECTIONS) and slot != NO_SLOT:
+                        self.wanted[slot] = command
+                        self.driven[slot] = True
+        except ConnectionError:
+            pass
+        finally:
+            self.players.remove(player)
+            if slot != NO_SLOT:
+                self.driven[slot] = False  # Le serpent retourne au pilote scripté
+                self.free.append(slot)
+            writer.close()
+
+    def send_full(self, player):
+        data = encode_full(self.arena, player.slot)
+        player.writer.write(data)
+        player.sent += len(data)
+        player.stale = False
+
+    def send(self, player, data):
+        transport = player.writer.transport
+        if transport.is_closing():
+            return
+        if transport.get_write_buffer_size() > self.max_buffer:
+            player.stale = True
+        elif player.stale:
+            self.send_full(player)
+            self.resyncs += 1
+        else:
+            player.writer.write(data)
+            player.sent += len(data)
+
+    def tick(self):
+        """Avance tous les serpents ensemble et diffuse le même message à chacun"""
+        self.tick_started = start = time.perf_counter()
+        arena = self.arena
+        actions = np.where(self.driven, self.wanted, arena.wander())
+        rewards, dead = arena.step(actions)
+        data = encode_tick(arena, rewards, dead)
+        for player in self.players:
+            self.send(player, data)
+        self.ticks += 1
+        self.tick_times.append(time.perf_counter() - start)
+
+    async def run(self):
+        """Boucle à pas fixe, calée sur l'horloge et non sur la durée des ticks"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            self.tick()
+            deadline += self.period
+            delay = deadline - loop.time()
+            if delay < -self.period:
+                # Trop de retard : on repart de maintenant plutôt que d'enchaîner les ticks
+                self.late_ticks += 1
+                deadline = loop.time()
+            await asyncio.sleep(max(0.0, delay))
+
+    async def listen(self, address):
+        family, target = parse_address(address) if isinstance(address, str) else address
+        if family == socket.AF_UNIX:
+            server = await asyncio.start_unix_server(self.handle, target, backlog=BACKLOG)
+        else:
+            server = await asyncio.start_server(self.handle, *target, backlog=BACKLOG)
+        self.servers.append(server)
+        return server
+
+    def close(self):
+        for server in self.servers:
+            server.close()
+
+
+async def serve(address, **options):
+    server = SnakeServer(**options)
+    await server.listen(address)
+    arena = server.arena
+    print(f"Serveur Snake sur {address}, plateau {arena.width}x{arena.height}, "
+          f"{arena.num_snakes} serpents, tick {server.period * 1000:.0f} ms")
+    await server.run()
+
+
+def steer(arena, dice):
+    """Robot : tout droit, parfois un virage, en évitant les cases prises du miroir"""
+    me, width = arena.me, arena.width
+    head, direction = int(arena.heads[me]), int(arena.direction[me])
+    turn = dice.choice((1, 3))
+    preferred = (direction + turn) % 4 if dice.random() < 0.1 else direction
+    for option in (preferred, (preferred + 1) % 4, (preferred + 3) % 4):
+        x, y = head % width + DX[option], head // width + DY[option]
+        if 0 <= x < width and 0 <= y < arena.height and arena.owner[y * width + x] == EMPTY:
+            return option
+    return preferred
+
+
+async def bot_client(server, address, stop, lags, seed):
+    """Client robot : garde un miroir, joue dessus et mesure le délai de réception des ticks"""
+    family, target = address
+    if family == socket.AF_UNIX:
+        reader, writer = await asyncio.open_unix_connection(target)
+    else:
+        reader, writer = await asyncio.open_connection(*target)
+    arena = RemoteArena(changes=False)
+    buffer = bytearray()
+    dice = random.Random(seed)
+    received = 0
+    while True:
+        try:
+            data = await asyncio.wait_for(reader.read(65536), server.period)
+        except asyncio.TimeoutError:
+            if stop.is_set():
+                break  # Plus rien en route : le miroir doit égaler le serveur
+            continue
+        if not data:
+            break
+        received += len(data)
+        buffer += data
+        ticks, fulls = arena.feed(buffer)
+        if ticks:
+            lags.append(time.perf_counter() - server.tick_started)
+        if (ticks or fulls) and not stop.is_set() and arena.me != NO_SLOT:
+            writer.write(bytes((steer(arena, dice),)))
+    return arena, received, writer
+
+
+async def bench(clients, duration, address, slots=None):
+    from profiler import percentile
+
+    slots = slots or clients
+    side = int((slots * 100) ** 0.5)  # 100 cases par serpent, comme le bench de snake_arena
+    server = SnakeServer(side, side, slots, seed=0)
+    listener = await server.listen(address)
+    if address[0] != socket.AF_UNIX:
+        address = (address[0], listener.sockets[0].getsockname()[:2])
+    lags = []
+    stop = asyncio.Event()
+    bots = asyncio.gather(*(bot_client(server, address, stop, lags, seed) for seed in range(clients)))
+    ticking = asyncio.create_task(server.run())
+    await asyncio.sleep(duration)
+    ticking.cancel()
+    stop.set()
+    results = await bots
+    server.close()
+
+    # Tous les miroirs doivent égaler l'unique plateau du serveur
+    mismatches = sum(not arena.same_as(server.arena) for arena, _, _ in results)
+    for _, _, writer in results:
+        writer.close()
+    while server.players:
+        await asyncio.sleep(0.01)  # Laisser chaque connexion se fermer côté serveur
+
+    times = sorted(server.tick_times)
+    lags.sort()
+    received = sum(size for _, size, _ in results)
+    print(f"{clients} clients sur un plateau {side}x{side} de {slots} serpents, {server.ticks} ticks de "
+          f"{server.period * 1000:.0f} ms : tick p50 {percentile(times, 0.5) * 1000:.2f} ms, "
+          f"p99 {percentile(times, 0.99) * 1000:.2f} ms, max {times[-1] * 1000:.2f} ms, "
+          f"{server.late_ticks} en retard")
+    print(f"réception après le début du tick : p50 {percentile(lags, 0.5) * 1000:.1f} ms, "
+          f"p99 {percentile(lags, 0.99) * 1000:.1f} ms")
+    print(f"{received / clients / duration:.1f} octets/s par client, {server.resyncs} resynchronisations, "
+          f"{mismatches} miroirs désynchronisés sur {clients}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serveur Snake multijoueur sur un plateau partagé (ticks binaires)")
+    parser.add_argument("command", choices=("serve", "bench"))
+    parser.add_argument("--address", default=f"127.0.0.1:{PORT}",
+                        help="hôte:port ou unix:chemin (bench : port 0 = libre)")
+    parser.add_argument("--tick", type=int, default=TICK_MS, help="ms entre deux ticks")
+    parser.add_argument("--board", default="60x60", help="taille du plateau partagé (serve)")
+    parser.add_argument("--slots", type=int, default=None,
+                        help="serpents sur le plateau (serve : 32, bench : un par client)")
+    parser.add_argument("--clients", type=int, default=300, help="clients robots (bench)")
+    parser.add_argument("--seconds", type=float, default=10, help="durée du bench")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        width, _, height = args.board.partition("x")
+        asyncio.run(serve(args.address, width=int(width), height=int(height or width),
+                          slots=args.slots or 32, tick_ms=args.tick))
+    else:
+        family, target = parse_address(args.address)
+        if family == socket.AF_INET and args.address == f"127.0.0.1:{PORT}":
+            target = ("127.0.0.1", 0)
+        asyncio.run(bench(args.clients, args.seconds, (family, target), args.slots))
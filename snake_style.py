@@ -0,0 +1,33 @@
+from snake_engine import UP, DOWN, LEFT, RIGHT
+
+# Apparence du Snake, partagée par la fenêtre Tk (snake.py) et le rendu hors
+# écran (framebuffer.py) : ce module ne dépend pas de tkinter
+
+# Tailles
+WINDOW_WIDTH = 600
+WINDOW_HEIGHT = 600
+GRID_SIZE = 20
+GRID_WIDTH = WINDOW_WIDTH // GRID_SIZE  # Cases visibles
+GRID_HEIGHT = WINDOW_HEIGHT // GRID_SIZE
+
+# Couleurs
+BG_COLOR = "#1a1a2e"
+BG_COLOR_ALT = "#16213e"
+SNAKE_HEAD = "#0f3460"
+SNAKE_BODY = "#16a085"
+FOOD_COLOR = "#e94560"
+TEXT_COLOR = "#eee"
+ACCENT_COLOR = "#f39c12"
+FOOD_SHINE = "#ff6b81"
+EYE_COLOR = "#fff"
+OTHER_HEAD = "#8e44ad"  # Serpents des autres joueurs (plateau partagé)
+OTHER_BODY = "#5b2c6f"
+
+# Position des yeux dans la case de la tête selon la direction
+EYE_OFFSETS = {
+    RIGHT: ((14, 7), (14, 13)),
+    LEFT: ((6, 7), (6, 13)),
+    UP: ((7, 6), (13, 6)),
+    DOWN: ((7, 14), (13, 14)),
+}
+EYE_SIZE = 3
@@ -0,0 +1,75 @@
+import heapq
+
+# Au-delà de ce nombre d'entrées périmées, le tas est reconstruit
+COMPACT_THRESHOLD = 64
+
+
+class Timeline:
+    """File d'événements datés sur un tas binaire, O(log n) par événement
+
+    Une clé ne peut avoir qu'un événement en attente : reprogrammer la même clé
+    remplace l'ancien. Les événements de clé None ne se remplacent jamais.
+    """
+
+    def __init__(self):
+        self.heap = []  # (date, ordre, clé, callback)
+        self.generations = {}  # Clé -> ordre de l'événement en attente
+        self.order = 0  # Entier simple : une Timeline se copie avec copy.deepcopy
+        self.stale = 0  # Entrées remplacées ou annulées restées dans le tas
+
+    def __len__(self):
+        return len(self.heap) - self.stale
+
+    def clear(self):
+        self.heap.clear()
+        self.generations.clear()
+        self.stale = 0
+
+    def schedule(self, at, key, callback):
+        """Programme callback() à la date at (remplace l'événement de même clé)"""
+        order = self.order
+        self.order += 1
+        if key is not None:
+            if key in self.generations:
+                self.stale += 1
+            self.generations[key] = order
+        heapq.heappush(self.heap, (at, order, key, callback))
+        if self.stale > COMPACT_THRESHOLD and self.stale * 2 > len(self.heap):
+            self.compact()
+
+    def cancel(self, key):
+        """Annule l'événement en attente pour cette clé"""
+        if self.generations.pop(key, None) is not None:
+            self.stale += 1
+
+    def pending(self, key):
+        return key in self.generations
+
+    def next_time(self):
+        """Date du prochain événement valide, None si la file est vide"""
+        while self.heap and self.is_stale(self.heap[0]):
+            heapq.heappop(self.heap)
+            self.stale -= 1
+        return self.heap[0][0] if self.heap else None
+
+    def advance(self, now):
+        """Déclenche dans l'ordre tous les événements dont la date est passée"""
+        heap = self.heap
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if self.is_stale(entry):
+                self.stale -= 1
+                continue
+            if entry[2] is not None:
+                del self.generations[entry[2]]
+            entry[3]()
+
+    def is_stale(self, entry):
+        key = entry[2]
+        return key is not None and self.generations.get(key) != entry[1]
+
+    def compact(self):
+        """Retire les entrées périmées en O(n)"""
+        self.heap[:] = [entry for entry in self.heap if not self.is_stale(entry)]
+        heapq.heapify(self.heap)
+        self.stale = 0
@@ -0,0 +1,191 @@
+import argparse
+import json
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from autopilot import PILOTS
+from frites_sim import FritesSim, KEYBOARD_SPEED, CATCH_MARGIN
+from profiler import percentile
+from snake_engine import SnakeEngine
+
+SNAKE_PILOTS = {pilot.name.lower().replace("*", "star"): pilot for pilot in PILOTS}
+FRITES_FRAMES = 20_000  # 10 minutes de jeu à 30 ms la frame
+
+
+def frites_mouse(sim):
+    """Souris sur la plus basse des frites encore attrapables"""
+    limit = sim.paquet.get_catch_rect()[3] + CATCH_MARGIN
+    lowest = max((f for f in sim.frites if f.y <= limit), key=lambda f: f.y, default=None)
+    if lowest is not None:
+        sim.paquet.move_to(round(lowest.x))
+    return False, False
+
+
+def frites_keyboard(sim):
+    """Flèches vers la plus basse des frites encore attrapables"""
+    limit = sim.paquet.get_catch_rect()[3] + CATCH_MARGIN
+    lowest = max((f for f in sim.frites if f.y <= limit), key=lambda f: f.y, default=None)
+    if lowest is None or abs(lowest.x - sim.paquet.x) < KEYBOARD_SPEED:
+        return False, False
+    return lowest.x < sim.paquet.x, lowest.x > sim.paquet.x
+
+
+FRITES_PILOTS = {"souris": frites_mouse, "clavier": frites_keyboard}
+
+# Objets lourds (grilles des pilotes) gardés d'un paquet à l'autre, propres à chaque processus
+_workers = {}
+
+
+def play_snake(pilot_name, board, seed):
+    """Partie pilotée jusqu'à la fin (ou tant que le serpent ne mange plus), renvoie le résultat"""
+    width, height = board
+    key = ("snake", pilot_name, board)
+    if key not in _workers:
+        _workers[key] = (SNAKE_PILOTS[pilot_name](width, height), SnakeEngine(width, height))
+    pilot, engine = _workers[key]
+    engine.reset(seed)
+    hungry = 0
+    while not engine.game_over and hungry < 2 * width * height:
+        _, reward, _ = engine.step(pilot.choose(engine))
+        hungry = 0 if reward else hungry + 1
+    return engine.score, engine.ticks, engine.won
+
+
+def play_frites(pilot_name, spawn_rate, seed, frames=FRITES_FRAMES):
+    """Partie pilotée avec une cadence d'apparition de départ donnée"""
+    if "frites" not in _workers:
+        _workers["frites"] = FritesSim()
+    sim, pilot = _workers["frites"], FRITES_PILOTS[pilot_name]
+    sim.reset(seed, spawn_rate)
+    while not sim.game_over and sim.frame_count < frames:
+        sim.step(*pilot(sim))
+    return sim.score, sim.frame_count, not sim.game_over
+
+
+def run_chunk(job):
+    """Exécuté dans un processus : joue un paquet de graines, aucun état partagé"""
+    game, pilot_name, config, seeds = job
+    start = time.perf_counter()
+    if game == "snake":
+        results = [play_snake(pilot_name, config, seed) for seed in seeds]
+    else:
+        results = [play_frites(pilot_name, config, seed) for seed in seeds]
+    return job, results, time.perf_counter() - start, os.getpid()
+
+
+def fits(game, pilot, config):
+    """Le pilote sait-il jouer avec ce réglage ? (Hamilton n'a pas de cycle sur côtés impairs)"""
+    return game != "snake" or SNAKE_PILOTS[pilot].fits(*config)
+
+
+def make_jobs(game, pilots, configs, seeds, chunk):
+    """(jeu, pilote, réglage, graines) par paquets de chunk graines, réglages non pris en charge écartés"""
+    return [(game, pilot, config, tuple(range(first, min(first + chunk, seeds))))
+            for pilot in pilots for config in configs if fits(game, pilot, config)
+            for first in range(0, seeds, chunk)]
+
+
+def run(jobs, workers=None, progress=True):
+    """Répartit les paquets sur les processus et agrège les résultats à leur arrivée"""
+    entries = defaultdict(lambda: {"scores": [], "ticks": 0, "wins": 0, "seconds": 0.0})
+    per_worker = defaultdict(lambda: [0, 0.0])  # pid -> [ticks, secondes]
+    done = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_chunk, job) for job in jobs]
+        for future in as_completed(futures):
+            (game, pilot, config, _), results, seconds, pid = future.result()
+            entry = entries[(game, pilot, config)]
+            for score, ticks, won in results:
+                entry["scores"].append(score)
+                entry["ticks"] += ticks
+                entry["wins"] += won
+            entry["seconds"] += seconds
+            per_worker[pid][0] += sum(ticks for _, ticks, _ in results)
+            per_worker[pid][1] += seconds
+            done += 1
+            if progress:
+                print(f"\r{done}/{len(jobs)} paquets", end="", flush=True)
+    if progress:
+        print()
+    return entries, per_worker, time.perf_counter() - start
+
+
+def report(entries, per_worker, wall):
+    """Tableau des scores (moyenne, percentiles) et du débit par processus"""
+    rows = []
+    for (game, pilot, config), entry in sorted(entries.items(), key=lambda item: str(item[0])):
+        scores = sorted(entry["scores"])
+        rows.append({
+            "game": game,
+            "pilot": pilot,
+            "config": board_name(config),
+            "games": len(scores),
+            "mean": sum(scores) / len(scores),
+            "p10": percentile(scores, 0.1),
+            "p50": percentile(scores, 0.5),
+            "p90": percentile(scores, 0.9),
+            "p99": percentile(scores, 0.99),
+            "wins": entry["wins"] / len(scores),
+            "ticks_per_s": entry["ticks"] / entry["seconds"],
+        })
+    workers = {pid: ticks / seconds for pid, (ticks, seconds) in per_worker.items()}
+    total_ticks = sum(ticks for ticks, _ in per_worker.values())
+
+    print(f"{'jeu':<7}{'pilote':<10}{'réglage':>8}{'parties':>9}{'moyenne':>10}"
+          f"{'p10':>8}{'p50':>8}{'p90':>8}{'p99':>8}{'succès':>8}{'ticks/s':>10}")
+    for row in rows:
+        print(f"{row['game']:<7}{row['pilot']:<10}{row['config']:>8}{row['games']:>9}"
+              f"{row['mean']:>10.1f}{row['p10']:>8}{row['p50']:>8}{row['p90']:>8}{row['p99']:>8}"
+              f"{row['wins']:>8.1%}{row['ticks_per_s']:>10,.0f}")
+    for pid, rate in sorted(workers.items()):
+        print(f"processus {pid} : {rate:,.0f} ticks/s")
+    print(f"{len(workers)} processus, {total_ticks:,} ticks en {wall:.1f} s "
+          f"({total_ticks / wall:,.0f} ticks/s au total)")
+    return {"rows": rows, "workers": workers, "wall_s": wall, "ticks": total_ticks}
+
+
+def board_name(config):
+    return "x".join(map(str, config)) if isinstance(config, tuple) else str(config)
+
+
+def board(text):
+    width, _, height = text.partition("x")
+    return int(width), int(height or width)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tournoi de pilotes automatiques sans affichage")
+    parser.add_argument("game", choices=("snake", "frites"))
+    parser.add_argument("--pilots", nargs="+", help="pilotes à comparer (défaut : tous)")
+    parser.add_argument("--boards", nargs="+", type=board, default=[(10, 10)],
+                        help="plateaux du Snake, ex. 10x10 12x8")
+    parser.add_argument("--rates", nargs="+", type=int, default=[40],
+                        help="frames entre deux frites au départ (frites)")
+    parser.add_argument("--seeds", type=int, default=200, help="graines 0..N-1 par pilote et réglage")
+    parser.add_argument("--chunk", type=int, default=10, help="graines par paquet envoyé à un processus")
+    parser.add_argument("--workers", type=int, default=None, help="processus (défaut : un par cœur)")
+    parser.add_argument("--json", help="écrit aussi le rapport dans ce fichier")
+    args = parser.parse_args()
+
+    available = SNAKE_PILOTS if args.game == "snake" else FRITES_PILOTS
+    pilots = args.pilots or list(available)
+    unknown = [pilot for pilot in pilots if pilot not in available]
+    if unknown:
+        parser.error(f"pilotes inconnus {unknown}, choix : {list(available)}")
+    configs = args.boards if args.game == "snake" else args.rates
+    # Pilote nommé sur un plateau qu'il ne sait pas jouer : refusé ; parmi tous les pilotes : écarté
+    unfit = [f"{pilot} sur {board_name(config)}" for pilot in pilots for config in configs
+             if not fits(args.game, pilot, config)]
+    if unfit and args.pilots:
+        parser.error(f"réglages non pris en charge : {', '.join(unfit)}")
+    for pair in unfit:
+        print(f"écarté : {pair} (plateau non pris en charge)")
+
+    jobs = make_jobs(args.game, pilots, configs, args.seeds, args.chunk)
+    summary = report(*run(jobs, args.workers))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=1)